@@ -10,7 +10,7 @@ from typing import Optional, List, Dict
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -20,9 +20,11 @@ from vista.config import Config
 from vista.document_loader import DocumentLoader
 from vista.text_chunker import TextChunker
 from vista.embedding_generator import EmbeddingGenerator
-from vista.vector_store import VectorStoreManager
+from vista.embedding_cache import EmbeddingCache
+from vista.vector_store_factory import build_vector_store
 from vista.llm_factory import LLMFactory
 from vista.query_engine import QueryEngine
+from vista.ingestion import ingest_documents
 from vista.security import SecurityManager
 from vista.health_check import HealthChecker
 from vista.structured_logging import StructuredLogger, setup_structured_logging, set_request_id, get_request_id
@@ -71,13 +73,11 @@ def initialize_vista() -> QueryEngine:
             chunk_size=config.chunk_size,
             overlap=config.chunk_overlap
         )
-        embedding_generator = EmbeddingGenerator(model_name=config.embedding_model)
-        vector_store = VectorStoreManager(
-            api_key=config.pinecone_api_key,
-            environment=config.pinecone_environment,
-            index_name=config.pinecone_index_name,
-            namespace=config.pinecone_namespace
+        embedding_generator = EmbeddingGenerator(
+            model_name=config.embedding_model,
+            backend=config.embedding_backend
         )
+        vector_store = build_vector_store(config, embedding_generator.dimension)
         vector_store.create_collection()
         
         # Initialize LLM client
@@ -111,30 +111,27 @@ def initialize_vista() -> QueryEngine:
             
         documents = document_loader.load_documents(config.data_directory)
         
-        if not documents:
-            raise Exception(f"No documents found in {config.data_directory}")
-        
-        logger.info(f"Loaded {len(documents)} documents")
+        # Chunk, embed and store documents in windows as they are loaded
+        document_count, chunk_count = ingest_documents(
+            documents,
+            text_chunker,
+            embedding_generator,
+            vector_store,
+            batch_size=config.pinecone_batch_size,
+            chunk_workers=config.chunk_workers,
+            embedding_cache=(
+                EmbeddingCache(config.embedding_cache_path, config.embedding_model)
+                if config.embedding_cache_path else None
+            )
+        )
         
-        # Chunk documents
-        all_chunks = []
-        for document in documents:
-            chunks = text_chunker.chunk_document(document)
-            all_chunks.extend(chunks)
+        if document_count == 0:
+            raise Exception(f"No documents found in {config.data_directory}")
         
-        if not all_chunks:
+        if chunk_count == 0:
             raise Exception("No chunks generated from documents")
         
-        logger.info(f"Generated {len(all_chunks)} chunks")
-        
-        # Generate embeddings
-        chunk_texts = [chunk.text for chunk in all_chunks]
-        embeddings = embedding_generator.generate_batch_embeddings(chunk_texts)
-        
-        # Store in vector database
-        vector_store.add_chunks(all_chunks, embeddings)
-        
-        logger.info(f"Knowledge base ready with {len(all_chunks)} chunks from {len(documents)} documents")
+        logger.info(f"Knowledge base ready with {chunk_count} chunks from {document_count} documents")
         
         return engine
         
@@ -410,8 +407,32 @@ async def chat(request: ChatRequest):
 async def health():
     return {"status": "healthy"}
 
+def _if_none_match(header: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an entity tag.
+    
+    Uses the weak comparison If-None-Match requires: W/ prefixes are
+    ignored, the header may list several tags, and * matches any tag.
+    
+    Args:
+        header: Value of the If-None-Match request header, if any
+        etag: Entity tag of the current response
+        
+    Returns:
+        True if the client's cached response is still current
+    """
+    if not header:
+        return False
+    
+    opaque_tag = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
 @app.get("/ready")
-async def readiness_check():
+async def readiness_check(request: Request):
     """Detailed health check endpoint."""
     global health_checker
     
@@ -426,9 +447,16 @@ async def readiness_check():
     # Return appropriate HTTP status code based on health
     status_code = 200 if health_status.status == "healthy" else (503 if health_status.status == "unhealthy" else 200)
     
+    # Force revalidation, and answer unchanged health with an empty 304. The
+    # tag is weak, since timestamps and timings are left out of it
+    headers = {"Cache-Control": "no-cache", "ETag": f'W/"{health_status.etag}"'}
+    if status_code == 200 and _if_none_match(request.headers.get("If-None-Match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
     return JSONResponse(
         status_code=status_code,
-        content=health_status.to_dict()
+        content=health_status.to_dict(),
+        headers=headers
     )
 
 
@@ -4,17 +4,17 @@
 import logging
 import sys
 from pathlib import Path
-from typing import List
 
 from vista.config import Config
 from vista.document_loader import DocumentLoader
 from vista.text_chunker import TextChunker
 from vista.embedding_generator import EmbeddingGenerator
-from vista.vector_store import VectorStoreManager
+from vista.embedding_cache import EmbeddingCache
+from vista.vector_store_factory import build_vector_store
 from vista.llm_factory import LLMFactory
 from vista.query_engine import QueryEngine
 from vista.cli import CLI
-from vista.models import Document, Chunk
+from vista.ingestion import ingest_documents
 
 
 def setup_logging() -> None:
@@ -60,15 +60,13 @@ def initialize_system(config: Config) -> QueryEngine:
         )
         
         # Initialize embedding generator
-        embedding_generator = EmbeddingGenerator(model_name=config.embedding_model)
+        embedding_generator = EmbeddingGenerator(
+            model_name=config.embedding_model,
+            backend=config.embedding_backend
+        )
         
         # Initialize vector store
-        vector_store = VectorStoreManager(
-            api_key=config.pinecone_api_key,
-            environment=config.pinecone_environment,
-            index_name=config.pinecone_index_name,
-            namespace=config.pinecone_namespace
-        )
+        vector_store = build_vector_store(config, embedding_generator.dimension)
         vector_store.create_collection()
         
         # Initialize LLM client using factory
@@ -100,37 +98,29 @@ def initialize_system(config: Config) -> QueryEngine:
         logger.info(f"Loading documents from {config.data_directory}...")
         documents = document_loader.load_documents(config.data_directory)
         
-        if not documents:
-            raise Exception(f"No documents found in {config.data_directory}. Please check the data directory.")
-        
-        logger.info(f"Loaded {len(documents)} documents")
-        
-        # Step 4: Chunk documents
-        logger.info("Chunking documents...")
-        all_chunks: List[Chunk] = []
+        # Step 4: Chunk, embed and store documents in windows as they are loaded
+        logger.info("Chunking, embedding and storing documents...")
+        document_count, chunk_count = ingest_documents(
+            documents,
+            text_chunker,
+            embedding_generator,
+            vector_store,
+            batch_size=config.pinecone_batch_size,
+            chunk_workers=config.chunk_workers,
+            embedding_cache=(
+                EmbeddingCache(config.embedding_cache_path, config.embedding_model)
+                if config.embedding_cache_path else None
+            )
+        )
         
-        for document in documents:
-            chunks = text_chunker.chunk_document(document)
-            all_chunks.extend(chunks)
+        if document_count == 0:
+            raise Exception(f"No documents found in {config.data_directory}. Please check the data directory.")
         
-        if not all_chunks:
+        if chunk_count == 0:
             raise Exception("No chunks generated from documents")
         
-        logger.info(f"Generated {len(all_chunks)} chunks")
-        
-        # Step 5: Generate embeddings
-        logger.info("Generating embeddings...")
-        chunk_texts = [chunk.text for chunk in all_chunks]
-        embeddings = embedding_generator.generate_batch_embeddings(chunk_texts)
-        
-        logger.info(f"Generated {len(embeddings)} embeddings")
-        
-        # Step 6: Store in vector database
-        logger.info("Storing chunks and embeddings in vector database...")
-        vector_store.add_chunks(all_chunks, embeddings)
-        
         logger.info("Knowledge base built successfully")
-        logger.info(f"System ready with {len(all_chunks)} chunks from {len(documents)} documents")
+        logger.info(f"System ready with {chunk_count} chunks from {document_count} documents")
         
         return query_engine
         
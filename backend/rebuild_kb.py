@@ -9,7 +9,9 @@ from vista.config import Config
 from vista.document_loader import DocumentLoader
 from vista.text_chunker import TextChunker
 from vista.embedding_generator import EmbeddingGenerator
-from vista.vector_store import VectorStoreManager
+from vista.embedding_cache import EmbeddingCache
+from vista.vector_store_factory import build_vector_store
+from vista.ingestion import ingest_documents
 
 
 def setup_logging() -> None:
@@ -43,55 +45,47 @@ def rebuild_knowledge_base() -> None:
             chunk_size=config.chunk_size,
             overlap=config.chunk_overlap
         )
-        embedding_generator = EmbeddingGenerator(model_name=config.embedding_model)
-        vector_store = VectorStoreManager(
-            api_key=config.pinecone_api_key,
-            environment=config.pinecone_environment,
-            index_name=config.pinecone_index_name,
-            namespace=config.pinecone_namespace
+        embedding_generator = EmbeddingGenerator(
+            model_name=config.embedding_model,
+            backend=config.embedding_backend
         )
+        vector_store = build_vector_store(config, embedding_generator.dimension)
         
         # Create collection (or get existing index)
         vector_store.create_collection()
         
-        # Reset collection to clear old data
+        # Recreate the index to clear old data, so a changed embedding model's
+        # dimension or metric is picked up instead of reusing the old index
         logger.info("Clearing existing knowledge base...")
-        vector_store.reset_collection()
+        vector_store.reset_collection(hard=True)
         
         # Load documents
         logger.info(f"Loading documents from {config.data_directory}...")
         documents = document_loader.load_documents(config.data_directory)
         
-        if not documents:
-            raise Exception(f"No documents found in {config.data_directory}")
-        
-        logger.info(f"Loaded {len(documents)} documents")
+        # Chunk, embed and store documents in windows as they are loaded
+        logger.info("Chunking, embedding and storing documents...")
+        document_count, chunk_count = ingest_documents(
+            documents,
+            text_chunker,
+            embedding_generator,
+            vector_store,
+            batch_size=config.pinecone_batch_size,
+            chunk_workers=config.chunk_workers,
+            embedding_cache=(
+                EmbeddingCache(config.embedding_cache_path, config.embedding_model)
+                if config.embedding_cache_path else None
+            )
+        )
         
-        # Chunk documents
-        logger.info("Chunking documents...")
-        all_chunks = []
-        for document in documents:
-            chunks = text_chunker.chunk_document(document)
-            all_chunks.extend(chunks)
+        if document_count == 0:
+            raise Exception(f"No documents found in {config.data_directory}")
         
-        if not all_chunks:
+        if chunk_count == 0:
             raise Exception("No chunks generated from documents")
         
-        logger.info(f"Generated {len(all_chunks)} chunks")
-        
-        # Generate embeddings
-        logger.info("Generating embeddings...")
-        chunk_texts = [chunk.text for chunk in all_chunks]
-        embeddings = embedding_generator.generate_batch_embeddings(chunk_texts)
-        
-        logger.info(f"Generated {len(embeddings)} embeddings")
-        
-        # Store in vector database
-        logger.info("Storing chunks and embeddings...")
-        vector_store.add_chunks(all_chunks, embeddings)
-        
         logger.info("Knowledge base rebuild completed successfully!")
-        logger.info(f"Total chunks: {len(all_chunks)} from {len(documents)} documents")
+        logger.info(f"Total chunks: {chunk_count} from {document_count} documents")
         
     except Exception as e:
         logger.error(f"Knowledge base rebuild failed: {e}")
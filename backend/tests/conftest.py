@@ -18,3 +18,19 @@ def test_persist_dir(tmp_path):
     persist_dir = tmp_path / "chroma_db"
     persist_dir.mkdir()
     return persist_dir
+
+
+@pytest.fixture(scope="session")
+def structured_logging():
+    """Install structured logging once for all tests that need it."""
+    from vista.structured_logging import setup_structured_logging
+    setup_structured_logging("info")
+
+
+@pytest.fixture
+def env_builder(monkeypatch):
+    """Return a function that sets several environment variables for one test."""
+    def set_env(values):
+        for name, value in values.items():
+            monkeypatch.setenv(name, value)
+    return set_env
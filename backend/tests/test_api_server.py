@@ -0,0 +1,74 @@
+"""Tests for the FastAPI server endpoints."""
+
+import pytest
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+import api_server
+from vista.health_check import HealthCheckResponse
+
+
+def make_health_response(status: str = "healthy", etag: str = "abc123") -> HealthCheckResponse:
+    """Create a health check response with a fixed entity tag."""
+    return HealthCheckResponse(
+        status=status,
+        timestamp="2024-01-01T00:00:00",
+        components={"database": {"status": status}},
+        uptime_seconds=1.0,
+        etag=etag
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a test client with a stub health checker and no startup.
+
+    The lifespan is not run, so no models or vector stores are loaded.
+    """
+    checker = Mock()
+    checker.check_health.return_value = make_health_response()
+    monkeypatch.setattr(api_server, "health_checker", checker)
+    return TestClient(api_server.app)
+
+
+class TestReadinessEndpoint:
+    """Test cases for the /ready endpoint."""
+
+    def test_ready_returns_weak_etag(self, client):
+        """Test that the health body is sent with a weak entity tag."""
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == 'W/"abc123"'
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.json()["status"] == "healthy"
+
+    @pytest.mark.parametrize("if_none_match", [
+        'W/"abc123"',
+        '"abc123"',
+        '"other", W/"abc123"',
+        "*",
+    ])
+    def test_ready_not_modified(self, client, if_none_match):
+        """Test that a matching If-None-Match gets an empty 304."""
+        response = client.get("/ready", headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == 'W/"abc123"'
+
+    def test_ready_changed_etag_returns_body(self, client):
+        """Test that a stale entity tag gets the full response."""
+        response = client.get("/ready", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["etag"] == "abc123"
+
+    def test_ready_unhealthy_is_never_not_modified(self, client):
+        """Test that an unhealthy status is always sent in full."""
+        api_server.health_checker.check_health.return_value = make_health_response("unhealthy")
+
+        response = client.get("/ready", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "unhealthy"
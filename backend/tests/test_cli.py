@@ -22,6 +22,14 @@ class TestCLI:
         assert self.cli.running is True
         assert self.cli.last_response is None
     
+    def test_run_prewarms_query_engine(self):
+        """Test that run() warms the query engine in the background."""
+        with patch('builtins.input', side_effect=EOFError):
+            self.cli.run()
+        
+        self.cli._executor.shutdown(wait=True)
+        self.mock_query_engine.warmup.assert_called_once()
+    
     def test_parse_exit_command(self):
         """Test parsing exit command."""
         self.cli._parse_and_execute_command("exit")
@@ -42,8 +50,7 @@ class TestCLI:
         )
         self.mock_query_engine.query.return_value = mock_response
         
-        with patch('builtins.print') as mock_print:
-            self.cli._parse_and_execute_command("ask test question")
+        self.cli._parse_and_execute_command("ask test question")
         
         # Verify query engine was called
         self.mock_query_engine.query.assert_called_once_with("test question")
@@ -61,20 +68,36 @@ class TestCLI:
         )
         self.mock_query_engine.query.return_value = mock_response
         
-        with patch('builtins.print') as mock_print:
-            self.cli._parse_and_execute_command("what is my name")
+        self.cli._parse_and_execute_command("what is my name")
         
         # Verify query engine was called
         self.mock_query_engine.query.assert_called_once_with("what is my name")
     
-    def test_handle_sources_no_previous_response(self):
+    def test_parse_command_case_insensitive(self):
+        """Test that commands match regardless of case."""
+        self.cli._parse_and_execute_command("EXIT")
+        assert self.cli.running is False
+    
+    def test_parse_command_word_in_question(self):
+        """Test that a question starting with a command word is still asked."""
+        self.mock_query_engine.query.return_value = QueryResponse(
+            answer="Test answer",
+            sources=[],
+            query="help me find my projects"
+        )
+        
+        self.cli._parse_and_execute_command("help me find my projects")
+        
+        self.mock_query_engine.query.assert_called_once_with("help me find my projects")
+        assert self.cli.running is True
+    
+    def test_handle_sources_no_previous_response(self, capsys):
         """Test sources command with no previous response."""
-        with patch('builtins.print') as mock_print:
-            self.cli._handle_sources()
+        self.cli._handle_sources()
         
-        mock_print.assert_called_with("No previous response available. Ask a question first.")
+        assert capsys.readouterr().out.endswith("No previous response available. Ask a question first.\n")
     
-    def test_handle_sources_with_response(self):
+    def test_handle_sources_with_response(self, capsys):
         """Test sources command with previous response."""
         # Setup previous response with sources
         sources = [
@@ -90,13 +113,12 @@ class TestCLI:
             query="test query"
         )
         
-        with patch('builtins.print') as mock_print:
-            self.cli._handle_sources()
+        self.cli._handle_sources()
         
         # Should display sources
-        mock_print.assert_called()
+        assert capsys.readouterr().out
     
-    def test_display_response_with_sources(self):
+    def test_display_response_with_sources(self, capsys):
         """Test displaying response with sources."""
         sources = [
             RetrievedChunk(
@@ -111,13 +133,12 @@ class TestCLI:
             query="test query"
         )
         
-        with patch('builtins.print') as mock_print:
-            self.cli._display_response(response)
+        self.cli._display_response(response)
         
         # Should print answer and source information
-        mock_print.assert_called()
+        assert "Test answer about experience" in capsys.readouterr().out
     
-    def test_display_response_no_sources(self):
+    def test_display_response_no_sources(self, capsys):
         """Test displaying response without sources."""
         response = QueryResponse(
             answer="Test answer",
@@ -125,13 +146,12 @@ class TestCLI:
             query="test query"
         )
         
-        with patch('builtins.print') as mock_print:
-            self.cli._display_response(response)
+        self.cli._display_response(response)
         
         # Should print answer and no sources message
-        mock_print.assert_called()
+        assert capsys.readouterr().out
     
-    def test_display_sources(self):
+    def test_display_sources(self, capsys):
         """Test displaying detailed source information."""
         sources = [
             RetrievedChunk(
@@ -146,24 +166,21 @@ class TestCLI:
             )
         ]
         
-        with patch('builtins.print') as mock_print:
-            self.cli._display_sources(sources)
+        self.cli._display_sources(sources)
         
         # Should print detailed source information
-        mock_print.assert_called()
+        assert capsys.readouterr().out
     
-    def test_handle_help(self):
+    def test_handle_help(self, capsys):
         """Test help command."""
-        with patch('builtins.print') as mock_print:
-            self.cli._handle_help()
+        self.cli._handle_help()
         
         # Should print help information
-        mock_print.assert_called()
+        assert capsys.readouterr().out
     
-    def test_handle_rebuild(self):
+    def test_handle_rebuild(self, capsys):
         """Test rebuild command."""
-        with patch('builtins.print') as mock_print:
-            self.cli._handle_rebuild()
+        self.cli._handle_rebuild()
         
         # Should print rebuild information
-        mock_print.assert_called()
\ No newline at end of file
+        assert capsys.readouterr().out
\ No newline at end of file
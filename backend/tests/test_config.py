@@ -36,6 +36,31 @@ def test_config_validation_missing_api_key():
     assert "OPENAI_API_KEY is required" in str(exc_info.value)
 
 
+def test_config_validation_faiss_backend_without_pinecone():
+    """Test that Pinecone credentials are not required for the FAISS backend."""
+    config = Config(
+        llm_provider="openai",
+        llm_model="gpt-4o-mini",
+        openai_api_key="sk-test_key_1234567890",
+        vector_store_backend="faiss"
+    )
+    config.validate()
+
+
+def test_config_validation_invalid_vector_store_backend():
+    """Test that validation fails for an unknown vector store backend."""
+    with pytest.raises(ValueError) as exc_info:
+        config = Config(
+            llm_provider="openai",
+            llm_model="gpt-4o-mini",
+            openai_api_key="sk-test_key_1234567890",
+            vector_store_backend="chroma"
+        )
+        config.validate()
+    
+    assert "VECTOR_STORE_BACKEND must be" in str(exc_info.value)
+
+
 def test_config_validation_invalid_chunk_size():
     """Test that validation fails for invalid chunk size."""
     with pytest.raises(ValueError) as exc_info:
@@ -98,3 +123,4 @@ def test_config_from_env_with_defaults(monkeypatch):
     assert config.openai_api_key == "sk-test_api_key_1234567890"
     assert config.chunk_size == 500  # default
     assert config.chunk_overlap == 50  # default
+    assert config.chunk_workers == 1  # default
@@ -0,0 +1,81 @@
+"""Tests for document loading functionality."""
+
+import types
+
+from vista.document_loader import DocumentLoader
+
+
+def test_load_documents_is_streamed(test_data_dir):
+    """Test that documents are yielded lazily."""
+    (test_data_dir / "notes.txt").write_text("Hello", encoding="utf-8")
+
+    documents = DocumentLoader().load_documents(str(test_data_dir))
+
+    assert isinstance(documents, types.GeneratorType)
+    assert [doc.content for doc in documents] == ["Hello"]
+
+
+def test_load_documents_recursive(test_data_dir):
+    """Test loading text files from nested directories."""
+    (test_data_dir / "projects").mkdir()
+    (test_data_dir / "projects" / "a.txt").write_text("Project A", encoding="utf-8")
+    (test_data_dir / "static").mkdir()
+    (test_data_dir / "static" / "b.txt").write_text("Static B", encoding="utf-8")
+    (test_data_dir / "static" / "ignored.md").write_text("Not loaded", encoding="utf-8")
+
+    documents = list(DocumentLoader(max_workers=2).load_documents(str(test_data_dir)))
+
+    assert sorted(doc.content for doc in documents) == ["Project A", "Static B"]
+    assert {doc.filename for doc in documents} == {"a.txt", "b.txt"}
+
+
+def test_load_documents_skips_unreadable_files(test_data_dir):
+    """Test that files failing to decode are skipped."""
+    (test_data_dir / "good.txt").write_text("Good", encoding="utf-8")
+    (test_data_dir / "bad.txt").write_bytes(b"\xff\xfe\xfa")
+
+    documents = list(DocumentLoader().load_documents(str(test_data_dir)))
+
+    assert [doc.filename for doc in documents] == ["good.txt"]
+
+
+def test_load_documents_missing_directory(tmp_path):
+    """Test loading from a missing directory yields nothing."""
+    documents = list(DocumentLoader().load_documents(str(tmp_path / "missing")))
+
+    assert documents == []
+
+
+def test_category_from_top_level_directory(tmp_path):
+    """Test that the category is the first directory below the data root."""
+    data_dir = tmp_path / "knowledge"
+    (data_dir / "projects" / "2024").mkdir(parents=True)
+    (data_dir / "projects" / "2024" / "a.txt").write_text("Nested", encoding="utf-8")
+    (data_dir / "root.txt").write_text("Root", encoding="utf-8")
+
+    documents = {doc.filename: doc for doc in DocumentLoader().load_documents(str(data_dir))}
+
+    assert documents["a.txt"].category == "projects"
+    assert documents["root.txt"].category == "unknown"
+
+
+def test_load_documents_bounds_reads_in_flight(test_data_dir, monkeypatch):
+    """Test that reads run only a bounded distance ahead of the consumer."""
+    for i in range(20):
+        (test_data_dir / f"doc{i:02d}.txt").write_text(f"Doc {i}", encoding="utf-8")
+    loader = DocumentLoader(max_workers=2)
+    read_one = loader._read_one
+    submitted = []
+
+    def counting_read_one(file_path, data_root):
+        submitted.append(file_path)
+        return read_one(file_path, data_root)
+
+    monkeypatch.setattr(loader, "_read_one", counting_read_one)
+    documents = loader.load_documents(str(test_data_dir))
+
+    next(documents)
+    assert len(submitted) <= 4
+
+    assert len(list(documents)) == 19
+    assert len(submitted) == 20
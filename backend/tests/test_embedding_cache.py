@@ -0,0 +1,58 @@
+"""Tests for the on-disk embedding cache."""
+
+import numpy as np
+from unittest.mock import MagicMock
+
+from vista.embedding_cache import EmbeddingCache
+
+
+def make_embed():
+    """Create an embed function returning one row per text."""
+    return MagicMock(side_effect=lambda texts: np.array(
+        [[float(len(t)), 1.0] for t in texts], dtype=np.float32
+    ))
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_only_missing_texts_are_embedded(self, tmp_path):
+        """Test that cached texts are not embedded again."""
+        cache = EmbeddingCache(str(tmp_path), "test-model")
+        embed = make_embed()
+
+        cache.get_or_embed(["a", "bb"], embed)
+        embeddings = cache.get_or_embed(["bb", "ccc", "a"], embed)
+
+        assert embeddings.tolist() == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+        assert embed.call_args_list[1].args[0] == ["ccc"]
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that entries are reused by a new cache on the same directory."""
+        EmbeddingCache(str(tmp_path), "test-model").get_or_embed(["a"], make_embed())
+        embed = make_embed()
+
+        embeddings = EmbeddingCache(str(tmp_path), "test-model").get_or_embed(["a"], embed)
+
+        assert embeddings.tolist() == [[1.0, 1.0]]
+        embed.assert_not_called()
+
+    def test_models_are_kept_apart(self, tmp_path):
+        """Test that entries of another model are not reused."""
+        EmbeddingCache(str(tmp_path), "model-a").get_or_embed(["a"], make_embed())
+        embed = make_embed()
+
+        EmbeddingCache(str(tmp_path), "org/model-b").get_or_embed(["a"], embed)
+
+        embed.assert_called_once()
+
+    def test_corrupt_entry_is_recomputed(self, tmp_path):
+        """Test that an unreadable entry is treated as a miss."""
+        cache = EmbeddingCache(str(tmp_path), "test-model")
+        cache.get_or_embed(["a"], make_embed())
+        cache._path(cache._key("a")).write_bytes(b"not a numpy file")
+        embed = make_embed()
+
+        assert cache.get_or_embed(["a"], embed).tolist() == [[1.0, 1.0]]
+        embed.assert_called_once()
@@ -0,0 +1,105 @@
+"""Tests for the EmbeddingGenerator class."""
+
+import threading
+
+import numpy as np
+import pytest
+from unittest.mock import patch, MagicMock
+
+from vista.embedding_generator import EmbeddingGenerator
+
+
+@pytest.fixture
+def generator():
+    """Create an EmbeddingGenerator with a mocked SentenceTransformer."""
+    with patch('vista.embedding_generator.SentenceTransformer') as mock_st:
+        model = MagicMock()
+        model.encode.side_effect = lambda texts, **kwargs: np.array(
+            [[float(len(t)), 1.0] for t in texts], dtype=np.float32
+        )
+        model.get_sentence_embedding_dimension.return_value = 2
+        mock_st.return_value = model
+        generator = EmbeddingGenerator(max_delay_ms=20)
+        model.encode.reset_mock()
+        yield generator
+
+
+class TestEmbeddingGenerator:
+    """Test cases for EmbeddingGenerator."""
+
+    def test_generate_embedding(self, generator):
+        """Test embedding a single text."""
+        embedding = generator.generate_embedding("abc")
+
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.tolist() == [3.0, 1.0]
+
+    def test_concurrent_requests_are_batched(self, generator):
+        """Test that concurrent single-text requests share encode calls."""
+        texts = ["a" * i for i in range(1, 9)]
+        results = {}
+        barrier = threading.Barrier(len(texts))
+
+        def worker(text):
+            barrier.wait()
+            results[text] = generator.generate_embedding(text)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for text in texts:
+            assert results[text].tolist() == [float(len(text)), 1.0]
+        assert generator.model.encode.call_count < len(texts)
+
+    def test_generate_embedding_error_propagates(self, generator):
+        """Test that encode failures are raised to the caller."""
+        generator.model.encode.side_effect = RuntimeError("encode failed")
+
+        with pytest.raises(RuntimeError, match="encode failed"):
+            generator.generate_embedding("abc")
+
+    def test_generate_batch_embeddings(self, generator):
+        """Test batch embedding bypasses the coalescing queue."""
+        embeddings = generator.generate_batch_embeddings(["a", "bb"])
+
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.tolist() == [[1.0, 1.0], [2.0, 1.0]]
+        generator.model.encode.assert_called_once()
+
+    def test_embeddings_are_normalized(self, generator):
+        """Test that every encode call requests unit-norm embeddings."""
+        generator.generate_embedding("abc")
+        generator.generate_batch_embeddings(["a", "bb"])
+
+        for call in generator.model.encode.call_args_list:
+            assert call.kwargs["normalize_embeddings"] is True
+
+    def test_dimension(self, generator):
+        """Test that the dimension comes from the model."""
+        assert generator.dimension == 2
+
+    def test_warmup_encodes_on_init(self):
+        """Test that the model is warmed up during construction."""
+        with patch('vista.embedding_generator.SentenceTransformer') as mock_st:
+            EmbeddingGenerator()
+            mock_st.return_value.encode.assert_called_once()
+
+    def test_onnx_backend_passed_to_model(self):
+        """Test that a non-default backend is forwarded to SentenceTransformer."""
+        with patch('vista.embedding_generator.SentenceTransformer') as mock_st:
+            EmbeddingGenerator(model_name="test-model", backend="onnx", warmup=False)
+            mock_st.assert_called_once_with("test-model", backend="onnx")
+
+    def test_invalid_backend(self):
+        """Test that unsupported backends are rejected."""
+        with pytest.raises(ValueError, match="Unsupported embedding backend"):
+            EmbeddingGenerator(backend="tensorrt")
+
+    def test_generate_batch_embeddings_empty(self, generator):
+        """Test batch embedding of an empty list."""
+        embeddings = generator.generate_batch_embeddings([])
+
+        assert embeddings.shape == (0, 2)
@@ -1,5 +1,6 @@
 """Tests for error tracking system."""
 
+import time
 import pytest
 from datetime import datetime, timedelta
 from vista.error_tracking import (
@@ -144,6 +145,13 @@ class TestErrorTracker:
         assert len(chat_errors) == 2
         assert all(e.endpoint == "/api/chat" for e in chat_errors)
     
+    def test_endpoint_is_interned(self, error_tracker):
+        """Test that repeated endpoints share a single string object."""
+        first = error_tracker.track_error(ValueError("Error 1"), endpoint="".join(["/api/", "chat"]))
+        second = error_tracker.track_error(ValueError("Error 2"), endpoint="".join(["/api/", "chat"]))
+        
+        assert first.endpoint is second.endpoint
+    
     def test_get_errors_by_request_id(self, error_tracker):
         """Test filtering errors by request ID."""
         error_tracker.track_error(ValueError("Error 1"), request_id="req-123")
@@ -175,19 +183,93 @@ class TestErrorTracker:
         
         # Should only keep last 100
         assert len(tracker.error_events) == 100
+        assert [e.message for e in tracker.error_events] == [f"Error {i}" for i in range(50, 150)]
+    
+    def test_recent_errors_after_wraparound(self):
+        """Test that recent errors stay in order once the buffer wraps."""
+        tracker = ErrorTracker(max_events=5)
+        
+        for i in range(12):
+            tracker.track_error(ValueError(f"Error {i}"))
+        
+        assert [e.message for e in tracker.get_recent_errors(limit=3)] == ["Error 9", "Error 10", "Error 11"]
+        assert [e.message for e in tracker.get_recent_errors(limit=10)] == [f"Error {i}" for i in range(7, 12)]
+        assert list(tracker.iter_recent_errors(limit=3)) == tracker.get_recent_errors(limit=3)
+        assert tracker.get_recent_errors(limit=0) == []
+    
+    def test_stats_follow_evictions(self):
+        """Test that aggregate counts drop events evicted from the buffer."""
+        tracker = ErrorTracker(max_events=3)
+        
+        tracker.track_error(KeyError("old"), endpoint="/old")
+        for i in range(3):
+            tracker.track_error(ValueError(f"Error {i}"), endpoint="/query")
+        
+        stats = tracker.get_stats()
+        assert stats.total_errors == 3
+        assert stats.errors_by_type == {"ValueError": 3}
+        assert stats.errors_by_endpoint == {"/query": 3}
+        assert stats.most_common_error == "ValueError"
     
-    def test_clear_old_errors(self, error_tracker):
+    def test_filters_follow_evictions(self):
+        """Test that filtered lookups drop events evicted from the buffer."""
+        tracker = ErrorTracker(max_events=3)
+        
+        tracker.track_error(KeyError("old"), endpoint="/old", request_id="req-old")
+        for i in range(3):
+            tracker.track_error(ValueError(f"Error {i}"), endpoint="/query", request_id="req-1")
+        
+        assert tracker.get_errors_by_type("KeyError") == []
+        assert tracker.get_errors_by_endpoint("/old") == []
+        assert tracker.get_errors_by_request_id("req-old") == []
+        assert [e.message for e in tracker.get_errors_by_type("ValueError", limit=2)] == ["Error 1", "Error 2"]
+        assert len(tracker.get_errors_by_request_id("req-1")) == 3
+    
+    def test_track_errors_batch(self):
+        """Test that a batch wrapping the buffer matches tracking one by one."""
+        batched = ErrorTracker(max_events=5)
+        single = ErrorTracker(max_events=5)
+        errors = [
+            (ValueError(f"Error {i}"), {"endpoint": f"/api/{i % 2}", "request_id": f"req-{i}"})
+            for i in range(8)
+        ]
+        
+        batched.track_errors(errors[:3])
+        events = batched.track_errors(errors[3:])
+        for error, kwargs in errors:
+            single.track_error(error, **kwargs)
+        
+        assert len(events) == 5
+        assert [e.message for e in batched.error_events] == [e.message for e in single.error_events]
+        assert batched.get_stats().errors_by_endpoint == single.get_stats().errors_by_endpoint
+        assert batched.get_errors_by_request_id("req-2") == []
+        assert [e.message for e in batched.get_errors_by_endpoint("/api/1")] == ["Error 3", "Error 5", "Error 7"]
+        assert [e.message for e in batched.get_recent_errors(limit=2)] == ["Error 6", "Error 7"]
+    
+    def test_track_errors_larger_than_buffer(self):
+        """Test that a batch larger than the buffer keeps its newest events."""
+        tracker = ErrorTracker(max_events=3)
+        
+        tracker.track_errors((ValueError(f"Error {i}"), {}) for i in range(7))
+        
+        assert [e.message for e in tracker.error_events] == ["Error 4", "Error 5", "Error 6"]
+        assert tracker.get_stats().total_errors == 3
+    
+    def test_invalid_max_events(self):
+        """Test that a non-positive event limit is rejected."""
+        with pytest.raises(ValueError):
+            ErrorTracker(max_events=0)
+    
+    def test_clear_old_errors(self, error_tracker, monkeypatch):
         """Test clearing old errors."""
+        now = time.time()
+        
         # Add old error
-        old_event = ErrorEvent(
-            error_type="ValueError",
-            message="Old error",
-            timestamp=datetime.utcnow() - timedelta(days=10),
-            severity=ErrorSeverity.LOW
-        )
-        error_tracker.error_events.append(old_event)
+        monkeypatch.setattr(time, "time", lambda: now - timedelta(days=10).total_seconds())
+        error_tracker.track_error(ValueError("Old error"), severity=ErrorSeverity.LOW)
         
         # Add recent error
+        monkeypatch.setattr(time, "time", lambda: now)
         error_tracker.track_error(ValueError("Recent error"))
         
         assert len(error_tracker.error_events) == 2
@@ -198,6 +280,38 @@ class TestErrorTracker:
         assert removed == 1
         assert len(error_tracker.error_events) == 1
     
+    def test_clear_old_errors_after_wraparound(self, monkeypatch):
+        """Test that old errors are cleared from a wrapped buffer."""
+        tracker = ErrorTracker(max_events=4)
+        now = time.time()
+        
+        for i, age_days in enumerate([12, 10, 9, 3, 1, 0]):
+            monkeypatch.setattr(time, "time", lambda age=age_days: now - age * 86400)
+            tracker.track_error(ValueError(f"Error {i}"), endpoint="/query")
+        monkeypatch.setattr(time, "time", lambda: now)
+        
+        removed = tracker.clear_old_errors(days=7)
+        
+        assert removed == 1
+        assert [e.message for e in tracker.error_events] == ["Error 3", "Error 4", "Error 5"]
+        assert tracker.get_stats().errors_by_endpoint == {"/query": 3}
+        
+        tracker.track_error(ValueError("Error 6"))
+        assert len(tracker.error_events) == 4
+    
+    def test_clear_old_errors_out_of_order(self, error_tracker, monkeypatch):
+        """Test clearing errors whose timestamps are not in insertion order."""
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now)
+        error_tracker.track_error(ValueError("Recent error"))
+        monkeypatch.setattr(time, "time", lambda: now - timedelta(days=10).total_seconds())
+        error_tracker.track_error(ValueError("Old error"), severity=ErrorSeverity.LOW)
+        monkeypatch.setattr(time, "time", lambda: now)
+        error_tracker.track_error(ValueError("Newest error"))
+        
+        assert error_tracker.clear_old_errors(days=7) == 1
+        assert [e.message for e in error_tracker.error_events] == ["Recent error", "Newest error"]
+    
     def test_reset(self, error_tracker):
         """Test resetting error tracker."""
         error_tracker.track_error(ValueError("Error 1"))
@@ -226,6 +340,20 @@ class TestErrorEvent:
         assert event.message == "Test error"
         assert event.severity == ErrorSeverity.MEDIUM
     
+    def test_datetime_timestamp_is_converted(self):
+        """Test that a naive UTC datetime timestamp is stored as Unix seconds."""
+        occurred_at = datetime(2024, 1, 2, 3, 4, 5)
+        event = ErrorEvent(
+            error_type="ValueError",
+            message="Test error",
+            timestamp=occurred_at,
+            severity=ErrorSeverity.LOW
+        )
+        
+        assert isinstance(event.timestamp, float)
+        assert event.occurred_at == occurred_at
+        assert event.to_dict()["timestamp"] == "2024-01-02T03:04:05"
+    
     def test_error_event_to_dict(self):
         """Test converting error event to dictionary."""
         event = ErrorEvent(
@@ -238,6 +366,9 @@ class TestErrorEvent:
         
         data = event.to_dict()
         
+        assert data["timestamp"] == event.occurred_at.isoformat()
+        assert type(data["severity"]) is str
+        assert data["severity"] == "medium"
         assert data["error_type"] == "ValueError"
         assert data["message"] == "Test error"
         assert data["request_id"] == "req-123"
@@ -300,6 +431,21 @@ class TestErrorDashboard:
         assert "time_range" in trend
         assert "data" in trend
         assert trend["interval_minutes"] == 60
+        assert list(trend["data"].values()) == [2]
+    
+    def test_error_trend_buckets(self, error_tracker, error_dashboard, monkeypatch):
+        """Test that errors are counted in the bucket covering their minute."""
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now - 45 * 60)
+        error_tracker.track_error(ValueError("Earlier error"))
+        monkeypatch.setattr(time, "time", lambda: now)
+        error_tracker.track_error(ValueError("Recent error"))
+        
+        trend = error_dashboard.get_error_trend(hours=1, interval_minutes=15)
+        
+        assert len(trend["data"]) == 4
+        assert sum(trend["data"].values()) == 2
+        assert list(trend["data"].values())[-1] == 1
     
     def test_get_error_summary_by_type(self, error_tracker, error_dashboard):
         """Test getting error summary by type."""
@@ -313,6 +459,21 @@ class TestErrorDashboard:
         assert summary[0]["error_type"] == "ValueError"
         assert summary[0]["count"] == 2
     
+    def test_error_summary_is_rebuilt_after_changes(self, error_tracker, error_dashboard):
+        """Test that cached summaries are reused until errors change."""
+        error_tracker.track_error(ValueError("Error 1"))
+        
+        first = error_dashboard.get_error_summary_by_type()
+        assert error_dashboard.get_error_summary_by_type() == first
+        
+        error_tracker.track_error(RuntimeError("Error 2"))
+        error_tracker.track_error(RuntimeError("Error 3"))
+        summary = error_dashboard.get_error_summary_by_type()
+        assert [s["error_type"] for s in summary] == ["RuntimeError", "ValueError"]
+        
+        error_tracker.reset()
+        assert error_dashboard.get_error_summary_by_type() == []
+    
     def test_get_error_summary_by_endpoint(self, error_tracker, error_dashboard):
         """Test getting error summary by endpoint."""
         error_tracker.track_error(ValueError("Error 1"), endpoint="/api/chat")
@@ -354,6 +515,17 @@ class TestGlobalInstances:
         
         assert dashboard1 is dashboard2
     
+    def test_get_error_tracker_concurrent_first_use(self, monkeypatch):
+        """Test that concurrent first calls share one tracker."""
+        from concurrent.futures import ThreadPoolExecutor
+        import vista.error_tracking as error_tracking
+        
+        monkeypatch.setattr(error_tracking, "_error_tracker", None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            trackers = list(executor.map(lambda _: get_error_tracker(), range(32)))
+        
+        assert all(tracker is trackers[0] for tracker in trackers)
+    
     def test_setup_error_tracking(self):
         """Test setting up error tracking."""
         tracker = setup_error_tracking()
@@ -385,6 +557,32 @@ class TestErrorTrackingEdgeCases:
         assert event.endpoint == "/api/test"
         assert event.user_id == "user-456"
     
+    def test_stats_time_window(self, error_tracker, monkeypatch):
+        """Test that only errors inside the time window count as recent."""
+        now = time.time()
+        for age_minutes in [90, 61, 30, 0]:
+            monkeypatch.setattr(time, "time", lambda age=age_minutes: now - age * 60)
+            error_tracker.track_error(ValueError(f"{age_minutes} minutes ago"))
+        monkeypatch.setattr(time, "time", lambda: now)
+        
+        stats = error_tracker.get_stats(time_window_minutes=60)
+        
+        assert stats.total_errors == 4
+        assert [e.message for e in stats.recent_errors] == ["30 minutes ago", "0 minutes ago"]
+    
+    def test_stats_without_time_window(self, error_tracker, monkeypatch):
+        """Test that stats without a window cover every tracked error."""
+        now = time.time()
+        for age_minutes in [240, 120, 0]:
+            monkeypatch.setattr(time, "time", lambda age=age_minutes: now - age * 60)
+            error_tracker.track_error(ValueError(f"{age_minutes} minutes ago"))
+        
+        stats = error_tracker.get_stats(time_window_minutes=None)
+        
+        assert stats.total_errors == 3
+        assert len(stats.recent_errors) == 3
+        assert stats.error_rate_per_minute == pytest.approx(3 / 240)
+    
     def test_error_rate_calculation(self, error_tracker):
         """Test error rate calculation."""
         # Add errors with timestamps
@@ -421,3 +619,26 @@ class TestErrorTrackingEdgeCases:
         
         assert event.stack_trace is not None
         assert "ValueError" in event.stack_trace
+    
+    def test_stack_trace_below_min_severity(self):
+        """Test that stack traces are skipped below the configured severity."""
+        tracker = ErrorTracker(min_stack_severity=ErrorSeverity.HIGH)
+        try:
+            raise ValueError("Test error")
+        except ValueError as e:
+            medium = tracker.track_error(e)
+            critical = tracker.track_error(e, severity=ErrorSeverity.CRITICAL)
+        
+        assert medium.stack_trace is None
+        assert medium.to_dict()["stack_trace"] is None
+        assert "raise ValueError" in critical.stack_trace
+    
+    def test_stack_capture_disabled(self):
+        """Test that no stack traces are captured when capture is off."""
+        tracker = ErrorTracker(capture_stack=False)
+        try:
+            raise ValueError("Test error")
+        except ValueError as e:
+            event = tracker.track_error(e, severity=ErrorSeverity.CRITICAL)
+        
+        assert event.stack_trace is None
@@ -0,0 +1,89 @@
+"""Tests for the FAISS vector store backend."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from vista.faiss_store import FaissVectorStoreManager
+from vista.models import Chunk
+
+
+def _unit(dim, i):
+    """Return the i-th standard basis vector."""
+    vector = np.zeros(dim, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+def _chunks(n):
+    """Create n chunks of a single document."""
+    return [
+        Chunk(text=f"chunk {i}", document_id="doc1", chunk_index=i, metadata={"category": "test"})
+        for i in range(n)
+    ]
+
+
+class TestFaissVectorStoreManager:
+    """Unit tests for FaissVectorStoreManager."""
+
+    def test_add_and_query(self):
+        """Test that added chunks are returned by similarity."""
+        store = FaissVectorStoreManager(dimension=4)
+        store.create_collection()
+        store.add_chunks(_chunks(3), np.stack([_unit(4, i) for i in range(3)]), batch_size=2)
+
+        results = store.query(_unit(4, 1), n_results=2)
+
+        assert store.get_collection_count() == 3
+        assert results[0].text == "chunk 1"
+        assert results[0].similarity_score == pytest.approx(1.0)
+        assert results[0].metadata["document_id"] == "doc1"
+        assert "text" not in results[0].metadata
+
+    def test_query_returns_available_results(self):
+        """Test that fewer stored vectors than requested are still returned."""
+        store = FaissVectorStoreManager(dimension=4)
+        store.create_collection()
+        store.add_chunks(_chunks(1), [_unit(4, 0)])
+
+        assert len(store.query(_unit(4, 3), n_results=5)) == 1
+
+    def test_not_initialized(self):
+        """Test that operations require create_collection."""
+        store = FaissVectorStoreManager(dimension=4)
+
+        assert store.get_collection_count() == 0
+        with pytest.raises(RuntimeError, match="not initialized"):
+            store.query(_unit(4, 0))
+
+    def test_mismatched_counts(self):
+        """Test adding chunks with mismatched embedding count."""
+        store = FaissVectorStoreManager(dimension=4)
+        store.create_collection()
+
+        with pytest.raises(ValueError, match="must match"):
+            store.add_chunks(_chunks(2), [_unit(4, 0)])
+
+    def test_reset_collection(self):
+        """Test that a reset removes all vectors."""
+        store = FaissVectorStoreManager(dimension=4)
+        store.create_collection()
+        store.add_chunks(_chunks(2), [_unit(4, 0), _unit(4, 1)])
+
+        store.reset_collection()
+
+        assert store.get_collection_count() == 0
+
+    def test_persistence(self, tmp_path):
+        """Test that a collection is reloaded from disk."""
+        store = FaissVectorStoreManager(index_path=str(tmp_path), dimension=4)
+        store.create_collection("kb")
+        store.add_chunks(_chunks(2), [_unit(4, 0), _unit(4, 1)])
+        store.flush()
+
+        reopened = FaissVectorStoreManager(index_path=str(tmp_path), dimension=4)
+        reopened.create_collection("kb")
+
+        assert reopened.get_collection_count() == 2
+        assert reopened.query(_unit(4, 1), n_results=1)[0].text == "chunk 1"
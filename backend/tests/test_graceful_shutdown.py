@@ -118,15 +118,14 @@ class TestGracefulShutdownHandler:
         handler.context.is_shutting_down = True
         assert handler.is_shutting_down() is True
     
-    def test_wait_for_in_flight_requests_none(self):
+    async def test_wait_for_in_flight_requests_none(self):
         """Test waiting when no in-flight requests."""
         handler = GracefulShutdownHandler()
         
         # Should complete immediately
-        import asyncio
-        asyncio.run(handler.wait_for_in_flight_requests())
+        await handler.wait_for_in_flight_requests()
     
-    def test_wait_for_in_flight_requests_with_requests(self):
+    async def test_wait_for_in_flight_requests_with_requests(self):
         """Test waiting for in-flight requests to complete."""
         handler = GracefulShutdownHandler()
         handler.increment_in_flight_requests()
@@ -139,18 +138,14 @@ class TestGracefulShutdownHandler:
             handler.decrement_in_flight_requests()
         
         # Run both concurrently
-        import asyncio
-        async def run_test():
-            await asyncio.gather(
-                handler.wait_for_in_flight_requests(),
-                decrement_later()
-            )
-        
-        asyncio.run(run_test())
+        await asyncio.gather(
+            handler.wait_for_in_flight_requests(),
+            decrement_later()
+        )
         
         assert handler.get_in_flight_requests() == 0
     
-    def test_shutdown_sequence(self):
+    async def test_shutdown_sequence(self):
         """Test complete shutdown sequence."""
         handler = GracefulShutdownHandler()
         
@@ -166,13 +161,12 @@ class TestGracefulShutdownHandler:
         handler.register_cleanup(sync_cleanup)
         handler.register_async_cleanup(async_cleanup)
         
-        import asyncio
-        asyncio.run(handler.shutdown())
+        await handler.shutdown()
         
         assert len(cleanup_called) == 1
         assert len(async_cleanup_called) == 1
     
-    def test_shutdown_with_error_in_cleanup(self):
+    async def test_shutdown_with_error_in_cleanup(self):
         """Test shutdown continues even if cleanup fails."""
         handler = GracefulShutdownHandler()
         
@@ -188,12 +182,31 @@ class TestGracefulShutdownHandler:
         handler.register_cleanup(normal_cleanup)
         
         # Should not raise
-        import asyncio
-        asyncio.run(handler.shutdown())
+        await handler.shutdown()
         
         # Normal cleanup should still be called
         assert len(cleanup_called) == 1
     
+    async def test_shutdown_runs_cleanups_concurrently(self):
+        """Test that blocking cleanups run in parallel rather than in sequence."""
+        import time
+        handler = GracefulShutdownHandler()
+        
+        def slow_cleanup():
+            time.sleep(0.3)
+        
+        async def slow_async_cleanup():
+            await asyncio.sleep(0.3)
+        
+        handler.register_cleanup(slow_cleanup)
+        handler.register_cleanup(slow_cleanup)
+        handler.register_async_cleanup(slow_async_cleanup)
+        
+        start = time.monotonic()
+        await handler.shutdown()
+        
+        assert time.monotonic() - start < 0.8
+    
     def test_get_shutdown_status(self):
         """Test getting shutdown status."""
         handler = GracefulShutdownHandler()
@@ -215,7 +228,7 @@ class TestGracefulShutdownHandler:
         # Should not raise
         handler.setup_signal_handlers()
     
-    def test_wait_for_in_flight_requests_timeout(self):
+    async def test_wait_for_in_flight_requests_timeout(self):
         """Test timeout when waiting for in-flight requests."""
         handler = GracefulShutdownHandler()
         handler.context.max_shutdown_time = 1
@@ -223,8 +236,31 @@ class TestGracefulShutdownHandler:
         handler.increment_in_flight_requests()
         
         # Should complete even though request is still in flight
-        import asyncio
-        asyncio.run(handler.wait_for_in_flight_requests())
+        await handler.wait_for_in_flight_requests()
         
         # Request should still be in flight
         assert handler.get_in_flight_requests() == 1
+    
+    async def test_wait_for_in_flight_requests_timeout_before_shutdown(self):
+        """Test that waiting is bounded even if shutdown was never started."""
+        handler = GracefulShutdownHandler()
+        handler.context.max_shutdown_time = 0
+        handler.increment_in_flight_requests()
+        
+        await asyncio.wait_for(handler.wait_for_in_flight_requests(), timeout=1)
+        
+        assert handler.get_in_flight_requests() == 1
+    
+    async def test_wait_for_in_flight_requests_after_timeout_when_idle(self, caplog):
+        """Test that an idle handler does not report a timeout."""
+        handler = GracefulShutdownHandler()
+        handler.context.max_shutdown_time = 1
+        handler.context.shutdown_start_time = datetime.now() - timedelta(seconds=2)
+        handler.increment_in_flight_requests()
+        handler.decrement_in_flight_requests()
+        
+        with caplog.at_level(logging.INFO):
+            await handler.wait_for_in_flight_requests()
+        
+        assert "All in-flight requests completed" in caplog.text
+        assert "timeout exceeded" not in caplog.text
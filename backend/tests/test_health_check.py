@@ -1,33 +1,54 @@
 """Tests for health check system."""
 
+import time
 import pytest
 from unittest.mock import Mock, MagicMock
 from vista.health_check import HealthChecker, HealthStatus, ComponentHealth, HealthCheckResponse
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_query_engine():
-    """Create a mock query engine."""
+    """Create a mock query engine, shared because no test mutates it."""
     return Mock()
 
 
+class FakeVectorStore:
+    """Vector store stub; cheaper than a Mock for the one method checks use."""
+    
+    def __init__(self, count: int = 100):
+        self.count = count
+        self.count_calls = 0
+        self.last_use_cache = None
+        self.raise_on_count = None
+        self.last_error = None
+    
+    def get_collection_count(self, use_cache: bool = True) -> int:
+        self.count_calls += 1
+        self.last_use_cache = use_cache
+        if self.raise_on_count:
+            raise self.raise_on_count
+        return self.count
+
+
 @pytest.fixture
 def mock_vector_store():
-    """Create a mock vector store."""
-    store = Mock()
-    store.get_collection_count.return_value = 100
-    return store
+    """Create a stub vector store."""
+    return FakeVectorStore()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_client():
-    """Create a mock LLM client."""
+    """Create a mock LLM client, shared because no test mutates it."""
     return Mock()
 
 
 @pytest.fixture
 def health_checker(mock_query_engine, mock_vector_store, mock_llm_client):
-    """Create a health checker with mocked components."""
+    """Create a health checker with mocked components.
+    
+    Kept per test, since the checker caches its last response and tests
+    replace its components and probes.
+    """
     return HealthChecker(
         query_engine=mock_query_engine,
         vector_store=mock_vector_store,
@@ -35,6 +56,21 @@ def health_checker(mock_query_engine, mock_vector_store, mock_llm_client):
     )
 
 
+def remove_vector_store(checker):
+    """Simulate a vector store that was never initialized."""
+    checker.vector_store = None
+
+
+def fail_vector_store(checker):
+    """Simulate a vector store whose queries fail."""
+    checker.vector_store.raise_on_count = Exception("Connection failed")
+
+
+def remove_llm_client(checker):
+    """Simulate an LLM client that was never initialized."""
+    checker.llm_client = None
+
+
 class TestHealthChecker:
     """Tests for HealthChecker class."""
     
@@ -49,41 +85,28 @@ class TestHealthChecker:
         assert "llm" in response.components
         assert response.message == "All systems operational"
     
-    def test_check_health_degraded_database(self, health_checker):
-        """Test health check when database is degraded."""
-        health_checker.vector_store = None
-        
-        response = health_checker.check_health()
-        
-        assert response.status == HealthStatus.DEGRADED
-        assert response.components["database"]["status"] == HealthStatus.DEGRADED
-        assert response.message == "Some systems degraded"
-    
-    def test_check_health_unhealthy_database(self, health_checker):
-        """Test health check when database is unhealthy."""
-        health_checker.vector_store.get_collection_count.side_effect = Exception("DB Error")
+    @pytest.mark.parametrize("component,break_component,expected", [
+        ("database", remove_vector_store, HealthStatus.DEGRADED),
+        ("database", fail_vector_store, HealthStatus.UNHEALTHY),
+        ("llm", remove_llm_client, HealthStatus.DEGRADED),
+    ])
+    def test_check_health_failing_component(self, health_checker, component, break_component, expected):
+        """Test that a failing component sets the overall status."""
+        break_component(health_checker)
         
         response = health_checker.check_health()
         
-        assert response.status == HealthStatus.UNHEALTHY
-        assert response.components["database"]["status"] == HealthStatus.UNHEALTHY
-        assert response.components["database"]["error_message"] is not None
-    
-    def test_check_health_degraded_llm(self, health_checker):
-        """Test health check when LLM is degraded."""
-        health_checker.llm_client = None
-        
-        response = health_checker.check_health()
-        
-        assert response.status == HealthStatus.DEGRADED
-        assert response.components["llm"]["status"] == HealthStatus.DEGRADED
+        assert response.status == expected
+        assert response.components[component]["status"] == expected
+        assert response.components[component]["error_message"] is not None
+        assert response.message == HealthChecker._get_status_message(expected)
     
     def test_check_health_response_times(self, health_checker):
         """Test that response times are recorded."""
         response = health_checker.check_health()
         
         for component in response.components.values():
-            assert component["response_time_ms"] >= 0
+            assert 0 <= component["response_time_ms"] < 1000
             assert component["last_check"] is not None
     
     def test_check_health_uptime(self, health_checker):
@@ -138,24 +161,6 @@ class TestHealthCheckerComponentChecks:
         assert component.status == HealthStatus.HEALTHY
         assert component.response_time_ms >= 0
     
-    def test_database_health_check_degraded(self, health_checker):
-        """Test database health check when degraded."""
-        health_checker.vector_store = None
-        
-        component = health_checker._check_database_health()
-        
-        assert component.status == HealthStatus.DEGRADED
-        assert "not initialized" in component.error_message
-    
-    def test_database_health_check_unhealthy(self, health_checker):
-        """Test database health check when unhealthy."""
-        health_checker.vector_store.get_collection_count.side_effect = Exception("Connection failed")
-        
-        component = health_checker._check_database_health()
-        
-        assert component.status == HealthStatus.UNHEALTHY
-        assert component.error_message is not None
-    
     def test_llm_health_check_healthy(self, health_checker):
         """Test LLM health check when healthy."""
         component = health_checker._check_llm_health()
@@ -163,14 +168,19 @@ class TestHealthCheckerComponentChecks:
         assert component.name == "llm"
         assert component.status == HealthStatus.HEALTHY
     
-    def test_llm_health_check_degraded(self, health_checker):
-        """Test LLM health check when degraded."""
-        health_checker.llm_client = None
+    @pytest.mark.parametrize("check,break_component,expected,message", [
+        ("_check_database_health", remove_vector_store, HealthStatus.DEGRADED, "not initialized"),
+        ("_check_database_health", fail_vector_store, HealthStatus.UNHEALTHY, "Connection failed"),
+        ("_check_llm_health", remove_llm_client, HealthStatus.DEGRADED, "not initialized"),
+    ])
+    def test_component_health_check_failing(self, health_checker, check, break_component, expected, message):
+        """Test component checks when the component is missing or failing."""
+        break_component(health_checker)
         
-        component = health_checker._check_llm_health()
+        component = getattr(health_checker, check)()
         
-        assert component.status == HealthStatus.DEGRADED
-        assert "not initialized" in component.error_message
+        assert component.status == expected
+        assert message in component.error_message
 
 
 class TestHealthCheckerEdgeCases:
@@ -194,6 +204,125 @@ class TestHealthCheckerEdgeCases:
         assert response1.status == response2.status
         assert response1.components["api"]["status"] == response2.components["api"]["status"]
     
+    def test_check_health_cached_within_ttl(self, health_checker):
+        """Test that back-to-back checks reuse the cached result."""
+        response1 = health_checker.check_health()
+        response2 = health_checker.check_health()
+        
+        assert response2 is response1
+        assert health_checker.vector_store.count_calls == 1
+    
+    def test_database_check_bypasses_count_cache(self, health_checker):
+        """Test that the probe asks the store for a live count."""
+        health_checker._check_database_health()
+        
+        assert health_checker.vector_store.last_use_cache is False
+    
+    def test_check_health_cache_disabled(self, mock_query_engine, mock_vector_store, mock_llm_client):
+        """Test that a zero TTL probes components on every call."""
+        checker = HealthChecker(mock_query_engine, mock_vector_store, mock_llm_client,
+                                cache_ttl_s=0, deep_check_every=1)
+        
+        checker.check_health()
+        mock_vector_store.raise_on_count = Exception("DB Error")
+        response = checker.check_health()
+        
+        assert response.status == HealthStatus.UNHEALTHY
+        assert mock_vector_store.count_calls == 2
+    
+    def test_database_check_queries_store_periodically(self, health_checker):
+        """Test that the vector store is queried once per deep check interval of checks."""
+        for _ in range(25):
+            component = health_checker._check_database_health()
+            assert component.status == HealthStatus.HEALTHY
+        
+        assert health_checker.vector_store.count_calls == 3
+    
+    def test_database_check_reuses_last_probe_result(self, health_checker):
+        """Test that a skipped probe reports the last probe's result."""
+        probed = health_checker._check_database_health()
+        skipped = health_checker._check_database_health()
+        
+        assert health_checker.vector_store.count_calls == 1
+        assert skipped is probed
+    
+    def test_database_check_after_interval(self, health_checker, monkeypatch):
+        """Test that the vector store is queried again once the interval has passed."""
+        health_checker._check_database_health()
+        health_checker._check_database_health()
+        assert health_checker.vector_store.count_calls == 1
+        
+        now = time.monotonic()
+        monkeypatch.setattr("vista.health_check.time.monotonic", lambda: now + 120)
+        health_checker._check_database_health()
+        
+        assert health_checker.vector_store.count_calls == 2
+    
+    def test_database_check_retries_after_failure(self, health_checker):
+        """Test that a failed store query is repeated until it recovers."""
+        health_checker.vector_store.raise_on_count = Exception("Connection failed")
+        assert health_checker._check_database_health().status == HealthStatus.UNHEALTHY
+        assert health_checker._check_database_health().status == HealthStatus.UNHEALTHY
+        
+        health_checker.vector_store.raise_on_count = None
+        assert health_checker._check_database_health().status == HealthStatus.HEALTHY
+        health_checker._check_database_health()
+        
+        assert health_checker.vector_store.count_calls == 3
+    
+    def test_database_check_after_failed_store_call(self, health_checker):
+        """Test that a failed call between probes is seen on the next check."""
+        health_checker._check_database_health()
+        health_checker.vector_store.last_error = "Connection failed"
+        
+        component = health_checker._check_database_health()
+        
+        assert health_checker.vector_store.count_calls == 2
+        assert component.status == HealthStatus.UNHEALTHY
+        assert component.error_message == "Connection failed"
+    
+    def test_check_health_probes_concurrently(self, health_checker):
+        """Test that component probes run in parallel."""
+        def slow(check):
+            def run():
+                time.sleep(0.2)
+                return check()
+            return run
+        
+        health_checker._check_api_health = slow(health_checker._check_api_health)
+        health_checker._check_database_health = slow(health_checker._check_database_health)
+        health_checker._check_llm_health = slow(health_checker._check_llm_health)
+        
+        start = time.monotonic()
+        response = health_checker.check_health()
+        
+        assert time.monotonic() - start < 0.35
+        assert response.status == HealthStatus.HEALTHY
+    
+    def test_check_health_timeout(self, health_checker, monkeypatch):
+        """Test that a hanging probe is reported as unhealthy."""
+        monkeypatch.setattr("vista.health_check.CHECK_TIMEOUT_S", 0.05)
+        health_checker._check_database_health = lambda: time.sleep(0.3)
+        
+        response = health_checker.check_health()
+        
+        assert response.status == HealthStatus.UNHEALTHY
+        assert response.components["database"]["error_message"] == "check timed out"
+        assert response.components["api"]["status"] == HealthStatus.HEALTHY
+    
+    def test_etag_tracks_health_changes(self, mock_query_engine, mock_vector_store, mock_llm_client):
+        """Test that the ETag is stable for unchanged health and changes with it."""
+        checker = HealthChecker(mock_query_engine, mock_vector_store, mock_llm_client, cache_ttl_s=0)
+        
+        response1 = checker.check_health()
+        response2 = checker.check_health()
+        checker.vector_store = None
+        response3 = checker.check_health()
+        
+        assert response1.etag
+        assert response2.etag == response1.etag
+        assert response3.etag != response1.etag
+    
     def test_status_message_mapping(self):
         """Test status message mapping."""
         assert HealthChecker._get_status_message(HealthStatus.HEALTHY) == "All systems operational"
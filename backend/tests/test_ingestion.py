@@ -0,0 +1,97 @@
+"""Tests for the knowledge base ingestion pipeline."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from vista.ingestion import ingest_documents, iter_chunks
+from vista.models import Chunk, Document
+from vista.text_chunker import TextChunker
+
+
+def make_document(name: str, n_chunks: int) -> Document:
+    """Create a document whose content encodes its chunk count."""
+    return Document(content=str(n_chunks), file_path=name, category="test", filename=name)
+
+
+def make_chunker() -> MagicMock:
+    """Create a chunker splitting each document into its encoded chunk count."""
+    chunker = MagicMock()
+    chunker.chunk_document.side_effect = lambda doc: [
+        Chunk(text=f"{doc.filename}-{i}", document_id=doc.filename, chunk_index=i, metadata={})
+        for i in range(int(doc.content))
+    ]
+    return chunker
+
+
+def make_embedder() -> MagicMock:
+    """Create an embedding generator returning one row per text."""
+    embedder = MagicMock()
+    embedder.generate_batch_embeddings.side_effect = lambda texts: np.ones((len(texts), 2), dtype=np.float32)
+    return embedder
+
+
+class TestIngestDocuments:
+    """Test cases for ingest_documents."""
+
+    def test_chunks_are_stored_in_windows(self):
+        """Test that chunks are embedded and stored in fixed-size windows."""
+        documents = [make_document("a.txt", 3), make_document("b.txt", 4)]
+        embedder = make_embedder()
+        vector_store = MagicMock()
+
+        document_count, chunk_count = ingest_documents(
+            iter(documents), make_chunker(), embedder, vector_store, window_size=3, batch_size=50
+        )
+
+        assert (document_count, chunk_count) == (2, 7)
+        window_sizes = [len(call.args[0]) for call in vector_store.add_chunks.call_args_list]
+        assert window_sizes == [3, 3, 1]
+        assert embedder.generate_batch_embeddings.call_count == 3
+        vector_store.flush.assert_called_once()
+        for call in vector_store.add_chunks.call_args_list:
+            assert call.args[1].shape[0] == len(call.args[0])
+            assert call.args[2] == 50
+
+    def test_chunk_order_is_preserved(self):
+        """Test that stored chunks follow document order."""
+        documents = [make_document("a.txt", 2), make_document("b.txt", 2)]
+        vector_store = MagicMock()
+
+        ingest_documents(documents, make_chunker(), make_embedder(), vector_store, window_size=3)
+
+        stored = [chunk.text for call in vector_store.add_chunks.call_args_list for chunk in call.args[0]]
+        assert stored == ["a.txt-0", "a.txt-1", "b.txt-0", "b.txt-1"]
+
+    def test_no_documents(self):
+        """Test that an empty source stores nothing."""
+        vector_store = MagicMock()
+
+        assert ingest_documents([], make_chunker(), make_embedder(), vector_store) == (0, 0)
+        vector_store.add_chunks.assert_not_called()
+
+    def test_store_error_propagates(self):
+        """Test that a failed upsert is raised to the caller."""
+        vector_store = MagicMock()
+        vector_store.add_chunks.side_effect = RuntimeError("upsert failed")
+
+        with pytest.raises(RuntimeError, match="upsert failed"):
+            ingest_documents([make_document("a.txt", 2)], make_chunker(), make_embedder(), vector_store)
+        vector_store.flush.assert_called_once()
+
+
+class TestIterChunks:
+    """Test cases for iter_chunks."""
+
+    def test_process_pool_matches_serial(self):
+        """Test that chunking in worker processes yields the same chunks in order."""
+        documents = [
+            Document(content="Sentence one. " * 40, file_path=f"doc{i}.txt", category="test", filename=f"doc{i}.txt")
+            for i in range(5)
+        ]
+        chunker = TextChunker(chunk_size=100, overlap=10)
+
+        serial = list(iter_chunks(documents, chunker))
+        parallel = list(iter_chunks(iter(documents), chunker, chunk_workers=2))
+
+        assert parallel == serial
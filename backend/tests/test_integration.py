@@ -4,7 +4,6 @@ These tests verify end-to-end flows and deployment scenarios.
 """
 
 import pytest
-import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -13,27 +12,32 @@ from vista.config import Config
 from vista.security import SecurityManager
 from vista.health_check import HealthChecker
 from vista.persistence import PersistenceManager
-from vista.structured_logging import setup_structured_logging, get_request_id, set_request_id
+from vista.structured_logging import StructuredFormatter, get_request_id, set_request_id
 from vista.metrics import MetricsCollector
 from vista.query_engine import QueryEngine
+from vista.vector_store import VectorStoreManager
+from vista.embedding_generator import EmbeddingGenerator
+from vista.llm_base import BaseLLMClient
 from vista.models import RetrievedChunk, QueryResponse
 
 
 class TestConfigurationIntegration:
     """Integration tests for configuration management."""
     
-    def test_config_from_env_and_validation(self, monkeypatch):
+    def test_config_from_env_and_validation(self, env_builder):
         """Test loading config from environment and validating it."""
         # Set environment variables
-        monkeypatch.setenv("ENVIRONMENT", "production")
-        monkeypatch.setenv("PORT", "8000")
-        monkeypatch.setenv("LOG_LEVEL", "info")
-        monkeypatch.setenv("LLM_PROVIDER", "openai")
-        monkeypatch.setenv("LLM_MODEL", "gpt-4")
-        monkeypatch.setenv("OPENAI_API_KEY", "sk-test_key_1234567890")
-        monkeypatch.setenv("ALLOWED_ORIGINS", "https://example.com,https://app.example.com")
-        monkeypatch.setenv("CHUNK_SIZE", "1000")
-        monkeypatch.setenv("CHUNK_OVERLAP", "100")
+        env_builder({
+            "ENVIRONMENT": "production",
+            "PORT": "8000",
+            "LOG_LEVEL": "info",
+            "LLM_PROVIDER": "openai",
+            "LLM_MODEL": "gpt-4",
+            "OPENAI_API_KEY": "sk-test_key_1234567890",
+            "ALLOWED_ORIGINS": "https://example.com,https://app.example.com",
+            "CHUNK_SIZE": "1000",
+            "CHUNK_OVERLAP": "100"
+        })
         
         # Load config
         config = Config.from_env()
@@ -87,8 +91,8 @@ class TestHealthCheckIntegration:
     
     def test_health_check_with_all_components(self):
         """Test health check with all components."""
-        mock_query_engine = Mock()
-        mock_vector_store = Mock()
+        mock_query_engine = Mock(spec=QueryEngine)
+        mock_vector_store = Mock(spec=VectorStoreManager)
         
         checker = HealthChecker(mock_query_engine, mock_vector_store)
         
@@ -107,49 +111,46 @@ class TestHealthCheckIntegration:
 class TestPersistenceIntegration:
     """Integration tests for database persistence."""
     
-    def test_persistence_directory_management(self):
+    def test_persistence_directory_management(self, tmp_path):
         """Test persistence directory creation and management."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            persist_dir = Path(tmpdir) / "chroma_db"
-            
-            manager = PersistenceManager(str(persist_dir))
-            
-            # Ensure directory is created
-            manager.ensure_persistence_directory()
-            
-            assert persist_dir.exists()
-            assert persist_dir.is_dir()
+        persist_dir = tmp_path / "chroma_db"
+        
+        manager = PersistenceManager(str(persist_dir))
+        
+        # Ensure directory is created
+        manager.ensure_persistence_directory()
+        
+        assert persist_dir.exists()
+        assert persist_dir.is_dir()
     
-    def test_backup_and_restore_flow(self):
+    def test_backup_and_restore_flow(self, tmp_path, test_persist_dir):
         """Test backup and restore workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_dir = Path(tmpdir) / "chroma_db"
-            db_dir.mkdir()
-            
-            # Create test data
-            test_file = db_dir / "test.bin"
-            test_file.write_bytes(b"test data")
-            
-            manager = PersistenceManager(str(db_dir))
-            
-            # Create backup
-            backup_dir = Path(tmpdir) / "backup"
-            backup_dir.mkdir()
-            manager.backup_database(str(backup_dir))
-            
-            # Verify backup exists
-            assert (backup_dir / "test.bin").exists()
-            
-            # Clear original
-            shutil.rmtree(db_dir)
-            db_dir.mkdir()
-            
-            # Restore
-            manager.restore_database(str(backup_dir))
-            
-            # Verify restoration
-            assert (db_dir / "test.bin").exists()
-            assert (db_dir / "test.bin").read_bytes() == b"test data"
+        db_dir = test_persist_dir
+        
+        # Create test data
+        test_file = db_dir / "test.bin"
+        test_file.write_bytes(b"test data")
+        
+        manager = PersistenceManager(str(db_dir))
+        
+        # Create backup
+        backup_dir = tmp_path / "backup"
+        backup_dir.mkdir()
+        manager.backup_database(str(backup_dir))
+        
+        # Verify backup exists
+        assert (backup_dir / "test.bin").exists()
+        
+        # Clear original
+        shutil.rmtree(db_dir)
+        db_dir.mkdir()
+        
+        # Restore
+        manager.restore_database(str(backup_dir))
+        
+        # Verify restoration
+        assert (db_dir / "test.bin").exists()
+        assert (db_dir / "test.bin").read_bytes() == b"test data"
 
 
 class TestLoggingIntegration:
@@ -167,13 +168,15 @@ class TestLoggingIntegration:
         # Should match
         assert retrieved_id == request_id
     
-    def test_structured_logging_setup(self):
-        """Test structured logging setup."""
-        # Setup logging
-        setup_structured_logging("info")
+    def test_structured_logging_setup(self, structured_logging):
+        """Test that structured logging is installed on the root logger."""
+        import logging
+        assert any(
+            isinstance(handler.formatter, StructuredFormatter)
+            for handler in logging.getLogger().handlers
+        )
         
         # Get logger
-        import logging
         logger = logging.getLogger("test")
         
         # Should return a logger
@@ -191,13 +194,11 @@ class TestMetricsIntegration:
         collector = MetricsCollector()
         
         # Record some requests
-        for i in range(10):
-            endpoint = f"/api/endpoint{i % 3}"
-            duration = 100 + (i * 10)
-            status_code = 200 if i % 2 == 0 else 500
-            error = "ServerError" if i % 2 == 1 else None
-            
-            collector.record_request(endpoint, duration, status_code, error)
+        collector.record_requests(
+            (f"/api/endpoint{i % 3}", 100 + (i * 10), 200 if i % 2 == 0 else 500,
+             "ServerError" if i % 2 == 1 else None)
+            for i in range(10)
+        )
         
         # Get metrics
         metrics = collector.get_metrics()
@@ -211,17 +212,33 @@ class TestMetricsIntegration:
         assert metrics.errors_by_type.get("ServerError", 0) == 5
 
 
+@pytest.fixture
+def make_query_engine():
+    """Factory for query engines wired to spec'd component mocks."""
+    def _make(vector_results=(), llm_response=""):
+        mock_vector_store = Mock(spec=VectorStoreManager)
+        mock_embedding_gen = Mock(spec=EmbeddingGenerator)
+        mock_llm_client = Mock(spec=BaseLLMClient)
+
+        mock_embedding_gen.generate_embedding.return_value = [0.1, 0.2, 0.3]
+        mock_vector_store.query.return_value = list(vector_results)
+        mock_llm_client.generate_response.return_value = llm_response
+
+        query_engine = QueryEngine(
+            vector_store=mock_vector_store,
+            embedding_gen=mock_embedding_gen,
+            llm_client=mock_llm_client,
+            max_context_tokens=1000
+        )
+        return query_engine, (mock_vector_store, mock_embedding_gen, mock_llm_client)
+    return _make
+
+
 class TestQueryEngineIntegration:
     """Integration tests for query engine."""
     
-    def test_query_with_context_flow(self):
+    def test_query_with_context_flow(self, make_query_engine):
         """Test query processing with context."""
-        mock_vector_store = Mock()
-        mock_embedding_gen = Mock()
-        mock_llm_client = Mock()
-        
-        # Setup mocks
-        query_embedding = [0.1, 0.2, 0.3]
         retrieved_chunks = [
             RetrievedChunk(
                 text="I have 5 years of experience.",
@@ -229,52 +246,23 @@ class TestQueryEngineIntegration:
                 similarity_score=0.9
             )
         ]
-        
-        mock_embedding_gen.generate_embedding.return_value = query_embedding
-        mock_vector_store.query.return_value = retrieved_chunks
-        mock_llm_client.generate_response.return_value = "Based on the context, you have 5 years of experience."
-        
-        # Create query engine
-        query_engine = QueryEngine(
-            vector_store=mock_vector_store,
-            embedding_gen=mock_embedding_gen,
-            llm_client=mock_llm_client,
-            max_context_tokens=1000
+        query_engine, _ = make_query_engine(
+            retrieved_chunks, "Based on the context, you have 5 years of experience."
         )
         
-        # Execute query
         result = query_engine.query("What is my experience?", n_results=5)
         
-        # Verify result
         assert isinstance(result, QueryResponse)
         assert result.query == "What is my experience?"
         assert len(result.sources) > 0
         assert "5 years" in result.answer
     
-    def test_query_without_context_flow(self):
+    def test_query_without_context_flow(self, make_query_engine):
         """Test query processing without context."""
-        mock_vector_store = Mock()
-        mock_embedding_gen = Mock()
-        mock_llm_client = Mock()
-        
-        # Setup mocks - no results
-        query_embedding = [0.1, 0.2, 0.3]
-        mock_embedding_gen.generate_embedding.return_value = query_embedding
-        mock_vector_store.query.return_value = []
-        mock_llm_client.generate_response.return_value = "I don't have information about that."
-        
-        # Create query engine
-        query_engine = QueryEngine(
-            vector_store=mock_vector_store,
-            embedding_gen=mock_embedding_gen,
-            llm_client=mock_llm_client,
-            max_context_tokens=1000
-        )
+        query_engine, _ = make_query_engine([], "I don't have information about that.")
         
-        # Execute query
         result = query_engine.query("What is my favorite color?")
         
-        # Verify result
         assert isinstance(result, QueryResponse)
         assert result.query == "What is my favorite color?"
         assert len(result.sources) == 0
@@ -283,13 +271,15 @@ class TestQueryEngineIntegration:
 class TestDeploymentScenarios:
     """Integration tests for deployment scenarios."""
     
-    def test_production_configuration_scenario(self, monkeypatch):
+    def test_production_configuration_scenario(self, env_builder):
         """Test production configuration scenario."""
         # Set production environment variables
-        monkeypatch.setenv("ENVIRONMENT", "production")
-        monkeypatch.setenv("LLM_PROVIDER", "gemini")
-        monkeypatch.setenv("GEMINI_API_KEY", "AIzatest_key_1234567890")
-        monkeypatch.setenv("ALLOWED_ORIGINS", "https://example.com")
+        env_builder({
+            "ENVIRONMENT": "production",
+            "LLM_PROVIDER": "gemini",
+            "GEMINI_API_KEY": "AIzatest_key_1234567890",
+            "ALLOWED_ORIGINS": "https://example.com"
+        })
         
         # Load config
         config = Config.from_env()
@@ -322,16 +312,15 @@ class TestDeploymentScenarios:
     def test_monitoring_scenario(self):
         """Test monitoring scenario."""
         # Create health checker
-        mock_query_engine = Mock()
-        mock_vector_store = Mock()
+        mock_query_engine = Mock(spec=QueryEngine)
+        mock_vector_store = Mock(spec=VectorStoreManager)
         checker = HealthChecker(mock_query_engine, mock_vector_store)
         
         # Create metrics collector
         collector = MetricsCollector()
         
         # Simulate requests
-        for i in range(5):
-            collector.record_request(f"/api/query", 100 + i * 10, 200)
+        collector.record_requests(("/api/query", 100 + i * 10, 200, None) for i in range(5))
         
         # Get health and metrics
         health = checker.check_health()
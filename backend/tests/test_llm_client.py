@@ -1,11 +1,10 @@
 """Tests for the LLM client."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
-from openai.types.chat import ChatCompletion, ChatCompletionMessage
-from openai.types.chat.chat_completion import Choice
 
-from vista.llm_openai import OpenAILLMClient
+from vista.llm_openai import MAX_BACKOFF_S, OpenAILLMClient
 
 
 class TestLLMClient:
@@ -25,15 +24,9 @@ class TestLLMClient:
         mock_client = Mock()
         mock_openai.return_value = mock_client
         
-        # Create a mock response
-        mock_message = ChatCompletionMessage(role="assistant", content="Test response")
-        mock_choice = Choice(index=0, message=mock_message, finish_reason="stop")
-        mock_response = ChatCompletion(
-            id="test-id",
-            choices=[mock_choice],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion"
+        # The client only reads choices[0].message.content
+        mock_response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))]
         )
         
         mock_client.chat.completions.create.return_value = mock_response
@@ -52,13 +45,7 @@ class TestLLMClient:
         mock_openai.return_value = mock_client
         
         # Mock empty response
-        mock_response = ChatCompletion(
-            id="test-id",
-            choices=[],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion"
-        )
+        mock_response = SimpleNamespace(choices=[])
         
         mock_client.chat.completions.create.return_value = mock_response
         
@@ -79,7 +66,8 @@ class TestLLMClient:
         
         assert result == "Success"
         assert mock_func.call_count == 2
-        mock_sleep.assert_called_once_with(1)  # 2^0 = 1 second delay
+        mock_sleep.assert_called_once()
+        assert 0.5 <= mock_sleep.call_args.args[0] <= 1  # Jittered 2^0 second step
     
     @patch('vista.llm_openai.time.sleep')
     def test_retry_with_backoff_all_attempts_fail(self, mock_sleep):
@@ -93,11 +81,24 @@ class TestLLMClient:
             client._retry_with_backoff(mock_func, max_retries=2)
         
         assert mock_func.call_count == 3  # Initial + 2 retries
-        # Should have delays of 1, 2 seconds (2^0, 2^1)
-        from unittest.mock import call
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
+        # Delays are jittered within the upper half of the 1, 2 second steps
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0.5 <= delays[0] <= 1
+        assert 1 <= delays[1] <= 2
     
+    @patch('vista.llm_openai.time.sleep')
+    def test_retry_with_backoff_delay_is_capped(self, mock_sleep):
+        """Test that retry delays never exceed the backoff cap."""
+        client = OpenAILLMClient(api_key="test-key")
+
+        mock_func = Mock(side_effect=Exception("Always fails"))
+
+        with pytest.raises(Exception, match="Always fails"):
+            client._retry_with_backoff(mock_func, max_retries=8)
+
+        assert all(c.args[0] <= MAX_BACKOFF_S for c in mock_sleep.call_args_list)
+
     def test_retry_with_backoff_immediate_success(self):
         """Test retry logic when function succeeds immediately."""
         client = OpenAILLMClient(api_key="test-key")
@@ -0,0 +1,115 @@
+"""Tests for the local FAISS index mirror."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from vista.local_index import LocalVectorIndex
+
+
+def _unit(dim, i):
+    """Return the i-th standard basis vector."""
+    vector = np.zeros(dim, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+class TestLocalVectorIndex:
+    """Unit tests for LocalVectorIndex."""
+
+    def test_search_returns_confident_match(self):
+        """Test that a mirrored vector is found locally."""
+        index = LocalVectorIndex(dimension=4)
+        index.add(["a", "b"], [_unit(4, 0), _unit(4, 1)],
+                  [{"text": "alpha", "category": "x"}, {"text": "beta", "category": "y"}])
+
+        results = index.search(_unit(4, 0), n_results=1)
+
+        assert results[0].text == "alpha"
+        assert results[0].metadata == {"category": "x"}
+        assert results[0].similarity_score == pytest.approx(1.0)
+
+    def test_search_low_confidence_returns_none(self):
+        """Test that weak matches fall back to the remote store."""
+        index = LocalVectorIndex(dimension=4, confidence_threshold=0.9)
+        index.add(["a"], [_unit(4, 0)], [{"text": "alpha"}])
+
+        assert index.search(_unit(4, 1), n_results=1) is None
+
+    def test_search_not_enough_vectors_returns_none(self):
+        """Test that asking for more results than mirrored returns None."""
+        index = LocalVectorIndex(dimension=4)
+        index.add(["a"], [_unit(4, 0)], [{"text": "alpha"}])
+
+        assert index.search(_unit(4, 0), n_results=2) is None
+
+    def test_readded_id_replaces_previous_entry(self):
+        """Test that upserting an ID hides its stale position."""
+        index = LocalVectorIndex(dimension=4)
+        index.add(["a"], [_unit(4, 0)], [{"text": "old"}])
+        index.add(["a"], [_unit(4, 0)], [{"text": "new"}])
+
+        results = index.search(_unit(4, 0), n_results=1)
+
+        assert len(index) == 1
+        assert results[0].text == "new"
+
+    def test_metadata_with_different_keys(self):
+        """Test that each vector keeps only its own metadata keys."""
+        index = LocalVectorIndex(dimension=4, confidence_threshold=0.0)
+        index.add(["a"], [_unit(4, 0)], [{"text": "alpha", "category": "x"}])
+        index.add(["b"], [_unit(4, 1)], [{"text": "beta", "filename": "b.txt"}])
+
+        first = index.search(_unit(4, 0), n_results=1)[0]
+        second = index.search(_unit(4, 1), n_results=1)[0]
+
+        assert first.metadata == {"category": "x"}
+        assert second.metadata == {"filename": "b.txt"}
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved index is reloaded."""
+        index = LocalVectorIndex(dimension=4, persist_path=str(tmp_path))
+        index.add(["a"], [_unit(4, 0)], [{"text": "alpha"}])
+        index.save()
+
+        reloaded = LocalVectorIndex(dimension=4, persist_path=str(tmp_path))
+
+        assert len(reloaded) == 1
+        assert reloaded.search(_unit(4, 0), n_results=1)[0].text == "alpha"
+
+    def test_loaded_metadata_is_interned(self, tmp_path):
+        """Test that repeated metadata values share one string after reloading."""
+        index = LocalVectorIndex(dimension=4, persist_path=str(tmp_path))
+        index.add(["a", "b"], [_unit(4, 0), _unit(4, 1)],
+                  [{"text": "alpha", "category": "projects"}, {"text": "beta", "category": "projects"}])
+        index.save()
+
+        reloaded = LocalVectorIndex(dimension=4, persist_path=str(tmp_path))
+        first, second = reloaded.nearest(_unit(4, 0), n_results=2)
+
+        assert first.metadata["category"] is second.metadata["category"]
+
+    @pytest.mark.parametrize("precision", ["fp16", "int8"])
+    def test_quantized_precision(self, precision):
+        """Test that quantized indexes still find the matching vector."""
+        index = LocalVectorIndex(dimension=4, precision=precision)
+        index.add(["a", "b"], [_unit(4, 0), _unit(4, 1)], [{"text": "alpha"}, {"text": "beta"}])
+
+        results = index.search(_unit(4, 1), n_results=1)
+
+        assert results[0].text == "beta"
+        assert results[0].similarity_score == pytest.approx(1.0, abs=0.01)
+
+    def test_invalid_precision(self):
+        """Test that unsupported precisions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported index precision"):
+            LocalVectorIndex(dimension=4, precision="int4")
+
+    def test_duplicate_id_within_batch(self):
+        """Test that the last occurrence of an ID in one batch wins."""
+        index = LocalVectorIndex(dimension=4)
+        index.add(["a", "a"], [_unit(4, 0), _unit(4, 0)], [{"text": "old"}, {"text": "new"}])
+
+        assert len(index) == 1
+        assert index.search(_unit(4, 0), n_results=1)[0].text == "new"
@@ -1,7 +1,7 @@
 """Tests for metrics collection system."""
 
 import pytest
-from vista.metrics import MetricsCollector, RequestMetrics, SystemMetrics
+from vista.metrics import MAX_REQUEST_METRICS, MetricsCollector, RequestMetrics, SystemMetrics
 
 
 @pytest.fixture
@@ -117,6 +117,34 @@ class TestMetricsCollector:
         # Should only keep last 10000
         assert len(metrics_collector.request_metrics) == 10000
     
+    def test_record_requests_batch(self, metrics_collector):
+        """Test that batch recording matches recording one at a time."""
+        records = [
+            ("/api/a", 50.0, 200, None),
+            ("/api/b", 150.0, 500, "ServerError"),
+            ("/api/a", 100.0, 200, None),
+        ]
+        single = MetricsCollector()
+        for record in records:
+            single.record_request(*record)
+        
+        metrics_collector.record_requests(records)
+        
+        assert metrics_collector.request_metrics == single.request_metrics
+        metrics = metrics_collector.get_metrics()
+        assert metrics.total_requests == 3
+        assert metrics.requests_by_endpoint == {"/api/a": 2, "/api/b": 1}
+        assert metrics.errors_by_type == {"ServerError": 1}
+    
+    def test_record_requests_memory_limit(self, metrics_collector):
+        """Test that batch recording keeps only the most recent metrics."""
+        metrics_collector.record_requests(
+            (f"/api/{i}", float(i), 200, None) for i in range(MAX_REQUEST_METRICS + 5)
+        )
+        
+        assert len(metrics_collector.request_metrics) == MAX_REQUEST_METRICS
+        assert metrics_collector.request_metrics[0].endpoint == "/api/5"
+    
     def test_reset_metrics(self, metrics_collector):
         """Test resetting metrics."""
         metrics_collector.record_request("/api/test", 50.0, 200)
@@ -1,5 +1,6 @@
 """Tests for performance monitoring system."""
 
+import statistics
 import pytest
 from datetime import datetime, timedelta
 from vista.performance_monitoring import (
@@ -128,6 +129,69 @@ class TestPerformanceMonitor:
         
         # Should only keep last 100
         assert len(monitor.metrics) == 100
+        assert monitor.metrics[0].response_time_ms == 50.0
+        assert monitor.metrics[-1].response_time_ms == 149.0
+    
+    def test_metric_limit_evicts_endpoint_stats(self):
+        """Test that evicted metrics no longer count toward endpoint stats."""
+        monitor = PerformanceMonitor(max_metrics=3)
+        
+        monitor.record_metric("/api/old", 500.0, 500)
+        for i in range(3):
+            monitor.record_metric("/api/new", float(i), 200)
+        
+        assert "/api/old" not in monitor.get_all_stats()
+        assert monitor.get_stats_for_endpoint("/api/old").total_requests == 0
+        assert monitor.get_stats_for_endpoint("/api/new").total_requests == 3
+    
+    def test_endpoint_totals_follow_eviction(self):
+        """Test that running averages and error rates drop evicted metrics."""
+        monitor = PerformanceMonitor(max_metrics=4)
+        
+        for response_time, status_code in [(1000.0, 500), (10.0, 200), (20.0, 404), (30.0, 200), (40.0, 200)]:
+            monitor.record_metric("/api/test", response_time, status_code)
+        
+        stats = monitor.get_stats_for_endpoint("/api/test")
+        assert stats.total_requests == 4
+        assert stats.average_response_time_ms == 25.0
+        assert stats.max_response_time_ms == 40.0
+        assert stats.error_rate == 0.25
+    
+    def test_order_statistics_follow_eviction(self):
+        """Test that median and percentiles match a full sort of the retained times."""
+        monitor = PerformanceMonitor(max_metrics=50)
+        times = [float((i * 37) % 101) for i in range(80)]
+        for response_time in times:
+            monitor.record_metric("/api/test", response_time, 200)
+        
+        retained = sorted(times[-50:])
+        stats = monitor.get_stats_for_endpoint("/api/test")
+        
+        assert stats.median_response_time_ms == statistics.median(retained)
+        assert stats.p95_response_time_ms == retained[int(50 * 0.95)]
+        assert stats.p99_response_time_ms == retained[int(50 * 0.99)]
+        assert stats.min_response_time_ms == retained[0]
+    
+    def test_stats_cached_until_metrics_change(self, performance_monitor):
+        """Test that stats are rebuilt only after new metrics are recorded."""
+        performance_monitor.record_metric("/api/test", 10.0, 200)
+        
+        stats1 = performance_monitor.get_stats_for_endpoint("/api/test")
+        stats2 = performance_monitor.get_stats_for_endpoint("/api/test")
+        performance_monitor.record_metric("/api/test", 30.0, 200)
+        stats3 = performance_monitor.get_stats_for_endpoint("/api/test")
+        
+        assert stats2 is stats1
+        assert stats3 is not stats1
+        assert stats3.average_response_time_ms == 20.0
+    
+    def test_cached_stats_are_immutable(self, performance_monitor):
+        """Test that shared cached stats cannot be modified by a caller."""
+        performance_monitor.record_metric("/api/test", 10.0, 200)
+        stats = performance_monitor.get_stats_for_endpoint("/api/test")
+        
+        with pytest.raises(AttributeError):
+            stats.total_requests = 0
     
     def test_record_resource_usage(self, performance_monitor):
         """Test recording resource usage."""
@@ -138,6 +202,24 @@ class TestPerformanceMonitor:
             assert usage.memory_percent >= 0
             assert usage.disk_percent >= 0
     
+    def test_resource_stats_window(self, performance_monitor):
+        """Test that resource stats only include samples inside the time window."""
+        now = datetime.utcnow()
+        for minutes_ago, cpu in [(90, 90.0), (30, 20.0), (5, 40.0)]:
+            performance_monitor.resource_history.append(ResourceUsage(
+                timestamp=now - timedelta(minutes=minutes_ago),
+                cpu_percent=cpu,
+                memory_percent=50.0,
+                memory_mb=1024.0,
+                disk_percent=40.0,
+                disk_mb_free=2048.0
+            ))
+        
+        stats = performance_monitor.get_resource_stats(time_window_minutes=60)
+        
+        assert stats["cpu_percent_avg"] == 30.0
+        assert stats["cpu_percent_max"] == 40.0
+    
     def test_get_resource_stats(self, performance_monitor):
         """Test getting resource statistics."""
         # Record some resource usage
@@ -163,6 +245,17 @@ class TestPerformanceMonitor:
         assert "error_prone_endpoints" in report
         assert "resources" in report
         assert report["summary"]["total_requests"] == 3
+        assert [s["endpoint"] for s in report["slowest_endpoints"]] == ["/api/chat", "/health"]
+        assert report["error_prone_endpoints"][0]["endpoint"] == "/api/chat"
+    
+    def test_performance_report_counts_errors_exactly(self, performance_monitor):
+        """Test that the report's error total is not skewed by rate rounding."""
+        for i in range(22):
+            performance_monitor.record_metric("/api/chat", 50.0, 500 if i < 15 else 200)
+        
+        report = performance_monitor.get_performance_report()
+        
+        assert report["summary"]["total_errors"] == 15
     
     def test_reset(self, performance_monitor):
         """Test resetting performance monitor."""
@@ -210,6 +303,20 @@ class TestPerformanceMetric:
         assert data["status_code"] == 200
         assert data["memory_usage_mb"] == 100.0
         assert data["cpu_percent"] == 25.0
+    
+    def test_metric_datetime_timestamp(self):
+        """Test that a datetime timestamp is stored as Unix seconds and round-trips."""
+        recorded = datetime(2024, 1, 2, 3, 4, 5)
+        metric = PerformanceMetric(
+            endpoint="/api/test",
+            response_time_ms=50.0,
+            timestamp=recorded,
+            status_code=200
+        )
+        
+        assert isinstance(metric.timestamp, float)
+        assert metric.recorded_at == recorded
+        assert metric.to_dict()["timestamp"] == "2024-01-02T03:04:05"
 
 
 class TestPerformanceStats:
@@ -290,6 +397,17 @@ class TestGlobalInstances:
         
         assert monitor1 is monitor2
     
+    def test_get_performance_monitor_concurrent_first_use(self, monkeypatch):
+        """Test that concurrent first calls share one monitor."""
+        from concurrent.futures import ThreadPoolExecutor
+        import vista.performance_monitoring as performance_monitoring
+        
+        monkeypatch.setattr(performance_monitoring, "_performance_monitor", None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            monitors = list(executor.map(lambda _: get_performance_monitor(), range(32)))
+        
+        assert all(monitor is monitors[0] for monitor in monitors)
+    
     def test_setup_performance_monitoring(self):
         """Test setting up performance monitoring."""
         monitor = setup_performance_monitoring()
@@ -78,6 +78,50 @@ class TestDatabaseBackup:
         assert metadata["file_count"] == 1
         assert "timestamp" in metadata
     
+    def test_backup_database_is_independent_copy(self, persistence_manager, temp_persist_dir):
+        """Test that changing the database after a backup leaves the backup intact."""
+        persistence_manager.ensure_persistence_directory()
+        test_file = persistence_manager.persist_directory / "test.txt"
+        test_file.write_text("test data")
+        
+        backup_dir = Path(temp_persist_dir) / "backup"
+        persistence_manager.backup_database(str(backup_dir))
+        with open(test_file, "r+") as f:
+            f.write("changed")
+        
+        assert (backup_dir / "test.txt").read_text() == "test data"
+    
+    def test_backup_database_copies_nested_files(self, persistence_manager, temp_persist_dir):
+        """Test that backups include every file of nested directories."""
+        persistence_manager.ensure_persistence_directory()
+        for i in range(40):
+            segment_dir = persistence_manager.persist_directory / f"segment{i % 4}"
+            segment_dir.mkdir(exist_ok=True)
+            (segment_dir / f"data{i}.bin").write_bytes(bytes([i]) * 100)
+        
+        backup_dir = Path(temp_persist_dir) / "backup"
+        metadata = persistence_manager.backup_database(str(backup_dir))
+        
+        assert metadata["file_count"] == 40
+        assert (backup_dir / "segment3" / "data39.bin").read_bytes() == bytes([39]) * 100
+    
+    def test_backup_database_follows_symlinks(self, persistence_manager, temp_persist_dir, tmp_path):
+        """Test that backups copy the contents of symlinked directories and files."""
+        persistence_manager.ensure_persistence_directory()
+        segment_dir = tmp_path / "segment"
+        segment_dir.mkdir()
+        (segment_dir / "data.bin").write_bytes(b"segment data")
+        (persistence_manager.persist_directory / "segment").symlink_to(segment_dir)
+        (persistence_manager.persist_directory / "data.bin").symlink_to(segment_dir / "data.bin")
+        
+        backup_dir = Path(temp_persist_dir) / "backup"
+        metadata = persistence_manager.backup_database(str(backup_dir))
+        
+        assert metadata["file_count"] == 2
+        assert not (backup_dir / "segment").is_symlink()
+        assert (backup_dir / "segment" / "data.bin").read_bytes() == b"segment data"
+        assert (backup_dir / "data.bin").read_bytes() == b"segment data"
+    
     def test_backup_database_nonexistent_source(self, temp_persist_dir):
         """Test that backup_database raises FileNotFoundError for nonexistent source."""
         manager = PersistenceManager(persist_directory=str(Path(temp_persist_dir) / "nonexistent"))
@@ -171,7 +215,14 @@ class TestDatabaseIntegrityVerification:
         db_file.write_text("mock database")
         
         assert persistence_manager.verify_database_integrity() is True
-    
+
+    def test_verify_database_integrity_with_subdirectory_only(self, persistence_manager):
+        """Test that a directory holding only a segment subdirectory is not empty."""
+        persistence_manager.ensure_persistence_directory()
+        (persistence_manager.persist_directory / "segment").mkdir()
+
+        assert persistence_manager.verify_database_integrity() is True
+
     def test_verify_database_integrity_nonexistent_directory(self, temp_persist_dir):
         """Test that verify_database_integrity returns False for nonexistent directory."""
         manager = PersistenceManager(persist_directory=str(Path(temp_persist_dir) / "nonexistent"))
@@ -153,4 +153,16 @@ class TestQueryEngine:
         assert isinstance(result, QueryResponse)
         assert result.query == question
         assert result.sources == []
-        assert "error" in result.answer.lower()
\ No newline at end of file
+        assert "error" in result.answer.lower()    
+    def test_warmup(self):
+        """Test warmup exercises the embedding and vector store paths."""
+        self.query_engine.warmup()
+        
+        self.mock_embedding_gen.generate_embedding.assert_called_once()
+        self.mock_vector_store.get_collection_count.assert_called_once()
+    
+    def test_warmup_swallows_errors(self):
+        """Test warmup failures do not propagate."""
+        self.mock_embedding_gen.generate_embedding.side_effect = Exception("Embedding failed")
+        
+        self.query_engine.warmup()
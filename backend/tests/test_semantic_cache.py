@@ -0,0 +1,226 @@
+"""Tests for the centroid-based semantic cache."""
+
+import numpy as np
+import pytest
+
+from vista.models import RetrievedChunk
+from vista.semantic_cache import SemanticCache
+
+
+def _chunks(n):
+    """Build n retrieved chunks with distinct text."""
+    return [
+        RetrievedChunk(
+            text=f"chunk {i}",
+            metadata={},
+            similarity_score=1.0 - i * 0.1
+        )
+        for i in range(n)
+    ]
+
+
+class TestSemanticCache:
+    """Unit tests for SemanticCache."""
+
+    def test_lookup_empty_cache_misses(self):
+        """Test that an empty cache always misses."""
+        cache = SemanticCache()
+        assert cache.lookup([1.0, 0.0, 0.0], n_results=3) is None
+
+    def test_insert_then_lookup_hits(self):
+        """Test that a near-identical query hits the cache."""
+        cache = SemanticCache()
+        results = _chunks(3)
+        cache.insert([1.0, 0.0, 0.0], 3, results)
+
+        cached = cache.lookup([0.99, 0.01, 0.0], n_results=3)
+
+        assert cached == results
+
+    def test_lookup_dissimilar_query_misses(self):
+        """Test that an unrelated query misses the cache."""
+        cache = SemanticCache()
+        cache.insert([1.0, 0.0, 0.0], 3, _chunks(3))
+
+        assert cache.lookup([0.0, 1.0, 0.0], n_results=3) is None
+
+    def test_lookup_truncates_to_requested_results(self):
+        """Test that cached results are truncated to n_results."""
+        cache = SemanticCache()
+        cache.insert([1.0, 0.0, 0.0], 5, _chunks(5))
+
+        cached = cache.lookup([1.0, 0.0, 0.0], n_results=2)
+
+        assert len(cached) == 2
+
+    def test_lookup_more_results_than_cached_misses(self):
+        """Test that asking for more results than cached is a miss."""
+        cache = SemanticCache()
+        cache.insert([1.0, 0.0, 0.0], 2, _chunks(2))
+
+        assert cache.lookup([1.0, 0.0, 0.0], n_results=5) is None
+
+    def test_similar_inserts_merge_into_one_centroid(self):
+        """Test that similar embeddings share a centroid."""
+        cache = SemanticCache(merge_threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], 3, _chunks(3))
+        cache.insert([0.95, 0.05, 0.0], 3, _chunks(3))
+
+        assert len(cache) == 1
+
+    def test_eviction_bounds_size(self):
+        """Test that the least recently used centroid is evicted when full."""
+        cache = SemanticCache(max_centroids=2)
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+        cache.insert([0.0, 1.0, 0.0], 1, _chunks(1))
+        # Use the first centroid more recently
+        cache.lookup([1.0, 0.0, 0.0], n_results=1)
+
+        cache.insert([0.0, 0.0, 1.0], 1, _chunks(1))
+
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0, 0.0], n_results=1) is not None
+        assert cache.lookup([0.0, 1.0, 0.0], n_results=1) is None
+
+    def test_full_cache_admits_new_queries(self):
+        """Test that a newly inserted centroid is not the next one evicted."""
+        cache = SemanticCache(max_centroids=2)
+        cache.insert([1.0, 0.0, 0.0, 0.0], 1, _chunks(1))
+        cache.insert([0.0, 1.0, 0.0, 0.0], 1, _chunks(1))
+
+        cache.insert([0.0, 0.0, 1.0, 0.0], 1, _chunks(1))
+        cache.insert([0.0, 0.0, 0.0, 1.0], 1, _chunks(1))
+
+        assert len(cache) == 2
+        assert cache.lookup([0.0, 0.0, 1.0, 0.0], n_results=1) is not None
+        assert cache.lookup([0.0, 0.0, 0.0, 1.0], n_results=1) is not None
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = SemanticCache()
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.lookup([1.0, 0.0, 0.0], n_results=1) is None
+
+    def test_invalid_thresholds(self):
+        """Test that invalid thresholds are rejected."""
+        with pytest.raises(ValueError):
+            SemanticCache(hit_threshold=0.8, merge_threshold=0.9)
+        with pytest.raises(ValueError):
+            SemanticCache(max_centroids=0)
+
+    def test_centroids_stored_as_float16(self):
+        """Test that centroids are stored in half precision."""
+        cache = SemanticCache()
+        cache.insert([0.6, 0.8, 0.0], 1, _chunks(1))
+
+        assert cache._centroids.dtype == np.float16
+        assert cache.lookup([0.6, 0.8, 0.0], n_results=1) is not None
+
+    def test_lookup_across_similarity_chunks(self):
+        """Test that the nearest centroid is found beyond the first row block."""
+        dim = 400
+        cache = SemanticCache(max_centroids=300)
+        for i in range(300):
+            vector = np.zeros(dim)
+            vector[i] = 1.0
+            cache.insert(vector, 1, _chunks(1))
+
+        query = np.zeros(dim)
+        query[299] = 1.0
+
+        assert len(cache) == 300
+        assert cache.lookup(query, n_results=1) is not None
+
+
+class TestSemanticCachePersistence:
+    """Unit tests for the on-disk semantic cache."""
+
+    def test_persisted_cache_survives_restart(self, tmp_path):
+        """Test that a flushed cache is reloaded by a new instance."""
+        cache = SemanticCache(persist_path=str(tmp_path))
+        cache.insert([1.0, 0.0, 0.0], 2, _chunks(2))
+        cache.flush()
+
+        reloaded = SemanticCache(persist_path=str(tmp_path))
+        cached = reloaded.lookup([1.0, 0.0, 0.0], n_results=2)
+
+        assert len(reloaded) == 1
+        assert cached == _chunks(2)
+
+    def test_inserts_flushed_every_k(self, tmp_path):
+        """Test that a snapshot is written after flush_every inserts."""
+        cache = SemanticCache(persist_path=str(tmp_path), flush_every=2)
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+
+        snapshot_file = tmp_path / "cache.npz"
+        assert not snapshot_file.exists()
+
+        cache.insert([0.0, 1.0, 0.0], 1, _chunks(1))
+        assert snapshot_file.exists()
+        reloaded = SemanticCache(persist_path=str(tmp_path))
+        assert reloaded.lookup([0.0, 1.0, 0.0], n_results=1) == _chunks(1)
+        assert len(reloaded) == 2
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_clear_empties_persisted_results(self, tmp_path):
+        """Test that clearing also drops persisted results."""
+        cache = SemanticCache(persist_path=str(tmp_path))
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+        cache.flush()
+        cache.clear()
+
+        reloaded = SemanticCache(persist_path=str(tmp_path))
+        assert reloaded.lookup([1.0, 0.0, 0.0], n_results=1) is None
+        assert len(reloaded) == 0
+
+    def test_mismatched_size_is_ignored(self, tmp_path):
+        """Test that a cache built for a different size is not loaded."""
+        cache = SemanticCache(max_centroids=4, persist_path=str(tmp_path))
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+        cache.flush()
+
+        reloaded = SemanticCache(max_centroids=8, persist_path=str(tmp_path))
+        assert reloaded.lookup([1.0, 0.0, 0.0], n_results=1) is None
+
+    def test_mismatched_dimension_is_ignored(self, tmp_path):
+        """Test that a cache built for another embedding dimension is not loaded."""
+        cache = SemanticCache(persist_path=str(tmp_path))
+        cache.insert([1.0, 0.0, 0.0], 1, _chunks(1))
+        cache.flush()
+
+        reloaded = SemanticCache(persist_path=str(tmp_path))
+        assert reloaded.lookup([1.0, 0.0, 0.0, 0.0], n_results=1) is None
+
+        reloaded.insert([1.0, 0.0, 0.0, 0.0], 1, _chunks(1))
+        assert reloaded.lookup([1.0, 0.0, 0.0, 0.0], n_results=1) == _chunks(1)
+        assert len(reloaded) == 1
+
+    def test_instances_sharing_path_keep_private_slots(self, tmp_path):
+        """Test that two caches on one path never serve each other's results."""
+        first = SemanticCache(persist_path=str(tmp_path))
+        second = SemanticCache(persist_path=str(tmp_path))
+        first_results = _chunks(1)
+        second_results = [RetrievedChunk(text="other", metadata={}, similarity_score=0.5)]
+
+        # Both load the (empty) snapshot before either writes
+        assert first.lookup([1.0, 0.0, 0.0], n_results=1) is None
+        assert second.lookup([0.0, 1.0, 0.0], n_results=1) is None
+
+        first.insert([1.0, 0.0, 0.0], 1, first_results)
+        first.flush()
+        second.insert([0.0, 1.0, 0.0], 1, second_results)
+        second.flush()
+
+        assert first.lookup([1.0, 0.0, 0.0], n_results=1) == first_results
+        assert first.lookup([0.0, 1.0, 0.0], n_results=1) is None
+        assert second.lookup([0.0, 1.0, 0.0], n_results=1) == second_results
+        assert second.lookup([1.0, 0.0, 0.0], n_results=1) is None
+
+        # The last flush wins as a whole snapshot
+        reloaded = SemanticCache(persist_path=str(tmp_path))
+        assert reloaded.lookup([0.0, 1.0, 0.0], n_results=1) == second_results
+        assert reloaded.lookup([1.0, 0.0, 0.0], n_results=1) is None
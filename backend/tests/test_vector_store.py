@@ -12,10 +12,24 @@ import logging
 import os
 from typing import List
 
-from vista.vector_store import VectorStoreManager
+import numpy as np
+
+from pinecone.exceptions import NotFoundException, PineconeApiException
+
+from vista.vector_store import VectorStoreManager, get_pinecone_client, _close_pinecone_indexes
 from models import Chunk, RetrievedChunk
 
 
+@pytest.fixture(autouse=True)
+def clear_pinecone_caches():
+    """Reset shared Pinecone clients and index handles between tests."""
+    get_pinecone_client.cache_clear()
+    _close_pinecone_indexes()
+    yield
+    get_pinecone_client.cache_clear()
+    _close_pinecone_indexes()
+
+
 # ============================================================================
 # Unit Tests: Initialization and Configuration
 # ============================================================================
@@ -64,6 +78,18 @@ class TestVectorStoreInitialization:
                 manager = VectorStoreManager()
                 assert manager.namespace == 'custom-namespace'
     
+    def test_client_shared_across_managers(self):
+        """Test that managers with the same credentials reuse one client."""
+        with patch.dict(os.environ, {
+            'PINECONE_API_KEY': 'test-api-key',
+            'PINECONE_ENVIRONMENT': 'us-west-2-aws'
+        }):
+            with patch('vista.vector_store.Pinecone') as mock_pinecone:
+                first = VectorStoreManager()
+                second = VectorStoreManager()
+                assert first.client is second.client
+                mock_pinecone.assert_called_once_with(api_key='test-api-key')
+    
     def test_init_authentication_failure(self):
         """Test initialization handles authentication failures."""
         with patch.dict(os.environ, {
@@ -97,7 +123,7 @@ class TestIndexManagement:
     
     def test_create_new_index(self, manager):
         """Test creating a new index."""
-        manager.client.list_indexes.return_value = []
+        manager.client.has_index.return_value = False
         mock_index = MagicMock()
         manager.client.Index.return_value = mock_index
         
@@ -105,13 +131,12 @@ class TestIndexManagement:
         
         assert manager.index_name == "test-index"
         assert manager.index == mock_index
+        manager.client.has_index.assert_called_once_with("test-index")
         manager.client.create_index.assert_called_once()
     
     def test_retrieve_existing_index(self, manager):
         """Test retrieving an existing index."""
-        mock_existing_index = MagicMock()
-        mock_existing_index.name = "test-index"
-        manager.client.list_indexes.return_value = [mock_existing_index]
+        manager.client.has_index.return_value = True
         mock_index = MagicMock()
         manager.client.Index.return_value = mock_index
         
@@ -120,6 +145,24 @@ class TestIndexManagement:
         assert manager.index_name == "test-index"
         manager.client.create_index.assert_not_called()
     
+    def test_create_index_conflict_uses_existing(self, manager):
+        """Test that an index created concurrently by another process is reused."""
+        manager.client.has_index.return_value = False
+        manager.client.create_index.side_effect = PineconeApiException(status=409, reason="Conflict")
+        
+        manager.create_collection("test-index")
+        
+        assert manager.index == manager.client.Index.return_value
+    
+    def test_create_index_error_is_raised(self, manager):
+        """Test that genuine API errors are not treated as an existing index."""
+        manager.client.has_index.side_effect = PineconeApiException(status=401, reason="Unauthorized")
+        
+        with pytest.raises(RuntimeError, match="Failed to manage index"):
+            manager.create_collection("test-index")
+        
+        manager.client.create_index.assert_not_called()
+    
     def test_reset_collection(self, manager):
         """Test resetting a collection."""
         manager.index_name = "test-index"
@@ -131,6 +174,57 @@ class TestIndexManagement:
         manager.client.delete_index.assert_called_once_with("test-index")
         manager.client.create_index.assert_called_once()
     
+    def test_reset_collection_clears_namespace(self, manager):
+        """Test that a soft reset deletes vectors without recreating the index."""
+        manager.index_name = "test-index"
+        manager.index = MagicMock()
+        
+        manager.reset_collection()
+        
+        manager.index.delete.assert_called_once_with(delete_all=True, namespace=manager.namespace)
+        manager.client.delete_index.assert_not_called()
+        manager.client.create_index.assert_not_called()
+    
+    def test_reset_collection_hard(self, manager):
+        """Test that a hard reset recreates the index with the model dimension."""
+        manager.index_name = "test-index"
+        manager.index = MagicMock()
+        
+        manager.reset_collection(hard=True)
+        
+        manager.client.delete_index.assert_called_once_with("test-index")
+        assert manager.client.create_index.call_args.kwargs["dimension"] == 384
+    
+    def test_reset_collection_hard_missing_index(self, manager):
+        """Test that a hard reset creates the index when it does not exist yet."""
+        manager.index_name = "test-index"
+        manager.client.delete_index.side_effect = NotFoundException(status=404, reason="Not Found")
+        
+        manager.reset_collection(hard=True)
+        
+        manager.client.create_index.assert_called_once()
+        assert manager.index == manager.client.Index.return_value
+    
+    def test_reset_collection_hard_delete_error(self, manager):
+        """Test that other delete failures are not treated as a missing index."""
+        manager.index_name = "test-index"
+        manager.client.delete_index.side_effect = PineconeApiException(status=403, reason="Forbidden")
+        
+        with pytest.raises(RuntimeError, match="Failed to reset collection"):
+            manager.reset_collection(hard=True)
+        
+        manager.client.create_index.assert_not_called()
+    
+    def test_create_collection_uses_configured_dimension(self, manager):
+        """Test that a new index is created with the configured dimension."""
+        manager.dimension = 768
+        manager.client.has_index.return_value = False
+        
+        manager.create_collection("test-index")
+        
+        assert manager.client.create_index.call_args.kwargs["dimension"] == 768
+        assert manager.client.create_index.call_args.kwargs["metric"] == "dotproduct"
+    
     def test_reset_collection_no_index(self, manager):
         """Test resetting when no index is initialized."""
         manager.index_name = None
@@ -173,6 +267,49 @@ class TestVectorOperations:
         
         manager.index.upsert.assert_called_once()
     
+    def test_add_chunks_batched(self, manager):
+        """Test that chunks are upserted in fixed-size batches."""
+        chunks = [
+            Chunk(text=f"Chunk {i}", document_id="doc1", chunk_index=i, metadata={})
+            for i in range(5)
+        ]
+        embeddings = [[0.1] * 384 for _ in chunks]
+        
+        manager.add_chunks(chunks, embeddings, batch_size=2)
+        
+        batch_sizes = [len(c.kwargs['vectors']) for c in manager.index.upsert.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+    
+    def test_add_chunks_converts_lists_to_float32(self, manager):
+        """Test that list embeddings are converted once to a float32 array."""
+        chunks = [
+            Chunk(text=f"Chunk {i}", document_id="doc1", chunk_index=i, metadata={})
+            for i in range(2)
+        ]
+        embeddings = [[0.1] * 384 for _ in chunks]
+        
+        manager.add_chunks(chunks, embeddings)
+        
+        vectors = manager.index.upsert.call_args.kwargs['vectors']
+        assert all(v["values"].dtype == np.float32 for v in vectors)
+    
+    def test_add_chunks_normalizes_embeddings(self, manager):
+        """Test that vectors are upserted with unit norm for the dot product metric."""
+        chunks = [Chunk(text="Test", document_id="doc1", chunk_index=0, metadata={})]
+        
+        manager.add_chunks(chunks, [[3.0, 4.0]])
+        
+        vectors = manager.index.upsert.call_args.kwargs['vectors']
+        assert vectors[0]["values"].tolist() == pytest.approx([0.6, 0.8])
+    
+    def test_query_normalizes_vector(self, manager):
+        """Test that the query vector is sent with unit norm."""
+        manager.index.query.return_value = MagicMock(matches=[])
+        
+        manager.query([3.0, 4.0], n_results=1)
+        
+        assert manager.index.query.call_args.kwargs['vector'] == pytest.approx([0.6, 0.8])
+    
     def test_add_chunks_mismatched_counts(self, manager):
         """Test adding chunks with mismatched embedding count."""
         chunks = [
@@ -232,6 +369,35 @@ class TestVectorOperations:
             manager.query([0.1] * 1536)
         assert "not initialized" in str(exc_info.value)
     
+    def test_batch_query(self, manager):
+        """Test that batched queries are issued concurrently and returned in order."""
+        def make_request(text):
+            match = MagicMock(score=0.9, metadata={"text": text})
+            request = MagicMock()
+            request.get.return_value = MagicMock(matches=[match])
+            return request
+        
+        manager.index.query.side_effect = [make_request("first"), make_request("second")]
+        
+        results = manager.batch_query([[0.1] * 384, [0.2] * 384], n_results=1)
+        
+        assert [r[0].text for r in results] == ["first", "second"]
+        assert all(c.kwargs["async_req"] for c in manager.index.query.call_args_list)
+    
+    def test_batch_query_uses_semantic_cache(self, manager):
+        """Test that cached queries are not sent to Pinecone."""
+        cached = [RetrievedChunk(text="cached", metadata={}, similarity_score=1.0)]
+        manager.semantic_cache = MagicMock()
+        manager.semantic_cache.lookup.side_effect = [cached, None]
+        request = MagicMock()
+        request.get.return_value = MagicMock(matches=[])
+        manager.index.query.return_value = request
+        
+        results = manager.batch_query([[0.1] * 384, [0.2] * 384], n_results=1)
+        
+        assert results == [cached, []]
+        manager.index.query.assert_called_once()
+    
     def test_get_collection_count(self, manager):
         """Test getting collection count."""
         mock_stats = MagicMock()
@@ -249,6 +415,65 @@ class TestVectorOperations:
         manager.index = None
         count = manager.get_collection_count()
         assert count == 0
+    
+    def test_get_collection_count_cached(self, manager, tmp_path):
+        """Test that the count is read from the cache file once written."""
+        manager.count_cache_path = tmp_path / "count"
+        mock_stats = MagicMock()
+        mock_stats.namespaces = {'default': MagicMock(vector_count=42)}
+        manager.index.describe_index_stats.return_value = mock_stats
+        
+        assert manager.get_collection_count() == 42
+        assert manager.get_collection_count() == 42
+        manager.index.describe_index_stats.assert_called_once()
+    
+    def test_add_chunks_invalidates_cached_count(self, manager, tmp_path):
+        """Test that adding chunks forces the next count to be refreshed."""
+        manager.count_cache_path = tmp_path / "count"
+        manager.count_cache_path.write_text("vista-vectors/default\n42\n0")
+        chunks = [Chunk(text="Test", document_id="doc1", chunk_index=0, metadata={})]
+        
+        manager.add_chunks(chunks, [[0.1] * 384])
+        
+        assert not manager.count_cache_path.exists()
+    
+    def test_local_state_persisted_on_flush(self, manager):
+        """Test that add_chunks defers local index and cache writes to flush."""
+        manager.local_index = MagicMock()
+        manager.semantic_cache = MagicMock()
+        chunks = [Chunk(text="Test", document_id="doc1", chunk_index=0, metadata={})]
+        
+        manager.add_chunks(chunks, [[0.1] * 384])
+        manager.add_chunks(chunks, [[0.1] * 384])
+        manager.local_index.save.assert_not_called()
+        manager.semantic_cache.clear.assert_not_called()
+        
+        manager.flush()
+        manager.local_index.save.assert_called_once()
+        manager.semantic_cache.clear.assert_called_once()
+    
+    def test_get_collection_count_cache_expires(self, manager, tmp_path):
+        """Test that a cached count older than the TTL is refreshed."""
+        manager.count_cache_path = tmp_path / "count"
+        manager.count_cache_path.write_text("vista-vectors/default\n42\n0")
+        mock_stats = MagicMock()
+        mock_stats.namespaces = {'default': MagicMock(vector_count=7)}
+        manager.index.describe_index_stats.return_value = mock_stats
+        
+        assert manager.get_collection_count() == 7
+        manager.index.describe_index_stats.assert_called_once()
+    
+    def test_get_collection_count_bypasses_cache(self, manager, tmp_path):
+        """Test that use_cache=False always queries the index stats."""
+        manager.count_cache_path = tmp_path / "count"
+        mock_stats = MagicMock()
+        mock_stats.namespaces = {'default': MagicMock(vector_count=42)}
+        manager.index.describe_index_stats.return_value = mock_stats
+        
+        manager.get_collection_count()
+        manager.get_collection_count(use_cache=False)
+        
+        assert manager.index.describe_index_stats.call_count == 2
 
 
 # ============================================================================
@@ -288,6 +513,18 @@ class TestErrorHandling:
             manager.query([0.1] * 1536)
         assert "Query failed" in str(exc_info.value)
     
+    def test_last_error_tracks_store_calls(self, manager):
+        """Test that a failed call is recorded until a call succeeds."""
+        manager.index.query.side_effect = Exception("API Error")
+        with pytest.raises(RuntimeError):
+            manager.query([0.1] * 1536)
+        assert manager.last_error == "API Error"
+        
+        manager.index.query.side_effect = None
+        manager.index.query.return_value = MagicMock(matches=[])
+        manager.query([0.1] * 1536)
+        assert manager.last_error is None
+    
     def test_reset_collection_api_error(self, manager):
         """Test handling API errors during reset."""
         manager.index_name = "test-index"
@@ -535,9 +772,7 @@ class TestVectorStoreProperties:
         
         Validates: Requirements 2.2
         """
-        mock_existing_index = MagicMock()
-        mock_existing_index.name = collection_name
-        manager.client.list_indexes.return_value = [mock_existing_index]
+        manager.client.has_index.return_value = True
         mock_index = MagicMock()
         manager.client.Index.return_value = mock_index
         
@@ -633,7 +868,7 @@ class TestVectorStoreProperties:
         vectors = call_args[1]['vectors']
         
         # Extract IDs
-        ids = [v[0] for v in vectors]
+        ids = [v["id"] for v in vectors]
         
         # Verify all IDs are unique
         assert len(ids) == len(set(ids))
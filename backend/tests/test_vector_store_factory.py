@@ -0,0 +1,51 @@
+"""Tests for the vector store factory."""
+
+from unittest.mock import patch
+
+from vista.config import Config
+from vista.faiss_store import FaissVectorStoreManager
+from vista.semantic_cache import SemanticCache
+from vista.vector_store_factory import build_vector_store
+
+
+def make_config(**overrides) -> Config:
+    """Create a configuration with test defaults."""
+    return Config(llm_provider="openai", llm_model="gpt-4o-mini", **overrides)
+
+
+class TestBuildVectorStore:
+    """Test cases for build_vector_store."""
+
+    def test_faiss_backend(self, tmp_path):
+        """Test that the faiss backend gets a FAISS store of the given dimension."""
+        config = make_config(vector_store_backend="faiss", faiss_index_path=str(tmp_path))
+
+        store = build_vector_store(config, 8)
+
+        assert isinstance(store, FaissVectorStoreManager)
+        assert store.dimension == 8
+
+    @patch('vista.vector_store_factory.VectorStoreManager')
+    def test_pinecone_backend_defaults(self, mock_manager):
+        """Test that the Pinecone store gets no semantic cache by default."""
+        config = make_config(vector_store_backend="pinecone")
+
+        build_vector_store(config, 8)
+
+        kwargs = mock_manager.call_args.kwargs
+        assert kwargs["semantic_cache"] is None
+        assert kwargs["dimension"] == 8
+        assert kwargs["count_cache_path"] == config.vector_count_cache_path
+
+    @patch('vista.vector_store_factory.VectorStoreManager')
+    def test_pinecone_backend_semantic_cache(self, mock_manager, tmp_path):
+        """Test that a positive cache size attaches a semantic cache."""
+        config = make_config(
+            vector_store_backend="pinecone",
+            semantic_cache_size=16,
+            semantic_cache_path=str(tmp_path / "semantic")
+        )
+
+        build_vector_store(config, 8)
+
+        assert isinstance(mock_manager.call_args.kwargs["semantic_cache"], SemanticCache)
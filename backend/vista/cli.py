@@ -3,7 +3,8 @@
 import logging
 import signal
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
 
 from vista.query_engine import QueryEngine
 from vista.models import QueryResponse
@@ -24,6 +25,18 @@ class CLI:
         self.running = True
         self.last_response: Optional[QueryResponse] = None
         
+        # Background work that overlaps with the user typing
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cli-prefetch")
+        
+        # Single-word commands, dispatched on the lowercased first token
+        self._commands: Dict[str, Callable[[], None]] = {
+            "exit": self._handle_exit,
+            "quit": self._handle_exit,
+            "help": self._handle_help,
+            "sources": self._handle_sources,
+            "rebuild": self._handle_rebuild,
+        }
+        
         # Set up graceful shutdown handling
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -43,6 +56,9 @@ class CLI:
         print("\nYou can also just type your question directly.")
         print("-" * 60)
         
+        # Warm the retrieval path while the user types the first question
+        self._executor.submit(self.query_engine.warmup)
+        
         while self.running:
             try:
                 # Get user input
@@ -66,6 +82,8 @@ class CLI:
                 logger.error(f"Unexpected error in CLI loop: {e}")
                 print(f"An unexpected error occurred: {e}")
                 print("Please try again or type 'exit' to quit.")
+        
+        self._executor.shutdown(wait=False)
     
     def _parse_and_execute_command(self, user_input: str) -> None:
         """Parse user input and execute the appropriate command.
@@ -73,28 +91,25 @@ class CLI:
         Args:
             user_input: Raw user input string
         """
-        # Convert to lowercase for command matching
-        input_lower = user_input.lower().strip()
-        
-        # Handle explicit commands
-        if input_lower == "exit" or input_lower == "quit":
-            self._handle_exit()
-        elif input_lower == "help":
-            self._handle_help()
-        elif input_lower == "sources":
-            self._handle_sources()
-        elif input_lower == "rebuild":
-            self._handle_rebuild()
-        elif input_lower.startswith("ask "):
-            # Extract question after "ask "
-            question = user_input[4:].strip()
-            if question:
-                self._handle_ask(question)
-            else:
-                print("Please provide a question after 'ask'.")
-        else:
-            # Treat any other input as a direct question
-            self._handle_ask(user_input)
+        # Only the first token is lowercased; questions can be long
+        parts = user_input.split(None, 1)
+        if not parts:
+            return
+        command = parts[0].lower()
+        
+        if len(parts) == 1:
+            # Handle explicit commands
+            handler = self._commands.get(command)
+            if handler is not None:
+                handler()
+                return
+        elif command == "ask":
+            # Extract question after "ask"
+            self._handle_ask(parts[1].strip())
+            return
+        
+        # Treat any other input as a direct question
+        self._handle_ask(user_input)
     
     def _handle_ask(self, question: str) -> None:
         """Handle ask command by processing the question.
@@ -7,6 +7,16 @@ from pathlib import Path
 from typing import Optional, List
 from dotenv import load_dotenv
 
+# Origins accepted in ALLOWED_ORIGINS, compiled once rather than per origin
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP address
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$',
+    re.IGNORECASE)
+
 @dataclass
 class Config:
     """System configuration loaded from environment variables."""
@@ -29,12 +39,21 @@ class Config:
     
     # Embedding Configuration
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_backend: str = "torch"
+    embedding_cache_path: Optional[str] = None
+
+    # Vector Store Configuration
+    vector_store_backend: str = "pinecone"  # 'pinecone' or 'faiss'
+    faiss_index_path: str = "./faiss_index"
+    embedding_precision: str = "fp32"  # 'fp32', 'fp16' or 'int8' in FAISS indexes
 
     # Pinecone Configuration
     pinecone_api_key: Optional[str] = None
     pinecone_environment: Optional[str] = None
     pinecone_index_name: str = "vista-vectors"
     pinecone_namespace: str = "default"
+    pinecone_batch_size: int = 200
+    vector_count_cache_path: Optional[str] = None
     
     # Directory Configuration
     data_directory: str = "./data"
@@ -42,11 +61,17 @@ class Config:
     # Chunking Configuration
     chunk_size: int = 500
     chunk_overlap: int = 50
+    chunk_workers: int = 1
     
     # Query Configuration
     max_context_tokens: int = 3000
     max_response_tokens: int = 500
     top_k_results: int = 5
+    # Opt-in: near-duplicate questions would be answered from another question's retrieval results
+    semantic_cache_size: int = 0
+    semantic_cache_path: Optional[str] = None
+    local_index_enabled: bool = False
+    local_index_path: Optional[str] = None
     
     # Retry Configuration
     max_retries: int = 3
@@ -117,16 +142,28 @@ class Config:
             gemini_api_key=gemini_api_key,
             allowed_origins=allowed_origins,
             embedding_model=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+            embedding_backend=os.getenv("EMBEDDING_BACKEND", "torch").lower(),
+            embedding_cache_path=os.getenv("EMBEDDING_CACHE_PATH") or None,
             data_directory=os.getenv("DATA_DIRECTORY", "./data"),
+            vector_store_backend=os.getenv("VECTOR_STORE_BACKEND", "pinecone").lower(),
+            faiss_index_path=os.getenv("FAISS_INDEX_PATH", "./faiss_index"),
+            embedding_precision=os.getenv("EMBEDDING_PRECISION", "fp32").lower(),
             pinecone_api_key=pinecone_api_key,
             pinecone_environment=pinecone_environment,
             pinecone_index_name=pinecone_index_name,
             pinecone_namespace=pinecone_namespace,
+            pinecone_batch_size=int(os.getenv("PINECONE_BATCH_SIZE", "200")),
+            vector_count_cache_path=os.getenv("VECTOR_COUNT_CACHE_PATH") or None,
             chunk_size=int(os.getenv("CHUNK_SIZE", "500")),
             chunk_overlap=int(os.getenv("CHUNK_OVERLAP", "50")),
+            chunk_workers=int(os.getenv("CHUNK_WORKERS", "1")),
             max_context_tokens=int(os.getenv("MAX_CONTEXT_TOKENS", "3000")),
             max_response_tokens=int(os.getenv("MAX_RESPONSE_TOKENS", "500")),
             top_k_results=int(os.getenv("TOP_K_RESULTS", "5")),
+            semantic_cache_size=int(os.getenv("SEMANTIC_CACHE_SIZE", "0")),
+            semantic_cache_path=os.getenv("SEMANTIC_CACHE_PATH") or None,
+            local_index_enabled=os.getenv("LOCAL_INDEX_ENABLED", "false").lower() == "true",
+            local_index_path=os.getenv("LOCAL_INDEX_PATH") or None,
             max_retries=int(os.getenv("MAX_RETRIES", "3"))
         )
         
@@ -172,11 +209,23 @@ class Config:
             elif not self._is_valid_gemini_key(self.gemini_api_key):
                 errors.append("GEMINI_API_KEY format is invalid (should start with 'AIza')")
                 
+        # Validate embedding backend
+        if self.embedding_backend not in ["torch", "onnx", "openvino"]:
+            errors.append(f"EMBEDDING_BACKEND must be 'torch', 'onnx', or 'openvino', got '{self.embedding_backend}'")
+                
+        # Validate vector store backend
+        if self.vector_store_backend not in ["pinecone", "faiss"]:
+            errors.append(f"VECTOR_STORE_BACKEND must be 'pinecone' or 'faiss', got '{self.vector_store_backend}'")
+        
+        if self.embedding_precision not in ["fp32", "fp16", "int8"]:
+            errors.append(f"EMBEDDING_PRECISION must be 'fp32', 'fp16', or 'int8', got '{self.embedding_precision}'")
+        
         # Validate Pinecone Configuration
-        if not self.pinecone_api_key:
-            errors.append("PINECONE_API_KEY is required")
-        if not self.pinecone_environment:
-            errors.append("PINECONE_ENVIRONMENT is required")
+        if self.vector_store_backend == "pinecone":
+            if not self.pinecone_api_key:
+                errors.append("PINECONE_API_KEY is required")
+            if not self.pinecone_environment:
+                errors.append("PINECONE_ENVIRONMENT is required")
         
         # Validate CORS origins in production
         if self.environment == "production":
@@ -199,6 +248,9 @@ class Config:
         if self.chunk_overlap >= self.chunk_size:
             errors.append(f"CHUNK_OVERLAP ({self.chunk_overlap}) must be less than CHUNK_SIZE ({self.chunk_size})")
         
+        if self.chunk_workers <= 0:
+            errors.append(f"CHUNK_WORKERS must be positive, got {self.chunk_workers}")
+        
         if self.max_context_tokens <= 0:
             errors.append(f"MAX_CONTEXT_TOKENS must be positive, got {self.max_context_tokens}")
         
@@ -208,6 +260,12 @@ class Config:
         if self.top_k_results <= 0:
             errors.append(f"TOP_K_RESULTS must be positive, got {self.top_k_results}")
         
+        if self.pinecone_batch_size <= 0:
+            errors.append(f"PINECONE_BATCH_SIZE must be positive, got {self.pinecone_batch_size}")
+        
+        if self.semantic_cache_size < 0:
+            errors.append(f"SEMANTIC_CACHE_SIZE must be non-negative, got {self.semantic_cache_size}")
+        
         if self.max_retries < 0:
             errors.append(f"MAX_RETRIES must be non-negative, got {self.max_retries}")
         
@@ -234,15 +292,7 @@ class Config:
     @staticmethod
     def _is_valid_url(url: str) -> bool:
         """Check if URL format is valid."""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP address
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$',
-            re.IGNORECASE)
-        return url_pattern.match(url) is not None
+        return _URL_PATTERN.match(url) is not None
     
     def get_api_key(self) -> str:
         """Get the API key for the configured LLM provider.
@@ -1,85 +1,126 @@
 """Document loading functionality for the Vista."""
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import Deque, Dict, Iterator, Optional
 import logging
+import sys
 
 from vista.models import Document
 
 logger = logging.getLogger(__name__)
 
+# Files read ahead of the consumer, per worker thread
+READ_AHEAD_PER_WORKER = 2
+
 
 class DocumentLoader:
     """Loads and parses text files from a directory structure."""
     
-    def load_documents(self, data_dir: str) -> List[Document]:
+    def __init__(self, max_workers: int = 16):
+        """Initialize the loader.
+        
+        Args:
+            max_workers: Number of threads used to read files concurrently
+        """
+        self.max_workers = max_workers
+    
+    def load_documents(self, data_dir: str) -> Iterator[Document]:
         """Load all text files from directory recursively.
         
+        Files are read concurrently and yielded in discovery order as they
+        become available, so callers can process documents while the
+        remaining files are still being read. At most
+        ``READ_AHEAD_PER_WORKER * max_workers`` reads are in flight, so a slow
+        consumer never pulls the whole corpus into memory.
+        
         Args:
             data_dir: Path to the data directory
             
-        Returns:
-            List of Document objects
+        Yields:
+            Document objects
         """
-        documents = []
         data_path = Path(data_dir)
         
         if not data_path.exists():
             logger.error(f"Data directory does not exist: {data_dir}")
-            return documents
+            return
         
-        # Recursively find all .txt files
-        for file_path in data_path.rglob("*.txt"):
-            try:
-                # Read file content
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Extract metadata
-                metadata = self._extract_metadata(str(file_path))
-                
-                # Create Document object
-                document = Document(
-                    content=content,
-                    file_path=str(file_path),
-                    category=metadata['category'],
-                    filename=metadata['filename']
+        # Recursively find all .txt files, lazily so discovery is streamed too
+        file_paths = data_path.rglob("*.txt")
+        max_in_flight = READ_AHEAD_PER_WORKER * self.max_workers
+        
+        loaded_count = 0
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            read_one = partial(self._read_one, data_root=data_path)
+            while True:
+                # Top up the reads in flight before waiting on the oldest one
+                pending.extend(
+                    executor.submit(read_one, file_path)
+                    for file_path in islice(file_paths, max_in_flight - len(pending))
                 )
-                documents.append(document)
-                logger.info(f"Loaded document: {file_path}")
+                if not pending:
+                    break
                 
-            except Exception as e:
-                # Log error and continue with remaining files
-                logger.error(f"Failed to load file {file_path}: {e}")
-                continue
+                document = pending.popleft().result()
+                if document is not None:
+                    loaded_count += 1
+                    yield document
         
-        logger.info(f"Successfully loaded {len(documents)} documents")
-        return documents
+        logger.info(f"Successfully loaded {loaded_count} documents")
     
-    def _extract_metadata(self, file_path: str) -> Dict[str, str]:
-        """Extract category and metadata from file path.
+    def _read_one(self, file_path: Path, data_root: Path) -> Optional[Document]:
+        """Read a single text file into a Document.
         
         Args:
             file_path: Path to the file
+            data_root: Data directory the file was found under
             
         Returns:
-            Dictionary containing metadata (category, filename)
+            Document object, or None if the file could not be loaded
         """
-        path = Path(file_path)
-        filename = path.name
+        try:
+            # Decoding the raw bytes avoids the text IO layer
+            content = file_path.read_bytes().decode('utf-8')
+            
+            # Extract metadata
+            metadata = self._extract_metadata(file_path, data_root)
+            
+            # Intern repeated metadata strings so every chunk shares one copy
+            document = Document(
+                content=content,
+                file_path=sys.intern(str(file_path)),
+                category=sys.intern(metadata['category']),
+                filename=sys.intern(metadata['filename'])
+            )
+            logger.info("Loaded document: %s", file_path)
+            return document
+        except Exception as e:
+            # Log error and continue with remaining files
+            logger.error(f"Failed to load file {file_path}: {e}")
+            return None
+    
+    def _extract_metadata(self, file_path: Path, data_root: Path) -> Dict[str, str]:
+        """Extract category and metadata from file path.
         
-        # Extract category from parent directory
+        Args:
+            file_path: Path to the file, located under data_root
+            data_root: Data directory the file was found under
+            
+        Returns:
+            Dictionary containing metadata (category, filename)
+        """
+        # Category is the top-level directory below the data root
         # For example: data/projects/file.txt -> category: "projects"
-        # For example: data/static/file.txt -> category: "static"
-        parts = path.parts
-        
-        # Find the category (directory immediately after 'data')
-        category = "unknown"
-        for i, part in enumerate(parts):
-            if part == "data" and i + 1 < len(parts):
-                category = parts[i + 1]
-                break
+        # For example: data/file.txt -> category: "unknown"
+        relative_parts = file_path.relative_to(data_root).parts
+        category = relative_parts[0] if len(relative_parts) > 1 else "unknown"
         
         return {
             'category': category,
-            'filename': filename
+            'filename': file_path.name
         }
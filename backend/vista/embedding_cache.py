@@ -0,0 +1,95 @@
+"""On-disk cache of chunk embeddings for the Vista."""
+
+import hashlib
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Caches chunk embeddings on disk, keyed by a hash of the chunk text.
+
+    Rebuilding the knowledge base re-embeds only chunks whose text changed.
+    Entries are stored per model, one ``.npy`` file per chunk under
+    ``{cache_dir}/{model}/{key[:2]}/{key}.npy``.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Root directory of the cache
+            model_name: Embedding model name; entries of different models are
+                kept apart
+        """
+        # Model names like "sentence-transformers/all-MiniLM-L6-v2" contain slashes
+        model_dir = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        self.cache_dir = Path(cache_dir) / model_dir
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_embed(self, texts: List[str],
+                     embed: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Return embeddings for texts, computing only those not cached.
+
+        Args:
+            texts: Texts to embed
+            embed: Function embedding a list of texts into a 2-D array
+
+        Returns:
+            Float32 array with one embedding per text, in input order
+        """
+        if not texts:
+            return embed([])
+
+        keys = [self._key(text) for text in texts]
+        cached = [self._load(key) for key in keys]
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            new_embeddings = embed([texts[i] for i in missing])
+            for i, embedding in zip(missing, new_embeddings):
+                cached[i] = embedding
+                self._store(keys[i], embedding)
+
+        return np.stack(cached).astype(np.float32, copy=False)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        """Hash chunk text into a cache key."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Path of the file holding a cache entry."""
+        return self.cache_dir / key[:2] / f"{key}.npy"
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        """Load a cached embedding, or None if absent or unreadable."""
+        try:
+            return np.load(self._path(key))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache entry {key}: {e}")
+            return None
+
+    def _store(self, key: str, embedding: np.ndarray) -> None:
+        """Write an embedding atomically, so readers never see partial files."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(embedding, dtype=np.float32))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache embedding {key}: {e}")
@@ -1,74 +1,215 @@
 """Embedding generation functionality for the Vista."""
 
-from typing import List
+from typing import List, Optional
 import logging
+import queue
+import threading
+import time
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Inference backends supported by SentenceTransformer
+SUPPORTED_BACKENDS = ("torch", "onnx", "openvino")
+
+
+class _PendingEmbedding:
+    """A single text waiting to be embedded by the batching worker."""
+
+    __slots__ = ("text", "done", "result", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
 
 class EmbeddingGenerator:
-    """Converts text chunks into vector embeddings using sentence-transformers."""
-    
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    """Converts text chunks into vector embeddings using sentence-transformers.
+
+    All embeddings are L2-normalized, so cosine similarity is a dot product.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", max_batch: int = 32,
+                 max_delay_ms: float = 5.0, backend: str = "torch", warmup: bool = True):
         """Initialize with sentence-transformers model.
-        
+
         Args:
             model_name: Name of the sentence-transformers model
-            
+            max_batch: Maximum number of single-text requests coalesced into
+                one encode call
+            max_delay_ms: Maximum time the batching worker waits for more
+                requests before encoding a partial batch
+            backend: Inference backend ('torch', 'onnx' or 'openvino'); the
+                non-torch backends require sentence-transformers[onnx] or
+                sentence-transformers[openvino]
+            warmup: Whether to run a dummy encode so the first real request
+                does not pay model initialization costs
+
         Raises:
+            ValueError: If the backend is not supported
             Exception: If model fails to load
         """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"Unsupported embedding backend: {backend}. Must be one of {SUPPORTED_BACKENDS}")
+
         self.model_name = model_name
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self.backend = backend
         try:
-            logger.info(f"Loading embedding model: {model_name}")
-            self.model = SentenceTransformer(model_name)
+            logger.info(f"Loading embedding model: {model_name} (backend: {backend})")
+            if backend == "torch":
+                self.model = SentenceTransformer(model_name)
+            else:
+                self.model = SentenceTransformer(model_name, backend=backend)
             logger.info(f"Successfully loaded embedding model: {model_name}")
         except Exception as e:
             logger.error(f"Failed to load embedding model {model_name}: {e}")
             raise
-    
-    def generate_embedding(self, text: str) -> List[float]:
+
+        if warmup:
+            self._warmup()
+
+        # Micro-batching state; the worker thread is started on first use
+        self._queue: "queue.Queue[_PendingEmbedding]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the embeddings produced by the model."""
+        return self.model.get_sentence_embedding_dimension()
+
+    def generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding vector for text.
-        
+
+        Concurrent calls are coalesced by a background worker into a single
+        batched encode call, amortizing the per-call model overhead.
+
         Args:
             text: Text to embed
-            
+
         Returns:
-            Embedding vector as list of floats
-            
+            Embedding vector as a float32 array
+
         Raises:
             Exception: If embedding generation fails
         """
         try:
-            # Generate embedding and convert to list
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.tolist()
+            return self._submit(text)
         except Exception as e:
             logger.error(f"Failed to generate embedding for text: {e}")
             raise
-    
-    def generate_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for multiple texts efficiently.
-        
+
         Uses batch processing for improved performance.
-        
+
         Args:
             texts: List of texts to embed
-            
+
         Returns:
-            List of embedding vectors
-            
+            Float32 array with one embedding vector per row
+
         Raises:
             Exception: If batch embedding generation fails
         """
         if not texts:
-            return []
-        
+            return np.empty((0, self.dimension), dtype=np.float32)
+
         try:
-            # Generate embeddings in batch for efficiency
-            embeddings = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
-            return [embedding.tolist() for embedding in embeddings]
+            # Generate embeddings in batch for efficiency; the array is handed to
+            # the vector store as-is to avoid boxing every float into a list
+            return self.model.encode(
+                texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=64,
+                show_progress_bar=False
+            )
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             raise
+
+    def _warmup(self) -> None:
+        """Run a dummy encode to move one-time initialization off the hot path."""
+        try:
+            self.model.encode(["warmup"], convert_to_numpy=True, show_progress_bar=False)
+            logger.info("Embedding model warmed up")
+        except Exception as e:
+            logger.warning(f"Embedding model warmup failed: {e}")
+
+    def _submit(self, text: str) -> np.ndarray:
+        """Queue a text for the batching worker and wait for its embedding.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector as a float32 array
+        """
+        self._ensure_worker()
+        pending = _PendingEmbedding(text)
+        self._queue.put(pending)
+        pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _ensure_worker(self) -> None:
+        """Start the batching worker thread if it is not running."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="embedding-batcher",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        """Collect queued requests into batches and encode them."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay_ms / 1000.0
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch: List[_PendingEmbedding]) -> None:
+        """Encode a batch of pending requests and wake their callers.
+
+        Args:
+            batch: Pending requests to fulfill
+        """
+        try:
+            embeddings = self.model.encode(
+                [pending.text for pending in batch],
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=self.max_batch,
+                show_progress_bar=False
+            )
+            for pending, embedding in zip(batch, embeddings):
+                pending.result = embedding
+        except Exception as e:
+            for pending in batch:
+                pending.error = e
+        finally:
+            for pending in batch:
+                pending.done.set()
@@ -1,16 +1,33 @@
 """Error tracking and dashboard configuration for production."""
 
+import bisect
 import logging
+import sys
+import threading
+import time
 import traceback
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from collections import defaultdict
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+from datetime import datetime, timezone
+from collections import Counter, deque
+from itertools import islice
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+def to_unix_seconds(value: datetime) -> float:
+    """Convert a datetime, naive values being UTC, to Unix seconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def from_unix_seconds(seconds: float) -> datetime:
+    """Convert Unix seconds to a naive UTC datetime."""
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+
+
 class ErrorSeverity(str, Enum):
     """Error severity levels."""
     LOW = "low"
@@ -19,26 +36,55 @@ class ErrorSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(ErrorSeverity)}
+
+# Plain string per severity; enum hashing also resolves raw "low"/"high" values
+_SEVERITY_VALUES = {severity: severity.value for severity in ErrorSeverity}
+
+
+@dataclass(slots=True)
 class ErrorEvent:
-    """Represents a single error event."""
+    """Represents a single error event.
+
+    The timestamp is stored as Unix seconds; a naive UTC datetime passed in is
+    converted on construction. The stack trace is kept unformatted and only
+    rendered to a string when first read.
+    """
     error_type: str
     message: str
-    timestamp: datetime
+    timestamp: Union[float, datetime]
     severity: ErrorSeverity
-    stack_trace: Optional[str] = None
+    exception_trace: Optional[traceback.TracebackException] = field(default=None, repr=False, compare=False)
     context: Dict[str, Any] = field(default_factory=dict)
     request_id: Optional[str] = None
     endpoint: Optional[str] = None
     user_id: Optional[str] = None
+    _stack_trace: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Normalize a datetime timestamp to Unix seconds."""
+        if isinstance(self.timestamp, datetime):
+            self.timestamp = to_unix_seconds(self.timestamp)
+    
+    @property
+    def stack_trace(self) -> Optional[str]:
+        """Formatted stack trace, or None if none was captured."""
+        if self._stack_trace is None and self.exception_trace is not None:
+            self._stack_trace = "".join(self.exception_trace.format())
+        return self._stack_trace
+    
+    @property
+    def occurred_at(self) -> datetime:
+        """Time of the error as a naive UTC datetime."""
+        return from_unix_seconds(self.timestamp)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "error_type": self.error_type,
             "message": self.message,
-            "timestamp": self.timestamp.isoformat(),
-            "severity": self.severity,
+            "timestamp": self.occurred_at.isoformat(),
+            "severity": _SEVERITY_VALUES[self.severity],
             "stack_trace": self.stack_trace,
             "context": self.context,
             "request_id": self.request_id,
@@ -47,7 +93,7 @@ class ErrorEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorStats:
     """Statistics about errors."""
     total_errors: int = 0
@@ -74,16 +120,179 @@ class ErrorStats:
 class ErrorTracker:
     """Tracks and aggregates error events."""
     
-    def __init__(self, max_events: int = 10000):
+    def __init__(self, max_events: int = 10000, capture_stack: bool = True, stack_limit: int = 20,
+                 min_stack_severity: ErrorSeverity = ErrorSeverity.LOW):
         """Initialize error tracker.
         
         Args:
             max_events: Maximum number of events to keep in memory
+            capture_stack: Whether to capture stack traces at all
+            stack_limit: Maximum number of frames captured per stack trace
+            min_stack_severity: Lowest severity for which stack traces are captured
+
+        Raises:
+            ValueError: If max_events is not positive
         """
+        if max_events <= 0:
+            raise ValueError("max_events must be positive")
+
         self.logger = logging.getLogger(__name__)
         self.max_events = max_events
-        self.error_events: List[ErrorEvent] = []
+        self.capture_stack = capture_stack
+        self.stack_limit = stack_limit
+        self.min_stack_severity = min_stack_severity
+        # Resolved once so track_error does a single set lookup per event
+        self._stack_severities = frozenset(
+            severity for severity in ErrorSeverity
+            if capture_stack and _SEVERITY_RANK[severity] >= _SEVERITY_RANK[min_stack_severity]
+        )
+        # Ring buffer: _head is the next slot to write, _count the number of live events
+        self._buf: List[Optional[ErrorEvent]] = [None] * max_events
+        self._head = 0
+        self._count = 0
+        # False once an event is stored with an earlier timestamp than the newest one
+        self._sorted = True
+        # Bumped on every change to the stored events, so readers can cache
+        self._version = 0
+        # Aggregates over the live events, kept in step with the buffer
+        self._by_type: Counter = Counter()
+        self._by_severity: Counter = Counter()
+        self._by_endpoint: Counter = Counter()
+        # Live events per Unix minute, for trends without rescanning events
+        self._by_minute: Counter = Counter()
+        # Live events per filter key, oldest first, so filters skip the full scan
+        self._events_by_type: Dict[str, Deque[ErrorEvent]] = {}
+        self._events_by_severity: Dict[ErrorSeverity, Deque[ErrorEvent]] = {}
+        self._events_by_endpoint: Dict[str, Deque[ErrorEvent]] = {}
+        self._events_by_request_id: Dict[str, Deque[ErrorEvent]] = {}
         self.start_time = datetime.utcnow()
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the tracked events change."""
+        return self._version
+
+    @property
+    def error_events(self) -> List[ErrorEvent]:
+        """Tracked events, oldest first."""
+        return self._newest(self._count)
+
+    def _newest(self, n: int) -> List[ErrorEvent]:
+        """The n newest events, oldest first, copied with at most two slices."""
+        if n <= 0:
+            return []
+        start = self._head - n
+        if start >= 0:
+            return self._buf[start:self._head]
+        return self._buf[start:] + self._buf[:self._head]
+
+    def _append(self, event: ErrorEvent) -> None:
+        """Store an event, overwriting the oldest one once the buffer is full."""
+        if self._count and event.timestamp < self._buf[self._head - 1].timestamp:
+            self._sorted = False
+        if self._count == self.max_events:
+            self._remove_from_aggregates(self._buf[self._head])
+        self._add_to_aggregates(event)
+        self._buf[self._head] = event
+        self._head = (self._head + 1) % self.max_events
+        self._version += 1
+        if self._count < self.max_events:
+            self._count += 1
+
+    def _extend(self, events: List[ErrorEvent]) -> None:
+        """Store a batch of events, overwriting the oldest ones as needed."""
+        events = events[-self.max_events:]
+        n = len(events)
+        if not n:
+            return
+
+        # The batch overwrites the oldest events once the buffer is full
+        overflow = self._count + n - self.max_events
+        if overflow > 0:
+            start = self._head - self._count
+            for i in range(overflow):
+                self._remove_from_aggregates(self._buf[(start + i) % self.max_events])
+            self._count -= overflow
+
+        previous = self._buf[self._head - 1] if self._count else events[0]
+        for event in events:
+            if event.timestamp < previous.timestamp:
+                self._sorted = False
+            previous = event
+            for index, key in self._index_keys(event):
+                index.setdefault(key, deque()).append(event)
+        self._by_type.update(e.error_type for e in events)
+        self._by_severity.update(e.severity for e in events)
+        self._by_endpoint.update(e.endpoint for e in events if e.endpoint)
+        self._by_minute.update(int(e.timestamp // 60) for e in events)
+
+        # Copy into the ring in at most two slices
+        first = min(n, self.max_events - self._head)
+        self._buf[self._head:self._head + first] = events[:first]
+        self._buf[:n - first] = events[first:]
+        self._head = (self._head + n) % self.max_events
+        self._count += n
+        self._version += 1
+
+    def _count_up_to(self, cutoff: float) -> int:
+        """Number of events stamped at or before cutoff; requires sorted events."""
+        # Events are in timestamp order, so they form a prefix of the buffer
+        start = self._head - self._count
+        buf = self._buf
+        max_events = self.max_events
+        return bisect.bisect_right(
+            range(self._count), cutoff, key=lambda i: buf[(start + i) % max_events].timestamp
+        )
+
+    def _add_to_aggregates(self, event: ErrorEvent) -> None:
+        """Count and index a newly stored event."""
+        # Branches are inlined here rather than going through _index_keys, so
+        # the per-event write path allocates no key lists
+        self._by_type[event.error_type] += 1
+        self._by_severity[event.severity] += 1
+        self._by_minute[int(event.timestamp // 60)] += 1
+        self._events_by_type.setdefault(event.error_type, deque()).append(event)
+        self._events_by_severity.setdefault(event.severity, deque()).append(event)
+        if event.endpoint:
+            self._by_endpoint[event.endpoint] += 1
+            self._events_by_endpoint.setdefault(event.endpoint, deque()).append(event)
+        if event.request_id:
+            self._events_by_request_id.setdefault(event.request_id, deque()).append(event)
+
+    def _remove_from_aggregates(self, event: ErrorEvent) -> None:
+        """Uncount and unindex the oldest stored event."""
+        counts = [(self._by_type, event.error_type), (self._by_severity, event.severity)]
+        if event.endpoint:
+            counts.append((self._by_endpoint, event.endpoint))
+        counts.append((self._by_minute, int(event.timestamp // 60)))
+        for counter, key in counts:
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+        # Events are evicted oldest first, so they are at the front of each index
+        for index, key in self._index_keys(event):
+            events = index[key]
+            events.popleft()
+            if not events:
+                del index[key]
+
+    def _index_keys(self, event: ErrorEvent) -> List[tuple]:
+        """Filter indexes an event belongs to, with its key in each."""
+        keys = [(self._events_by_type, event.error_type), (self._events_by_severity, event.severity)]
+        if event.endpoint:
+            keys.append((self._events_by_endpoint, event.endpoint))
+        if event.request_id:
+            keys.append((self._events_by_request_id, event.request_id))
+        return keys
+
+    @staticmethod
+    def _latest(index: Dict[Hashable, Deque[ErrorEvent]], key: Hashable, limit: int) -> List[ErrorEvent]:
+        """Newest events under an index key, oldest first."""
+        events = index.get(key)
+        if not events:
+            return []
+        return list(islice(reversed(events), limit))[::-1]
     
     def track_error(self, error: Exception, severity: ErrorSeverity = ErrorSeverity.MEDIUM,
                    context: Optional[Dict[str, Any]] = None, request_id: Optional[str] = None,
@@ -101,74 +310,104 @@ class ErrorTracker:
         Returns:
             ErrorEvent instance
         """
-        error_type = type(error).__name__
-        message = str(error)
-        stack_trace = traceback.format_exc()
+        event = self._build_event(error, severity, context, request_id, endpoint, user_id)
+        self._append(event)
+        
+        self.logger.error(f"Error tracked: {event.error_type} - {event.message}")
+        
+        return event
+    
+    def track_errors(self, errors: Iterable[Tuple[Exception, Dict[str, Any]]]) -> List[ErrorEvent]:
+        """Track a batch of error events.
         
-        event = ErrorEvent(
+        Args:
+            errors: Pairs of an exception and the keyword arguments track_error
+                would take for it (severity, context, request_id, endpoint, user_id)
+            
+        Returns:
+            List of ErrorEvent instances, in input order
+        """
+        events = [self._build_event(error, **kwargs) for error, kwargs in errors]
+        self._extend(events)
+        
+        if events:
+            self.logger.error("Errors tracked: %d events", len(events))
+        
+        return events
+    
+    def _build_event(self, error: Exception, severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+                     context: Optional[Dict[str, Any]] = None, request_id: Optional[str] = None,
+                     endpoint: Optional[str] = None, user_id: Optional[str] = None) -> ErrorEvent:
+        """Create the event recorded for an exception."""
+        # Types and endpoints repeat across events, so share one string per value
+        error_type = sys.intern(type(error).__name__)
+        endpoint = sys.intern(endpoint) if endpoint else endpoint
+        message = str(error)
+        exception_trace = None
+        if severity in self._stack_severities:
+            # Source lines are looked up and formatted only if the trace is read
+            exception_trace = traceback.TracebackException.from_exception(
+                error, limit=self.stack_limit, lookup_lines=False
+            )
+        
+        return ErrorEvent(
             error_type=error_type,
             message=message,
-            timestamp=datetime.utcnow(),
+            timestamp=time.time(),
             severity=severity,
-            stack_trace=stack_trace,
+            exception_trace=exception_trace,
             context=context or {},
             request_id=request_id,
             endpoint=endpoint,
             user_id=user_id
         )
-        
-        self.error_events.append(event)
-        
-        # Keep only max_events
-        if len(self.error_events) > self.max_events:
-            self.error_events = self.error_events[-self.max_events:]
-        
-        self.logger.error(f"Error tracked: {error_type} - {message}")
-        
-        return event
     
-    def get_stats(self, time_window_minutes: int = 60) -> ErrorStats:
+    def get_stats(self, time_window_minutes: Optional[int] = 60) -> ErrorStats:
         """Get error statistics.
         
         Args:
-            time_window_minutes: Time window for statistics (in minutes)
+            time_window_minutes: Time window for recent errors and the error
+                rate (in minutes); None covers all tracked errors
             
         Returns:
             ErrorStats instance
         """
-        cutoff_time = datetime.utcnow() - timedelta(minutes=time_window_minutes)
-        recent_events = [e for e in self.error_events if e.timestamp > cutoff_time]
-        
         stats = ErrorStats()
-        stats.total_errors = len(self.error_events)
+        stats.total_errors = self._count
         
-        # Count errors by type
-        errors_by_type = defaultdict(int)
-        errors_by_severity = defaultdict(int)
-        errors_by_endpoint = defaultdict(int)
-        
-        for event in self.error_events:
-            errors_by_type[event.error_type] += 1
-            errors_by_severity[event.severity] += 1
-            if event.endpoint:
-                errors_by_endpoint[event.endpoint] += 1
-        
-        stats.errors_by_type = dict(errors_by_type)
-        stats.errors_by_severity = dict(errors_by_severity)
-        stats.errors_by_endpoint = dict(errors_by_endpoint)
-        
-        # Get recent errors (last 100)
-        stats.recent_errors = recent_events[-100:]
+        # Counters are maintained by track_error, so no rescan is needed
+        stats.errors_by_type = dict(self._by_type)
+        stats.errors_by_severity = {
+            _SEVERITY_VALUES[severity]: count for severity, count in self._by_severity.items()
+        }
+        stats.errors_by_endpoint = dict(self._by_endpoint)
+        
+        # Recent errors (last 100) and the first timestamp in the window
+        if time_window_minutes is not None and not self._sorted:
+            cutoff_time = time.time() - time_window_minutes * 60
+            window = [e for e in self.error_events if e.timestamp > cutoff_time]
+            window_count = len(window)
+            stats.recent_errors = window[-100:]
+            first_timestamp = window[0].timestamp if window else None
+        else:
+            # Sorted events: the window is a suffix of the buffer, read in place
+            window_count = self._count
+            if time_window_minutes is not None:
+                window_count -= self._count_up_to(time.time() - time_window_minutes * 60)
+            stats.recent_errors = self._newest(min(window_count, 100))
+            first_timestamp = None
+            if window_count:
+                first_timestamp = self._buf[(self._head - window_count) % self.max_events].timestamp
         
         # Calculate error rate per minute
-        if recent_events:
-            time_span_minutes = (recent_events[-1].timestamp - recent_events[0].timestamp).total_seconds() / 60
+        if window_count:
+            time_span_minutes = (stats.recent_errors[-1].timestamp - first_timestamp) / 60
             if time_span_minutes > 0:
-                stats.error_rate_per_minute = len(recent_events) / time_span_minutes
+                stats.error_rate_per_minute = window_count / time_span_minutes
         
         # Find most common error
-        if errors_by_type:
-            stats.most_common_error = max(errors_by_type, key=errors_by_type.get)
+        if self._by_type:
+            stats.most_common_error = self._by_type.most_common(1)[0][0]
         
         return stats
     
@@ -182,8 +421,7 @@ class ErrorTracker:
         Returns:
             List of ErrorEvent instances
         """
-        matching = [e for e in self.error_events if e.error_type == error_type]
-        return matching[-limit:]
+        return self._latest(self._events_by_type, error_type, limit)
     
     def get_errors_by_severity(self, severity: ErrorSeverity, limit: int = 100) -> List[ErrorEvent]:
         """Get errors of a specific severity.
@@ -195,8 +433,7 @@ class ErrorTracker:
         Returns:
             List of ErrorEvent instances
         """
-        matching = [e for e in self.error_events if e.severity == severity]
-        return matching[-limit:]
+        return self._latest(self._events_by_severity, severity, limit)
     
     def get_errors_by_endpoint(self, endpoint: str, limit: int = 100) -> List[ErrorEvent]:
         """Get errors from a specific endpoint.
@@ -208,8 +445,7 @@ class ErrorTracker:
         Returns:
             List of ErrorEvent instances
         """
-        matching = [e for e in self.error_events if e.endpoint == endpoint]
-        return matching[-limit:]
+        return self._latest(self._events_by_endpoint, endpoint, limit)
     
     def get_errors_by_request_id(self, request_id: str) -> List[ErrorEvent]:
         """Get all errors for a specific request.
@@ -220,7 +456,15 @@ class ErrorTracker:
         Returns:
             List of ErrorEvent instances
         """
-        return [e for e in self.error_events if e.request_id == request_id]
+        return list(self._events_by_request_id.get(request_id, ()))
+    
+    def get_counts_by_minute(self) -> Dict[int, int]:
+        """Get the number of tracked errors per minute.
+        
+        Returns:
+            Dictionary mapping Unix minutes (seconds // 60) to error counts
+        """
+        return dict(self._by_minute)
     
     def get_recent_errors(self, limit: int = 100) -> List[ErrorEvent]:
         """Get most recent errors.
@@ -231,7 +475,20 @@ class ErrorTracker:
         Returns:
             List of ErrorEvent instances
         """
-        return self.error_events[-limit:]
+        return self._newest(min(limit, self._count))
+    
+    def iter_recent_errors(self, limit: int = 100) -> Iterator[ErrorEvent]:
+        """Iterate over the most recent errors without building a list.
+        
+        Args:
+            limit: Maximum number of errors to yield
+            
+        Yields:
+            ErrorEvent instances, oldest first
+        """
+        n = min(limit, self._count)
+        for i in range(n, 0, -1):
+            yield self._buf[(self._head - i) % self.max_events]
     
     def clear_old_errors(self, days: int = 7) -> int:
         """Clear errors older than specified days.
@@ -242,19 +499,49 @@ class ErrorTracker:
         Returns:
             Number of errors removed
         """
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
-        original_count = len(self.error_events)
-        self.error_events = [e for e in self.error_events if e.timestamp > cutoff_time]
-        removed = original_count - len(self.error_events)
+        cutoff_time = time.time() - days * 86400
+        
+        if self._sorted:
+            removed = self._count_up_to(cutoff_time)
+            start = self._head - self._count
+            for i in range(removed):
+                slot = (start + i) % self.max_events
+                self._remove_from_aggregates(self._buf[slot])
+                self._buf[slot] = None
+            self._count -= removed
+            self._version += 1
+        else:
+            kept = [e for e in self.error_events if e.timestamp > cutoff_time]
+            removed = self._count - len(kept)
+            # Rebuild the aggregates in one batch rather than event by event
+            self._clear()
+            self._extend(kept)
+        
         self.logger.info(f"Cleared {removed} errors older than {days} days")
         return removed
     
     def reset(self) -> None:
         """Reset all error tracking."""
-        self.error_events = []
+        self._clear()
         self.start_time = datetime.utcnow()
         self.logger.info("Error tracking reset")
 
+    def _clear(self) -> None:
+        """Drop all events and rewind the ring buffer."""
+        self._buf = [None] * self.max_events
+        self._head = 0
+        self._count = 0
+        self._sorted = True
+        self._version += 1
+        self._by_type.clear()
+        self._by_severity.clear()
+        self._by_endpoint.clear()
+        self._by_minute.clear()
+        self._events_by_type.clear()
+        self._events_by_severity.clear()
+        self._events_by_endpoint.clear()
+        self._events_by_request_id.clear()
+
 
 class ErrorDashboard:
     """Provides error dashboard data and visualization."""
@@ -267,6 +554,8 @@ class ErrorDashboard:
         """
         self.logger = logging.getLogger(__name__)
         self.error_tracker = error_tracker
+        # Summary kind -> (tracker version it was built at, summaries)
+        self._summary_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get complete dashboard data.
@@ -301,33 +590,26 @@ class ErrorDashboard:
         Returns:
             Dictionary with error trend data
         """
-        now = datetime.utcnow()
-        start_time = now - timedelta(hours=hours)
-        
-        # Create time buckets
-        buckets = {}
-        current = start_time
-        while current < now:
-            bucket_key = current.isoformat()
-            buckets[bucket_key] = 0
-            current += timedelta(minutes=interval_minutes)
-        
-        # Count errors in each bucket
-        for event in self.error_tracker.error_events:
-            if event.timestamp >= start_time:
-                bucket_time = event.timestamp.replace(
-                    minute=(event.timestamp.minute // interval_minutes) * interval_minutes,
-                    second=0,
-                    microsecond=0
-                )
-                bucket_key = bucket_time.isoformat()
-                if bucket_key in buckets:
-                    buckets[bucket_key] += 1
+        now = time.time()
+        # The window covers whole minutes and ends with the current one
+        end_minute = int(now // 60)
+        start_minute = end_minute - hours * 60 + 1
+        bucket_count = -(-hours * 60 // interval_minutes)
+        
+        counts = [0] * bucket_count
+        for minute, count in self.error_tracker.get_counts_by_minute().items():
+            if start_minute <= minute <= end_minute:
+                counts[(minute - start_minute) // interval_minutes] += count
+        
+        buckets = {
+            from_unix_seconds((start_minute + i * interval_minutes) * 60).isoformat(): count
+            for i, count in enumerate(counts)
+        }
         
         return {
             "time_range": {
-                "start": start_time.isoformat(),
-                "end": now.isoformat()
+                "start": from_unix_seconds(start_minute * 60).isoformat(),
+                "end": from_unix_seconds(now).isoformat()
             },
             "interval_minutes": interval_minutes,
             "data": buckets
@@ -339,19 +621,7 @@ class ErrorDashboard:
         Returns:
             List of error summaries
         """
-        stats = self.error_tracker.get_stats()
-        summaries = []
-        
-        for error_type, count in sorted(stats.errors_by_type.items(), key=lambda x: x[1], reverse=True):
-            errors = self.error_tracker.get_errors_by_type(error_type, limit=5)
-            summaries.append({
-                "error_type": error_type,
-                "count": count,
-                "percentage": (count / stats.total_errors * 100) if stats.total_errors > 0 else 0,
-                "recent_examples": [e.to_dict() for e in errors]
-            })
-        
-        return summaries
+        return self._get_summary("error_type", self.error_tracker.get_errors_by_type)
     
     def get_error_summary_by_endpoint(self) -> List[Dict[str, Any]]:
         """Get error summary grouped by endpoint.
@@ -359,24 +629,37 @@ class ErrorDashboard:
         Returns:
             List of error summaries
         """
-        stats = self.error_tracker.get_stats()
+        return self._get_summary("endpoint", self.error_tracker.get_errors_by_endpoint)
+    
+    def _get_summary(self, key: str, get_examples: Callable[..., List[ErrorEvent]]) -> List[Dict[str, Any]]:
+        """Build, or reuse while no errors changed, the summary grouped by key."""
+        version = self.error_tracker.version
+        cached = self._summary_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return list(cached[1])
+        
+        stats = self.error_tracker.get_stats(time_window_minutes=None)
+        counts = stats.errors_by_type if key == "error_type" else stats.errors_by_endpoint
         summaries = []
         
-        for endpoint, count in sorted(stats.errors_by_endpoint.items(), key=lambda x: x[1], reverse=True):
-            errors = self.error_tracker.get_errors_by_endpoint(endpoint, limit=5)
+        for value, count in sorted(counts.items(), key=lambda x: x[1], reverse=True):
+            errors = get_examples(value, limit=5)
             summaries.append({
-                "endpoint": endpoint,
+                key: value,
                 "count": count,
                 "percentage": (count / stats.total_errors * 100) if stats.total_errors > 0 else 0,
                 "recent_examples": [e.to_dict() for e in errors]
             })
         
-        return summaries
+        self._summary_cache[key] = (version, summaries)
+        return list(summaries)
 
 
 # Global error tracker instance
 _error_tracker: Optional[ErrorTracker] = None
 _error_dashboard: Optional[ErrorDashboard] = None
+# Only taken on first creation; later calls read the globals without locking
+_init_lock = threading.Lock()
 
 
 def get_error_tracker() -> ErrorTracker:
@@ -386,9 +669,13 @@ def get_error_tracker() -> ErrorTracker:
         ErrorTracker instance
     """
     global _error_tracker
-    if _error_tracker is None:
-        _error_tracker = ErrorTracker()
-    return _error_tracker
+    tracker = _error_tracker
+    if tracker is not None:
+        return tracker
+    with _init_lock:
+        if _error_tracker is None:
+            _error_tracker = ErrorTracker()
+        return _error_tracker
 
 
 def get_error_dashboard() -> ErrorDashboard:
@@ -398,10 +685,15 @@ def get_error_dashboard() -> ErrorDashboard:
         ErrorDashboard instance
     """
     global _error_dashboard
-    if _error_dashboard is None:
-        tracker = get_error_tracker()
-        _error_dashboard = ErrorDashboard(tracker)
-    return _error_dashboard
+    dashboard = _error_dashboard
+    if dashboard is not None:
+        return dashboard
+    # Resolved before taking the lock, which get_error_tracker may also need
+    tracker = get_error_tracker()
+    with _init_lock:
+        if _error_dashboard is None:
+            _error_dashboard = ErrorDashboard(tracker)
+        return _error_dashboard
 
 
 def setup_error_tracking() -> ErrorTracker:
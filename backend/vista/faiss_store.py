@@ -0,0 +1,197 @@
+"""In-process FAISS vector store for the Vista."""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .local_index import LocalVectorIndex
+from .models import Chunk, RetrievedChunk
+from .vector_store import DEFAULT_DIMENSION, DEFAULT_UPSERT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class FaissVectorStoreManager:
+    """Stores and queries chunk embeddings in a local FAISS HNSW index.
+
+    Implements the same interface as VectorStoreManager, so it can replace
+    Pinecone for single-node deployments and large local ingests. Each
+    collection is persisted to its own directory under ``index_path``.
+    """
+
+    def __init__(self, index_path: Optional[str] = None, index_name: str = "vista-vectors",
+                 dimension: int = DEFAULT_DIMENSION, m: int = 32, precision: str = "fp32"):
+        """Initialize the store without opening a collection.
+
+        Args:
+            index_path: Directory holding persisted collections; in-memory only if None
+            index_name: Default collection name
+            dimension: Dimension of the stored embeddings
+            m: Number of HNSW graph neighbors per node
+            precision: Storage precision of the vectors ('fp32', 'fp16' or 'int8')
+        """
+        self.index_path = Path(index_path) if index_path else None
+        self.index_name = index_name
+        self.dimension = dimension
+        self.m = m
+        self.precision = precision
+        self.index: Optional[LocalVectorIndex] = None
+        # Matches VectorStoreManager; an in-process index has no connection to lose
+        self.last_error: Optional[str] = None
+
+    def create_collection(self, collection_name: str = None) -> None:
+        """Create or load a FAISS collection.
+
+        Args:
+            collection_name: Name of the collection (optional, uses default if None)
+
+        Raises:
+            ValueError: If no collection name is available or the precision
+                is not supported
+            RuntimeError: If faiss is not installed
+        """
+        if collection_name:
+            self.index_name = collection_name
+
+        if not self.index_name:
+            raise ValueError("Index name must be provided either in constructor or create_collection")
+
+        # Queries are always answered locally, so no confidence threshold applies
+        self.index = LocalVectorIndex(
+            dimension=self.dimension,
+            m=self.m,
+            confidence_threshold=-1.0,
+            persist_path=self._collection_path(),
+            precision=self.precision
+        )
+        logger.info(f"Opened FAISS collection {self.index_name} with {len(self.index)} vectors")
+
+    def add_chunks(self, chunks: List[Chunk], embeddings: Sequence[Sequence[float]],
+                   batch_size: int = DEFAULT_UPSERT_BATCH_SIZE) -> None:
+        """Add chunks with embeddings to the collection.
+
+        Args:
+            chunks: List of chunks to add
+            embeddings: Corresponding unit-norm embeddings, as a 2-D array or list of vectors
+            batch_size: Number of vectors added to the index at a time
+
+        Raises:
+            RuntimeError: If collection not initialized
+            ValueError: If chunks and embeddings counts don't match
+        """
+        if self.index is None:
+            raise RuntimeError("Collection not initialized. Call create_collection() first.")
+
+        if len(chunks) != len(embeddings):
+            raise ValueError("Number of chunks must match number of embeddings")
+
+        if not chunks:
+            logger.warning("No chunks to add")
+            return
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        total = len(chunks)
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            batch = chunks[start:end]
+            self.index.add(
+                [f"{chunk.document_id}_{chunk.chunk_index}" for chunk in batch],
+                embeddings[start:end],
+                [
+                    {
+                        **chunk.metadata,
+                        "document_id": chunk.document_id,
+                        "chunk_index": str(chunk.chunk_index),
+                        "text": chunk.text
+                    }
+                    for chunk in batch
+                ]
+            )
+
+        logger.info("Added %d vectors to FAISS collection %s", total, self.index_name)
+
+    def flush(self) -> None:
+        """Write the collection to disk after a series of add_chunks calls.
+
+        add_chunks only updates the in-memory index, so an ingest of many
+        windows writes the index once; call this when the ingest is done.
+        """
+        if self.index is not None:
+            self.index.save()
+
+    def query(self, query_embedding: Sequence[float], n_results: int = 5) -> List[RetrievedChunk]:
+        """Query the collection for similar chunks.
+
+        Args:
+            query_embedding: Unit-norm query embedding vector
+            n_results: Number of results to return
+
+        Returns:
+            List of RetrievedChunk objects with cosine similarity scores
+
+        Raises:
+            RuntimeError: If collection not initialized
+        """
+        if self.index is None:
+            raise RuntimeError("Collection not initialized. Call create_collection() first.")
+
+        # Inner product of unit-norm vectors is already the cosine similarity
+        retrieved_chunks = self.index.nearest(query_embedding, n_results)
+        logger.info("Retrieved %d vectors from query", len(retrieved_chunks))
+        return retrieved_chunks
+
+    def batch_query(self, query_embeddings: Sequence[Sequence[float]],
+                    n_results: int = 5) -> List[List[RetrievedChunk]]:
+        """Query the collection for several embeddings.
+
+        Args:
+            query_embeddings: Unit-norm query embedding vectors
+            n_results: Number of results to return per query
+
+        Returns:
+            One list of RetrievedChunk objects per query embedding, in order
+
+        Raises:
+            RuntimeError: If collection not initialized
+        """
+        return [self.query(embedding, n_results) for embedding in query_embeddings]
+
+    def reset_collection(self, hard: bool = False) -> None:
+        """Remove all vectors from the collection.
+
+        Args:
+            hard: Accepted for interface compatibility; a local collection is
+                always cleared in place
+        """
+        if self.index is None:
+            self.create_collection()
+
+        self.index.clear()
+        self.index.save()
+        logger.info(f"Cleared FAISS collection {self.index_name}")
+
+    def get_collection_count(self, use_cache: bool = True) -> int:
+        """Get number of vectors in the collection.
+
+        Args:
+            use_cache: Accepted for interface compatibility; the local count
+                is always exact
+
+        Returns:
+            Number of vectors, or 0 if collection not initialized
+        """
+        if self.index is None:
+            return 0
+        return len(self.index)
+
+    def _collection_path(self) -> Optional[str]:
+        """Directory the current collection is persisted to, if any."""
+        if self.index_path is None:
+            return None
+        return str(self.index_path / self.index_name)
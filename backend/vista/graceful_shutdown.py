@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownContext:
     """Context for graceful shutdown."""
     
@@ -43,6 +43,9 @@ class GracefulShutdownHandler:
         self.context = ShutdownContext()
         self.cleanup_callbacks: List[Callable] = []
         self.async_cleanup_callbacks: List[Callable] = []
+        # Set whenever no requests are in flight, so shutdown can await it
+        self._no_requests_in_flight = asyncio.Event()
+        self._no_requests_in_flight.set()
     
     def register_cleanup(self, callback: Callable) -> None:
         """Register a synchronous cleanup callback.
@@ -80,11 +83,14 @@ class GracefulShutdownHandler:
     def increment_in_flight_requests(self) -> None:
         """Increment in-flight request counter."""
         self.context.in_flight_requests += 1
+        self._no_requests_in_flight.clear()
     
     def decrement_in_flight_requests(self) -> None:
         """Decrement in-flight request counter."""
         if self.context.in_flight_requests > 0:
             self.context.in_flight_requests -= 1
+        if self.context.in_flight_requests == 0:
+            self._no_requests_in_flight.set()
     
     def get_in_flight_requests(self) -> int:
         """Get current number of in-flight requests.
@@ -102,24 +108,29 @@ class GracefulShutdownHandler:
         """
         return self.context.is_shutting_down
     
-    async def wait_for_in_flight_requests(self, check_interval: float = 0.1) -> None:
+    async def wait_for_in_flight_requests(self) -> None:
         """Wait for all in-flight requests to complete.
         
-        Args:
-            check_interval: Time to wait between checks (seconds)
+        Returns once the last request finishes, or when the shutdown timeout
+        is exceeded. The timeout counts from the start of shutdown, or from
+        this call if shutdown has not been started.
         """
         self.logger.info("Waiting for in-flight requests to complete...")
         
-        while self.context.in_flight_requests > 0:
-            if self.context.is_timeout():
+        timeout = self.context.max_shutdown_time
+        if self.context.shutdown_start_time:
+            elapsed = (datetime.now() - self.context.shutdown_start_time).total_seconds()
+            timeout = max(self.context.max_shutdown_time - elapsed, 0)
+        
+        if not self._no_requests_in_flight.is_set():
+            try:
+                await asyncio.wait_for(self._no_requests_in_flight.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
                 self.logger.warning(
                     f"Shutdown timeout exceeded with {self.context.in_flight_requests} "
                     "in-flight requests still pending"
                 )
-                break
-            
-            self.logger.debug(f"Waiting for {self.context.in_flight_requests} in-flight requests...")
-            await asyncio.sleep(check_interval)
+                return
         
         self.logger.info("All in-flight requests completed")
     
@@ -136,30 +147,20 @@ class GracefulShutdownHandler:
         
         This method:
         1. Waits for in-flight requests to complete
-        2. Executes async cleanup callbacks
-        3. Executes sync cleanup callbacks
-        4. Closes database connections
+        2. Executes async and sync cleanup callbacks concurrently
+        3. Closes database connections
         """
         self.logger.info("Starting graceful shutdown sequence...")
         
         # Wait for in-flight requests
         await self.wait_for_in_flight_requests()
         
-        # Execute async cleanup callbacks
-        for callback in self.async_cleanup_callbacks:
-            try:
-                self.logger.debug(f"Executing async cleanup: {callback.__name__}")
-                await callback()
-            except Exception as e:
-                self.logger.error(f"Error in async cleanup {callback.__name__}: {e}")
-        
-        # Execute sync cleanup callbacks
-        for callback in self.cleanup_callbacks:
-            try:
-                self.logger.debug(f"Executing cleanup: {callback.__name__}")
-                callback()
-            except Exception as e:
-                self.logger.error(f"Error in cleanup {callback.__name__}: {e}")
+        # Execute all cleanup callbacks concurrently; sync ones run in worker
+        # threads so blocking cleanup doesn't stall the event loop
+        await asyncio.gather(
+            *(self._run_async_cleanup(callback) for callback in self.async_cleanup_callbacks),
+            *(self._run_cleanup(callback) for callback in self.cleanup_callbacks)
+        )
         
         # Close database connections
         try:
@@ -169,6 +170,22 @@ class GracefulShutdownHandler:
         
         self.logger.info("Graceful shutdown completed")
     
+    async def _run_async_cleanup(self, callback: Callable) -> None:
+        """Run an async cleanup callback, logging any error."""
+        try:
+            self.logger.debug(f"Executing async cleanup: {callback.__name__}")
+            await callback()
+        except Exception as e:
+            self.logger.error(f"Error in async cleanup {callback.__name__}: {e}")
+    
+    async def _run_cleanup(self, callback: Callable) -> None:
+        """Run a sync cleanup callback in a worker thread, logging any error."""
+        try:
+            self.logger.debug(f"Executing cleanup: {callback.__name__}")
+            await asyncio.to_thread(callback)
+        except Exception as e:
+            self.logger.error(f"Error in cleanup {callback.__name__}: {e}")
+    
     def get_shutdown_status(self) -> dict:
         """Get current shutdown status.
         
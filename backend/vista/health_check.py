@@ -1,7 +1,9 @@
 """Health check system for production monitoring."""
 
+import hashlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import Dict, Optional, Any
@@ -9,6 +11,17 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Seconds a health check result is reused for
+DEFAULT_CACHE_TTL_S = 5.0
+
+# Seconds all component probes together may take before they are reported as timed out
+CHECK_TIMEOUT_S = 5.0
+
+# The vector store is queried on every Nth database check, or when the last
+# query is older than the interval; checks in between reuse its result
+DEFAULT_DEEP_CHECK_EVERY = 10
+DEFAULT_DEEP_CHECK_INTERVAL_S = 60.0
+
 
 class HealthStatus(str, Enum):
     """Health status values."""
@@ -17,6 +30,16 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
+# Severity order of statuses; the overall status is the worst component status
+_STATUS_RANK: Dict[HealthStatus, int] = {status: rank for rank, status in enumerate(HealthStatus)}
+
+_STATUS_MESSAGES: Dict[HealthStatus, str] = {
+    HealthStatus.HEALTHY: "All systems operational",
+    HealthStatus.DEGRADED: "Some systems degraded",
+    HealthStatus.UNHEALTHY: "System unhealthy"
+}
+
+
 @dataclass
 class ComponentHealth:
     """Health status of a single component."""
@@ -39,6 +62,7 @@ class HealthCheckResponse:
     components: Dict[str, Dict[str, Any]]
     message: Optional[str] = None
     uptime_seconds: Optional[float] = None
+    etag: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -48,57 +72,104 @@ class HealthCheckResponse:
 class HealthChecker:
     """Manages health checks for system components."""
     
-    def __init__(self, query_engine=None, vector_store=None, llm_client=None):
+    def __init__(self, query_engine=None, vector_store=None, llm_client=None,
+                 cache_ttl_s: float = DEFAULT_CACHE_TTL_S,
+                 deep_check_every: int = DEFAULT_DEEP_CHECK_EVERY,
+                 deep_check_interval_s: float = DEFAULT_DEEP_CHECK_INTERVAL_S):
         """Initialize health checker with system components.
         
         Args:
             query_engine: QueryEngine instance
             vector_store: VectorStoreManager instance
             llm_client: LLM client instance
+            cache_ttl_s: Seconds a health check result is reused for; 0 disables caching
+            deep_check_every: Query the vector store on every Nth database check;
+                1 queries it on every check
+            deep_check_interval_s: Longest time between vector store queries
         """
         self.query_engine = query_engine
         self.vector_store = vector_store
         self.llm_client = llm_client
         self.start_time = time.time()
         self.logger = logging.getLogger(__name__)
+        self._cache_ttl_s = cache_ttl_s
+        self._cached_response: Optional[HealthCheckResponse] = None
+        self._cache_expires_at = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._deep_check_every = max(deep_check_every, 1)
+        self._deep_check_interval_s = deep_check_interval_s
+        self._database_checks = 0
+        self._last_deep_check = 0.0
+        self._last_database_health: Optional[ComponentHealth] = None
+    
+    def __del__(self):
+        """Release the probe threads."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
     
     def check_health(self) -> HealthCheckResponse:
         """Check overall system health.
         
+        Results are reused for cache_ttl_s seconds, so frequent polling does
+        not probe every component on each call.
+        
         Returns:
             HealthCheckResponse with overall status and component details
         """
-        components = {}
-        overall_status = HealthStatus.HEALTHY
+        if self._cached_response is not None and time.monotonic() < self._cache_expires_at:
+            return self._cached_response
         
-        # Check each component
-        api_health = self._check_api_health()
-        components["api"] = api_health.to_dict()
+        components = {}
         
-        db_health = self._check_database_health()
-        components["database"] = db_health.to_dict()
+        # Probe components concurrently, so latency is the slowest probe rather than the sum
+        checks = {
+            "api": self._check_api_health,
+            "database": self._check_database_health,
+            "llm": self._check_llm_health
+        }
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="health")
+        futures = {name: self._executor.submit(check) for name, check in checks.items()}
         
-        llm_health = self._check_llm_health()
-        components["llm"] = llm_health.to_dict()
+        deadline = time.monotonic() + CHECK_TIMEOUT_S
+        for name, future in futures.items():
+            try:
+                health = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                self.logger.error(f"{name} health check timed out")
+                health = ComponentHealth(
+                    name=name,
+                    status=HealthStatus.UNHEALTHY,
+                    response_time_ms=CHECK_TIMEOUT_S * 1000,
+                    error_message="check timed out",
+                    last_check=datetime.utcnow().isoformat()
+                )
+            components[name] = health.to_dict()
         
         # Determine overall status
-        for component in components.values():
-            if component["status"] == HealthStatus.UNHEALTHY:
-                overall_status = HealthStatus.UNHEALTHY
-                break
-            elif component["status"] == HealthStatus.DEGRADED:
-                if overall_status != HealthStatus.UNHEALTHY:
-                    overall_status = HealthStatus.DEGRADED
+        overall_status = max(
+            (HealthStatus(component["status"]) for component in components.values()),
+            key=_STATUS_RANK.__getitem__,
+            default=HealthStatus.HEALTHY
+        )
         
         uptime = time.time() - self.start_time
         
-        return HealthCheckResponse(
+        response = HealthCheckResponse(
             status=overall_status,
             timestamp=datetime.utcnow().isoformat(),
             components=components,
             message=self._get_status_message(overall_status),
-            uptime_seconds=uptime
+            uptime_seconds=uptime,
+            etag=self._compute_etag(overall_status, components)
         )
+        
+        if self._cache_ttl_s > 0:
+            self._cached_response = response
+            self._cache_expires_at = time.monotonic() + self._cache_ttl_s
+        
+        return response
     
     def _check_api_health(self) -> ComponentHealth:
         """Check API component health.
@@ -106,11 +177,11 @@ class HealthChecker:
         Returns:
             ComponentHealth for API
         """
-        start = time.time()
+        start = time.perf_counter_ns()
         
         try:
             # API is healthy if we can reach this point
-            response_time = (time.time() - start) * 1000
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             
             return ComponentHealth(
                 name="api",
@@ -119,7 +190,7 @@ class HealthChecker:
                 last_check=datetime.utcnow().isoformat()
             )
         except Exception as e:
-            response_time = (time.time() - start) * 1000
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             self.logger.error(f"API health check failed: {e}")
             
             return ComponentHealth(
@@ -136,11 +207,11 @@ class HealthChecker:
         Returns:
             ComponentHealth for database
         """
-        start = time.time()
+        start = time.perf_counter_ns()
         
         try:
             if not self.vector_store:
-                response_time = (time.time() - start) * 1000
+                response_time = (time.perf_counter_ns() - start) / 1_000_000
                 return ComponentHealth(
                     name="database",
                     status=HealthStatus.DEGRADED,
@@ -149,28 +220,69 @@ class HealthChecker:
                     last_check=datetime.utcnow().isoformat()
                 )
             
-            # Try to get collection count
-            count = self.vector_store.get_collection_count()
-            response_time = (time.time() - start) * 1000
+            deep_check = self._needs_deep_check()
+            self._database_checks += 1
+            if not deep_check:
+                # Report the last probe's outcome, status and error included
+                return self._last_database_health
+            
+            # Try to get collection count, bypassing the cached count so the
+            # probe reaches the vector store
+            self._last_deep_check = time.monotonic()
+            self.vector_store.get_collection_count(use_cache=False)
+            # The count call logs Pinecone errors and returns 0; the error it
+            # recorded is what marks the store down
+            store_error = self._store_error()
+            if store_error:
+                raise RuntimeError(store_error)
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             
             # Database is healthy if we can query it
-            return ComponentHealth(
+            health = ComponentHealth(
                 name="database",
                 status=HealthStatus.HEALTHY,
                 response_time_ms=response_time,
                 last_check=datetime.utcnow().isoformat()
             )
         except Exception as e:
-            response_time = (time.time() - start) * 1000
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             self.logger.error(f"Database health check failed: {e}")
             
-            return ComponentHealth(
+            health = ComponentHealth(
                 name="database",
                 status=HealthStatus.UNHEALTHY,
                 response_time_ms=response_time,
                 error_message=str(e),
                 last_check=datetime.utcnow().isoformat()
             )
+        
+        self._last_database_health = health
+        return health
+    
+    def _needs_deep_check(self) -> bool:
+        """Whether this database check should query the vector store.
+        
+        Checks in between reuse the last query's result, unless a store call
+        made since then, such as a user query, failed; that is seen on the
+        next check. An outage no call has hit yet goes unnoticed until the
+        next periodic query, at most deep_check_every checks or
+        deep_check_interval_s seconds away. A failed query is retried on
+        every check, so recovery is seen at once.
+        
+        Returns:
+            True if the vector store should be queried
+        """
+        return (
+            self._last_database_health is None
+            or self._last_database_health.status != HealthStatus.HEALTHY
+            or self._store_error() is not None
+            or self._database_checks % self._deep_check_every == 0
+            or time.monotonic() - self._last_deep_check >= self._deep_check_interval_s
+        )
+    
+    def _store_error(self) -> Optional[str]:
+        """Error of the vector store's last failed call, if it records one."""
+        return getattr(self.vector_store, "last_error", None)
     
     def _check_llm_health(self) -> ComponentHealth:
         """Check LLM component health.
@@ -178,11 +290,11 @@ class HealthChecker:
         Returns:
             ComponentHealth for LLM
         """
-        start = time.time()
+        start = time.perf_counter_ns()
         
         try:
             if not self.llm_client:
-                response_time = (time.time() - start) * 1000
+                response_time = (time.perf_counter_ns() - start) / 1_000_000
                 return ComponentHealth(
                     name="llm",
                     status=HealthStatus.DEGRADED,
@@ -192,7 +304,7 @@ class HealthChecker:
                 )
             
             # LLM is healthy if client is initialized
-            response_time = (time.time() - start) * 1000
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             
             return ComponentHealth(
                 name="llm",
@@ -201,7 +313,7 @@ class HealthChecker:
                 last_check=datetime.utcnow().isoformat()
             )
         except Exception as e:
-            response_time = (time.time() - start) * 1000
+            response_time = (time.perf_counter_ns() - start) / 1_000_000
             self.logger.error(f"LLM health check failed: {e}")
             
             return ComponentHealth(
@@ -212,6 +324,28 @@ class HealthChecker:
                 last_check=datetime.utcnow().isoformat()
             )
     
+    @staticmethod
+    def _compute_etag(status: HealthStatus, components: Dict[str, Dict[str, Any]]) -> str:
+        """Compute an entity tag that changes only when reported health changes.
+        
+        Timestamps, uptime and probe latencies are left out, so polling an
+        unchanged system yields the same tag.
+        
+        Args:
+            status: Overall health status
+            components: Component health dictionaries keyed by name
+            
+        Returns:
+            16-character hex digest
+        """
+        parts = [HealthStatus(status).value]
+        for name in sorted(components):
+            component = components[name]
+            parts.append(
+                f"{name}={HealthStatus(component['status']).value}:{component['error_message'] or ''}"
+            )
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+    
     @staticmethod
     def _get_status_message(status: HealthStatus) -> str:
         """Get human-readable status message.
@@ -222,9 +356,4 @@ class HealthChecker:
         Returns:
             Status message
         """
-        messages = {
-            HealthStatus.HEALTHY: "All systems operational",
-            HealthStatus.DEGRADED: "Some systems degraded",
-            HealthStatus.UNHEALTHY: "System unhealthy"
-        }
-        return messages.get(status, "Unknown status")
+        return _STATUS_MESSAGES.get(status, "Unknown status")
@@ -0,0 +1,138 @@
+"""Knowledge base ingestion pipeline for the Vista."""
+
+import itertools
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from vista.embedding_cache import EmbeddingCache
+from vista.embedding_generator import EmbeddingGenerator
+from vista.models import Chunk, Document
+from vista.text_chunker import TextChunker
+from vista.vector_store import VectorStoreManager, DEFAULT_UPSERT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Chunks embedded and stored together
+DEFAULT_WINDOW_SIZE = 256
+
+# Documents handed to each chunking worker process at a time
+CHUNK_TASK_SIZE = 8
+
+
+def iter_chunks(documents: Iterable[Document], text_chunker: TextChunker,
+                chunk_workers: int = 1) -> Iterator[Chunk]:
+    """Chunk documents lazily as they are produced.
+
+    With more than one worker, documents are chunked in a process pool, since
+    chunking is CPU-bound and serialized by the GIL in threads. Workers are
+    spawned rather than forked, since the caller may already hold loaded
+    models and running threads. Documents are consumed in bounded groups so
+    the source is still streamed.
+
+    Args:
+        documents: Documents to chunk
+        text_chunker: Chunker used to split each document; must be picklable
+            when chunk_workers > 1
+        chunk_workers: Number of worker processes; 1 chunks in this process
+
+    Yields:
+        Chunk objects in document order
+    """
+    if chunk_workers <= 1:
+        for document in documents:
+            yield from text_chunker.chunk_document(document)
+        return
+
+    source = iter(documents)
+    group_size = chunk_workers * CHUNK_TASK_SIZE * 4
+    with ProcessPoolExecutor(max_workers=chunk_workers,
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        while True:
+            group = list(itertools.islice(source, group_size))
+            if not group:
+                break
+            for chunks in executor.map(text_chunker.chunk_document, group, chunksize=CHUNK_TASK_SIZE):
+                yield from chunks
+
+
+def ingest_documents(documents: Iterable[Document], text_chunker: TextChunker,
+                     embedding_generator: EmbeddingGenerator, vector_store: VectorStoreManager,
+                     window_size: int = DEFAULT_WINDOW_SIZE,
+                     batch_size: int = DEFAULT_UPSERT_BATCH_SIZE,
+                     chunk_workers: int = 1,
+                     embedding_cache: Optional[EmbeddingCache] = None) -> Tuple[int, int]:
+    """Chunk, embed and store documents in fixed-size windows.
+
+    Each window is embedded on the calling thread while the previous window
+    is being upserted on a background thread, so peak memory is bounded by
+    the window size and embedding overlaps with network I/O. The vector
+    store is flushed once at the end, even if a window fails.
+
+    Args:
+        documents: Documents to ingest, typically a streaming loader
+        text_chunker: Chunker used to split each document
+        embedding_generator: Generator used to embed chunk texts
+        vector_store: Vector store receiving the chunks
+        window_size: Number of chunks embedded and stored together
+        batch_size: Number of vectors per upsert request
+        chunk_workers: Number of processes used to chunk documents
+        embedding_cache: Optional cache of embeddings for unchanged chunk texts
+
+    Returns:
+        Tuple of (document count, chunk count)
+
+    Raises:
+        Exception: If embedding or storing any window fails
+    """
+    document_count = 0
+    chunk_count = 0
+
+    def counted(source: Iterable[Document]) -> Iterator[Document]:
+        nonlocal document_count
+        for document in source:
+            document_count += 1
+            yield document
+
+    try:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest") as executor:
+            pending: Optional[Future] = None
+            window: List[Chunk] = []
+            window_texts: List[str] = []
+
+            def store_window(chunks: List[Chunk], texts: List[str]) -> None:
+                nonlocal pending, chunk_count
+                if embedding_cache is not None:
+                    embeddings = embedding_cache.get_or_embed(texts, embedding_generator.generate_batch_embeddings)
+                else:
+                    embeddings = embedding_generator.generate_batch_embeddings(texts)
+                # Wait for the previous upsert so at most one window is in flight
+                if pending is not None:
+                    pending.result()
+                pending = executor.submit(vector_store.add_chunks, chunks, embeddings, batch_size)
+                chunk_count += len(chunks)
+                logger.info("Embedded %d chunks from %d documents", chunk_count, document_count)
+
+            # Texts are collected in the same pass that fills the window, so no
+            # separate walk over the window is needed before embedding
+            for chunk in iter_chunks(counted(documents), text_chunker, chunk_workers):
+                window.append(chunk)
+                window_texts.append(chunk.text)
+                if len(window) >= window_size:
+                    store_window(window, window_texts)
+                    window = []
+                    window_texts = []
+
+            if window:
+                store_window(window, window_texts)
+            if pending is not None:
+                pending.result()
+    finally:
+        # Persist local index and cache state once, rather than per window
+        vector_store.flush()
+
+    if embedding_cache is not None:
+        logger.info("Embedding cache: %d hits, %d misses", embedding_cache.hits, embedding_cache.misses)
+
+    return document_count, chunk_count
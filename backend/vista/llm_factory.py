@@ -1,11 +1,10 @@
 # llm_factory.py
 """Factory for creating LLM client instances."""
 
+import importlib
 import logging
-from typing import Optional
+from typing import Dict, Optional, Union
 from vista.llm_base import BaseLLMClient
-from vista.llm_openai import OpenAILLMClient
-from vista.llm_gemini import GeminiLLMClient
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +12,12 @@ logger = logging.getLogger(__name__)
 class LLMFactory:
     """Factory class for creating LLM client instances."""
     
-    # Registry of available LLM providers
-    _providers = {
-        'openai': OpenAILLMClient,
-        'gemini': GeminiLLMClient,
+    # Registry of available LLM providers. Built-in providers are given as
+    # "module:Class" paths and imported on first use, so only the SDK of the
+    # provider actually selected is loaded.
+    _providers: Dict[str, Union[type, str]] = {
+        'openai': 'vista.llm_openai:OpenAILLMClient',
+        'gemini': 'vista.llm_gemini:GeminiLLMClient',
     }
     
     @classmethod
@@ -48,7 +49,7 @@ class LLMFactory:
                 f"Available providers: {available}"
             )
         
-        client_class = cls._providers[provider_lower]
+        client_class = cls._resolve_provider(provider_lower)
         
         # Create client with or without model specification
         if model:
@@ -59,6 +60,23 @@ class LLMFactory:
         logger.info(f"Created {provider} LLM client with model: {getattr(client, 'model', None) or getattr(client, 'model_name', 'unknown')}")
         return client
     
+    @classmethod
+    def _resolve_provider(cls, name: str) -> type:
+        """Return the client class of a provider, importing it if needed.
+        
+        Args:
+            name: Lowercase provider name
+            
+        Returns:
+            LLM client class
+        """
+        entry = cls._providers[name]
+        if isinstance(entry, str):
+            module_name, _, class_name = entry.partition(':')
+            entry = getattr(importlib.import_module(module_name), class_name)
+            cls._providers[name] = entry
+        return entry
+    
     @classmethod
     def register_provider(cls, name: str, client_class: type) -> None:
         """Register a new LLM provider.
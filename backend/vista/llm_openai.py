@@ -1,6 +1,7 @@
 """LLM client for the Vista."""
 
 import logging
+import random
 import time
 from typing import Callable, Any
 from openai import OpenAI
@@ -10,6 +11,9 @@ from vista.llm_base import BaseLLMClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single retry delay, in seconds
+MAX_BACKOFF_S = 32.0
+
 
 class OpenAILLMClient(BaseLLMClient):
     """Interface with LLM API for response generation."""
@@ -70,7 +74,10 @@ class OpenAILLMClient(BaseLLMClient):
         return self._retry_with_backoff(_make_api_call, max_retries=3)
     
     def _retry_with_backoff(self, func: Callable[[], Any], max_retries: int = 3) -> Any:
-        """Retry failed API calls with exponential backoff.
+        """Retry failed API calls with jittered exponential backoff.
+
+        Each delay is drawn uniformly from the upper half of the exponential
+        step, so clients that fail together do not retry in lockstep.
         
         Args:
             func: Function to retry
@@ -95,9 +102,10 @@ class OpenAILLMClient(BaseLLMClient):
                     logger.error(f"All {max_retries + 1} attempts failed. Last error: {e}")
                     raise e
                 
-                # Calculate exponential backoff delay: 2^attempt seconds
-                delay = 2 ** attempt
-                logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
+                # Exponential step of 2^attempt seconds, jittered within its upper half
+                step = min(2 ** attempt, MAX_BACKOFF_S)
+                delay = random.uniform(step / 2, step)
+                logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f} seconds...")
                 time.sleep(delay)
         
         # This should never be reached, but just in case
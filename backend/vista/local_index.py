@@ -0,0 +1,257 @@
+"""Local HNSW index mirroring recently added vectors for the Vista."""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from vista.models import RetrievedChunk, intern_metadata
+
+logger = logging.getLogger(__name__)
+
+# Try to import faiss, but make it optional
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+INDEX_FILENAME = "index.faiss"
+META_FILENAME = "meta.jsonl"
+
+# Storage precisions of the index vectors
+SUPPORTED_PRECISIONS = ("fp32", "fp16", "int8")
+
+
+class LocalVectorIndex:
+    """In-process FAISS HNSW index used in front of the remote vector store.
+
+    Vectors are mirrored here as they are added, and queries are answered
+    locally when the best match is confident enough, avoiding a network round
+    trip. Embeddings must be unit-norm so inner product equals cosine
+    similarity, matching the Pinecone index metric.
+    """
+
+    def __init__(self, dimension: int, m: int = 32, confidence_threshold: float = 0.8,
+                 persist_path: Optional[str] = None, precision: str = "fp32"):
+        """Initialize an empty local index.
+
+        Args:
+            dimension: Embedding dimension
+            m: Number of HNSW graph neighbors per node
+            confidence_threshold: Minimum top-1 similarity for local results
+                to be returned instead of querying the remote store
+            persist_path: Optional directory used to save and load the index
+            precision: Storage precision of the vectors: 'fp32', or 'fp16' and
+                'int8' scalar quantization, which halve and quarter the memory
+                read per distance computation at a small cost in recall
+
+        Raises:
+            RuntimeError: If faiss is not installed
+            ValueError: If the precision is not supported
+        """
+        if not HAS_FAISS:
+            raise RuntimeError("faiss is required for the local index. Install faiss-cpu.")
+        if precision not in SUPPORTED_PRECISIONS:
+            raise ValueError(f"Unsupported index precision: {precision}. Must be one of {SUPPORTED_PRECISIONS}")
+
+        self.dimension = dimension
+        self.m = m
+        self.precision = precision
+        self.confidence_threshold = confidence_threshold
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._lock = threading.Lock()
+
+        self._index = self._new_index()
+        # Parallel to index positions; HNSW cannot remove vectors, so a
+        # re-added ID leaves its old position stale and skipped at search time.
+        # Metadata is kept as one column per key rather than a dict per vector,
+        # and dicts are only built for returned results
+        self._ids: List[str] = []
+        self._texts: List[str] = []
+        self._columns: Dict[str, List[Optional[str]]] = {}
+        self._latest: Dict[str, int] = {}
+
+        if self.persist_path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the number of distinct vectors in the index."""
+        return len(self._latest)
+
+    def add(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+            metadatas: Sequence[Dict[str, str]]) -> None:
+        """Mirror vectors into the local index.
+
+        Args:
+            ids: Vector IDs, as used in the remote store
+            embeddings: Unit-norm embeddings, one per ID
+            metadatas: Metadata as stored in the remote store, including
+                the chunk text under the "text" key
+        """
+        if not ids:
+            return
+
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        with self._lock:
+            self._index.add(vectors)
+            self._extend(ids, metadatas)
+
+    def search(self, embedding: Sequence[float], n_results: int) -> Optional[List[RetrievedChunk]]:
+        """Search the local index.
+
+        Args:
+            embedding: Unit-norm query embedding
+            n_results: Number of results requested
+
+        Returns:
+            Results if the index holds enough confident matches, otherwise None
+        """
+        results = self.nearest(embedding, n_results)
+        if len(results) < n_results or results[0].similarity_score < self.confidence_threshold:
+            return None
+        return results
+
+    def nearest(self, embedding: Sequence[float], n_results: int) -> List[RetrievedChunk]:
+        """Return up to ``n_results`` nearest chunks, regardless of confidence.
+
+        Args:
+            embedding: Unit-norm query embedding
+            n_results: Maximum number of results
+
+        Returns:
+            Results ordered by descending cosine similarity
+        """
+        query = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+
+        with self._lock:
+            if not self._latest or n_results <= 0:
+                return []
+
+            # Over-fetch to make up for stale positions of re-added IDs
+            k = min(len(self._ids), n_results + len(self._ids) - len(self._latest))
+            scores, positions = self._index.search(query, k)
+
+            results = []
+            for score, position in zip(scores[0], positions[0]):
+                if position < 0 or self._latest.get(self._ids[position]) != position:
+                    continue
+                results.append(RetrievedChunk(
+                    text=self._texts[position],
+                    metadata=self._metadata(position),
+                    similarity_score=float(score)
+                ))
+                if len(results) == n_results:
+                    break
+
+        return results
+
+    def clear(self) -> None:
+        """Remove all vectors from the local index."""
+        with self._lock:
+            self._index = self._new_index()
+            self._ids = []
+            self._texts = []
+            self._columns = {}
+            self._latest = {}
+
+    def save(self) -> None:
+        """Write the index and its metadata to ``persist_path``."""
+        if self.persist_path is None:
+            return
+
+        with self._lock:
+            self.persist_path.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.persist_path / INDEX_FILENAME))
+            with open(self.persist_path / META_FILENAME, "w", encoding="utf-8") as f:
+                for position, vector_id in enumerate(self._ids):
+                    record = {"id": vector_id, "text": self._texts[position], "metadata": self._metadata(position)}
+                    f.write(json.dumps(record) + "\n")
+        logger.info(f"Saved local index with {len(self)} vectors to {self.persist_path}")
+
+    def _extend(self, ids: Sequence[str], metadatas: Sequence[Dict[str, str]]) -> None:
+        """Record the IDs, texts and metadata of the next index positions.
+
+        Each list grows once per batch via extend rather than once per
+        vector, so a batch costs one resize per list.
+        """
+        start = len(self._ids)
+        count = len(ids)
+        self._ids.extend(ids)
+        self._texts.extend(metadata.get("text", "") for metadata in metadatas)
+
+        keys = {key for metadata in metadatas for key in metadata if key != "text"}
+        for key in keys:
+            if key not in self._columns:
+                self._columns[key] = [None] * start
+        for key, column in self._columns.items():
+            if key in keys:
+                column.extend(metadata.get(key) for metadata in metadatas)
+            else:
+                # Pad columns for keys no vector in this batch has
+                column.extend([None] * count)
+
+        # Later duplicates of an ID within the batch win, matching upsert order
+        self._latest.update(zip(ids, range(start, start + count)))
+
+    def _metadata(self, position: int) -> Dict[str, str]:
+        """Assemble the metadata dict of an index position."""
+        return {
+            key: column[position]
+            for key, column in self._columns.items()
+            if column[position] is not None
+        }
+
+    def _new_index(self):
+        """Create an empty HNSW index using inner product similarity."""
+        if self.precision == "fp32":
+            return faiss.IndexHNSWFlat(self.dimension, self.m, faiss.METRIC_INNER_PRODUCT)
+
+        if self.precision == "fp16":
+            return faiss.IndexHNSWSQ(
+                self.dimension, faiss.ScalarQuantizer.QT_fp16, self.m, faiss.METRIC_INNER_PRODUCT
+            )
+
+        # Components of unit-norm vectors lie in [-1, 1], so the 8-bit
+        # quantizer is trained on that range instead of on sample data
+        index = faiss.IndexHNSWSQ(
+            self.dimension, faiss.ScalarQuantizer.QT_8bit_uniform, self.m, faiss.METRIC_INNER_PRODUCT
+        )
+        bounds = np.array([[-1.0] * self.dimension, [1.0] * self.dimension], dtype=np.float32)
+        index.train(bounds)
+        return index
+
+    def _load(self) -> None:
+        """Load a previously saved index from ``persist_path``, if present."""
+        index_path = self.persist_path / INDEX_FILENAME
+        meta_path = self.persist_path / META_FILENAME
+        if not index_path.exists() or not meta_path.exists():
+            return
+
+        try:
+            index = faiss.read_index(str(index_path))
+            if index.d != self.dimension:
+                logger.warning(
+                    f"Ignoring local index at {self.persist_path}: "
+                    f"dimension {index.d} does not match {self.dimension}"
+                )
+                return
+
+            with open(meta_path, "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            if len(records) != index.ntotal:
+                logger.warning(f"Ignoring local index at {self.persist_path}: metadata is out of sync")
+                return
+
+            self._index = index
+            self._extend(
+                [record["id"] for record in records],
+                [{**intern_metadata(record["metadata"]), "text": record["text"]} for record in records]
+            )
+            logger.info(f"Loaded local index with {len(self)} vectors from {self.persist_path}")
+        except (OSError, RuntimeError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to load local index from {self.persist_path}: {e}")
@@ -3,12 +3,15 @@
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import Counter
 from statistics import median, quantiles
 
 logger = logging.getLogger(__name__)
 
+# Most recent request metrics kept in memory
+MAX_REQUEST_METRICS = 10000
+
 
 @dataclass
 class RequestMetrics:
@@ -62,9 +65,26 @@ class MetricsCollector:
         )
         self.request_metrics.append(metric)
         
-        # Keep only last 10000 metrics to avoid memory bloat
-        if len(self.request_metrics) > 10000:
-            self.request_metrics = self.request_metrics[-10000:]
+        # Keep only the most recent metrics to avoid memory bloat
+        if len(self.request_metrics) > MAX_REQUEST_METRICS:
+            self.request_metrics = self.request_metrics[-MAX_REQUEST_METRICS:]
+    
+    def record_requests(self, records: Iterable[Tuple[str, float, int, Optional[str]]]) -> None:
+        """Record several request metrics at once.
+        
+        The metrics are appended in one pass and trimmed to the retention
+        limit once, rather than after every request.
+        
+        Args:
+            records: (endpoint, duration_ms, status_code, error) tuples
+        """
+        self.request_metrics.extend(
+            RequestMetrics(endpoint, duration_ms, status_code, error)
+            for endpoint, duration_ms, status_code, error in records
+        )
+        
+        if len(self.request_metrics) > MAX_REQUEST_METRICS:
+            self.request_metrics = self.request_metrics[-MAX_REQUEST_METRICS:]
     
     def get_metrics(self) -> SystemMetrics:
         """Get aggregated system metrics.
@@ -77,7 +97,10 @@ class MetricsCollector:
         
         # Calculate basic metrics
         total_requests = len(self.request_metrics)
-        total_errors = sum(1 for m in self.request_metrics if m.error)
+        
+        # Count errors by type; their sum is the error total, so no separate pass is needed
+        errors_by_type = Counter(m.error for m in self.request_metrics if m.error)
+        total_errors = sum(errors_by_type.values())
         error_rate = total_errors / total_requests if total_requests > 0 else 0.0
         
         # Calculate response time percentiles
@@ -88,15 +111,7 @@ class MetricsCollector:
         p50, p95, p99 = self._calculate_percentiles(durations)
         
         # Count requests by endpoint
-        requests_by_endpoint = defaultdict(int)
-        for metric in self.request_metrics:
-            requests_by_endpoint[metric.endpoint] += 1
-        
-        # Count errors by type
-        errors_by_type = defaultdict(int)
-        for metric in self.request_metrics:
-            if metric.error:
-                errors_by_type[metric.error] += 1
+        requests_by_endpoint = Counter(m.endpoint for m in self.request_metrics)
         
         uptime = time.time() - self.start_time
         
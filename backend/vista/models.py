@@ -1,7 +1,8 @@
 """Data models for the Vista."""
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Any, Dict, List
 
 
 @dataclass
@@ -62,3 +63,22 @@ class QueryResponse:
     answer: str
     sources: List[RetrievedChunk]
     query: str
+
+
+def intern_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the keys and string values of a metadata dict.
+
+    Metadata decoded from JSON (Pinecone responses, persisted caches) gets
+    fresh copies of the same few keys and category/file values for every
+    chunk; interning shares one object per distinct string.
+
+    Args:
+        metadata: Metadata dict, without the chunk text
+
+    Returns:
+        New dict with interned keys and string values
+    """
+    return {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in metadata.items()
+    }
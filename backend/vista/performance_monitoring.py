@@ -1,16 +1,25 @@
 """Performance monitoring for production."""
 
+import bisect
+import heapq
 import logging
+import threading
 import time
 import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Any, Deque, Dict, Iterable, List, Optional, Union
 from datetime import datetime, timedelta
-from collections import defaultdict
-from statistics import mean, median
+from collections import defaultdict, deque
+from itertools import takewhile
+from statistics import mean
+
+from vista.error_tracking import from_unix_seconds, to_unix_seconds
 
 logger = logging.getLogger(__name__)
 
+# Resource usage samples kept in memory
+MAX_RESOURCE_HISTORY = 1000
+
 # Try to import psutil, but make it optional
 try:
     import psutil
@@ -20,31 +29,48 @@ except ImportError:
     logger.warning("psutil not installed - resource monitoring will be limited")
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
-    """Represents a single performance metric."""
+    """Represents a single performance metric.
+    
+    The timestamp is kept as Unix seconds, so recording a metric does not
+    build a datetime; a datetime passed in is converted.
+    """
     endpoint: str
     response_time_ms: float
-    timestamp: datetime
+    timestamp: Union[float, datetime]
     status_code: int
     memory_usage_mb: float = 0.0
     cpu_percent: float = 0.0
     
+    def __post_init__(self):
+        """Normalize a datetime timestamp to Unix seconds."""
+        if isinstance(self.timestamp, datetime):
+            self.timestamp = to_unix_seconds(self.timestamp)
+    
+    @property
+    def recorded_at(self) -> datetime:
+        """Time of the request as a naive UTC datetime."""
+        return from_unix_seconds(self.timestamp)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "endpoint": self.endpoint,
             "response_time_ms": self.response_time_ms,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.recorded_at.isoformat(),
             "status_code": self.status_code,
             "memory_usage_mb": self.memory_usage_mb,
             "cpu_percent": self.cpu_percent
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceStats:
-    """Statistics about performance."""
+    """Statistics about performance.
+    
+    Frozen, since the monitor caches and shares instances between callers.
+    """
     endpoint: str
     total_requests: int = 0
     average_response_time_ms: float = 0.0
@@ -74,7 +100,7 @@ class PerformanceStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceUsage:
     """System resource usage."""
     timestamp: datetime
@@ -96,6 +122,50 @@ class ResourceUsage:
         }
 
 
+@dataclass(slots=True)
+class _EndpointMetrics:
+    """Metrics of one endpoint, oldest first, with running totals."""
+    metrics: Deque[PerformanceMetric] = field(default_factory=deque)
+    # Response times kept sorted, so order statistics need no sort per query
+    sorted_times: List[float] = field(default_factory=list)
+    total_response_time_ms: float = 0.0
+    error_count: int = 0
+    total_memory_usage_mb: float = 0.0
+    memory_samples: int = 0
+    total_cpu_percent: float = 0.0
+    cpu_samples: int = 0
+    # Stats built from the current metrics; cleared whenever they change
+    stats: Optional[PerformanceStats] = None
+    
+    def add(self, metric: PerformanceMetric) -> None:
+        """Append a metric and add it to the totals."""
+        self.stats = None
+        self.metrics.append(metric)
+        bisect.insort(self.sorted_times, metric.response_time_ms)
+        self.total_response_time_ms += metric.response_time_ms
+        self.error_count += metric.status_code >= 400
+        if metric.memory_usage_mb > 0:
+            self.total_memory_usage_mb += metric.memory_usage_mb
+            self.memory_samples += 1
+        if metric.cpu_percent > 0:
+            self.total_cpu_percent += metric.cpu_percent
+            self.cpu_samples += 1
+    
+    def remove_oldest(self) -> None:
+        """Drop the oldest metric and take it out of the totals."""
+        self.stats = None
+        metric = self.metrics.popleft()
+        del self.sorted_times[bisect.bisect_left(self.sorted_times, metric.response_time_ms)]
+        self.total_response_time_ms -= metric.response_time_ms
+        self.error_count -= metric.status_code >= 400
+        if metric.memory_usage_mb > 0:
+            self.total_memory_usage_mb -= metric.memory_usage_mb
+            self.memory_samples -= 1
+        if metric.cpu_percent > 0:
+            self.total_cpu_percent -= metric.cpu_percent
+            self.cpu_samples -= 1
+
+
 class PerformanceMonitor:
     """Monitors application performance metrics."""
     
@@ -107,14 +177,23 @@ class PerformanceMonitor:
         """
         self.logger = logging.getLogger(__name__)
         self.max_metrics = max_metrics
-        self.metrics: List[PerformanceMetric] = []
-        self.resource_history: List[ResourceUsage] = []
+        # Bounded deques evict the oldest entry on append, without copying
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=max_metrics)
+        # The same metrics grouped by endpoint, so per-endpoint stats read
+        # only that endpoint's metrics and running totals
+        self._metrics_by_endpoint: Dict[str, _EndpointMetrics] = {}
+        self.resource_history: Deque[ResourceUsage] = deque(maxlen=MAX_RESOURCE_HISTORY)
         self.start_time = datetime.utcnow()
         self.process = psutil.Process(os.getpid()) if HAS_PSUTIL else None
+        if self.process is not None:
+            # Start the CPU time baseline that non-blocking samples are measured from
+            self.process.cpu_percent(interval=None)
     
     def record_metric(self, endpoint: str, response_time_ms: float, status_code: int) -> PerformanceMetric:
         """Record a performance metric.
         
+        Takes no lock; call it from the event loop thread that serves requests.
+        
         Args:
             endpoint: API endpoint
             response_time_ms: Response time in milliseconds
@@ -131,65 +210,83 @@ class PerformanceMonitor:
             try:
                 memory_info = self.process.memory_info()
                 memory_mb = memory_info.rss / 1024 / 1024
-                cpu_percent = self.process.cpu_percent(interval=0.1)
+                # Non-blocking: CPU use since the previous sample, rather than
+                # sleeping 100 ms inside every recorded request
+                cpu_percent = self.process.cpu_percent(interval=None)
             except Exception as e:
                 self.logger.debug(f"Failed to get resource usage: {e}")
         
         metric = PerformanceMetric(
             endpoint=endpoint,
             response_time_ms=response_time_ms,
-            timestamp=datetime.utcnow(),
+            timestamp=time.time(),
             status_code=status_code,
             memory_usage_mb=memory_mb,
             cpu_percent=cpu_percent
         )
         
+        if len(self.metrics) == self.max_metrics:
+            self._evict_oldest_metric()
         self.metrics.append(metric)
-        
-        # Keep only max_metrics
-        if len(self.metrics) > self.max_metrics:
-            self.metrics = self.metrics[-self.max_metrics:]
+        group = self._metrics_by_endpoint.get(endpoint)
+        if group is None:
+            group = self._metrics_by_endpoint[endpoint] = _EndpointMetrics()
+        group.add(metric)
         
         return metric
     
+    def _evict_oldest_metric(self) -> None:
+        """Drop the oldest metric from the history and its endpoint group."""
+        oldest = self.metrics.popleft()
+        group = self._metrics_by_endpoint[oldest.endpoint]
+        group.remove_oldest()
+        if not group.metrics:
+            del self._metrics_by_endpoint[oldest.endpoint]
+    
     def get_stats_for_endpoint(self, endpoint: str) -> PerformanceStats:
         """Get performance statistics for an endpoint.
         
+        Stats are cached per endpoint until its metrics change, so repeated
+        reads return the same object.
+        
         Args:
             endpoint: API endpoint
             
         Returns:
             PerformanceStats instance
         """
-        endpoint_metrics = [m for m in self.metrics if m.endpoint == endpoint]
+        group = self._metrics_by_endpoint.get(endpoint)
         
-        if not endpoint_metrics:
+        if group is None:
             return PerformanceStats(endpoint=endpoint)
+        if group.stats is not None:
+            return group.stats
         
-        response_times = [m.response_time_ms for m in endpoint_metrics]
-        error_count = sum(1 for m in endpoint_metrics if m.status_code >= 400)
-        memory_usages = [m.memory_usage_mb for m in endpoint_metrics if m.memory_usage_mb > 0]
-        cpu_percents = [m.cpu_percent for m in endpoint_metrics if m.cpu_percent > 0]
-        
-        # Calculate percentiles
-        sorted_times = sorted(response_times)
-        p95_idx = int(len(sorted_times) * 0.95)
-        p99_idx = int(len(sorted_times) * 0.99)
+        total_requests = len(group.metrics)
+        sorted_times = group.sorted_times
+        middle = total_requests // 2
+        p95_idx = int(total_requests * 0.95)
+        p99_idx = int(total_requests * 0.99)
         
         stats = PerformanceStats(
             endpoint=endpoint,
-            total_requests=len(endpoint_metrics),
-            average_response_time_ms=mean(response_times),
-            median_response_time_ms=median(response_times),
-            p95_response_time_ms=sorted_times[p95_idx] if p95_idx < len(sorted_times) else sorted_times[-1],
-            p99_response_time_ms=sorted_times[p99_idx] if p99_idx < len(sorted_times) else sorted_times[-1],
-            min_response_time_ms=min(response_times),
-            max_response_time_ms=max(response_times),
-            error_rate=error_count / len(endpoint_metrics) if endpoint_metrics else 0.0,
-            average_memory_usage_mb=mean(memory_usages) if memory_usages else 0.0,
-            average_cpu_percent=mean(cpu_percents) if cpu_percents else 0.0
+            total_requests=total_requests,
+            average_response_time_ms=group.total_response_time_ms / total_requests,
+            median_response_time_ms=(
+                sorted_times[middle] if total_requests % 2 else (sorted_times[middle - 1] + sorted_times[middle]) / 2
+            ),
+            p95_response_time_ms=sorted_times[p95_idx] if p95_idx < total_requests else sorted_times[-1],
+            p99_response_time_ms=sorted_times[p99_idx] if p99_idx < total_requests else sorted_times[-1],
+            min_response_time_ms=sorted_times[0],
+            max_response_time_ms=sorted_times[-1],
+            error_rate=group.error_count / total_requests,
+            average_memory_usage_mb=(
+                group.total_memory_usage_mb / group.memory_samples if group.memory_samples else 0.0
+            ),
+            average_cpu_percent=group.total_cpu_percent / group.cpu_samples if group.cpu_samples else 0.0
         )
         
+        group.stats = stats
         return stats
     
     def get_all_stats(self) -> Dict[str, PerformanceStats]:
@@ -198,8 +295,7 @@ class PerformanceMonitor:
         Returns:
             Dictionary mapping endpoint to PerformanceStats
         """
-        endpoints = set(m.endpoint for m in self.metrics)
-        return {endpoint: self.get_stats_for_endpoint(endpoint) for endpoint in endpoints}
+        return {endpoint: self.get_stats_for_endpoint(endpoint) for endpoint in self._metrics_by_endpoint}
     
     def get_slowest_endpoints(self, limit: int = 10) -> List[PerformanceStats]:
         """Get slowest endpoints by average response time.
@@ -210,9 +306,7 @@ class PerformanceMonitor:
         Returns:
             List of PerformanceStats sorted by response time
         """
-        all_stats = self.get_all_stats()
-        sorted_stats = sorted(all_stats.values(), key=lambda s: s.average_response_time_ms, reverse=True)
-        return sorted_stats[:limit]
+        return self._slowest(self.get_all_stats().values(), limit)
     
     def get_error_prone_endpoints(self, limit: int = 10) -> List[PerformanceStats]:
         """Get endpoints with highest error rates.
@@ -223,9 +317,17 @@ class PerformanceMonitor:
         Returns:
             List of PerformanceStats sorted by error rate
         """
-        all_stats = self.get_all_stats()
-        sorted_stats = sorted(all_stats.values(), key=lambda s: s.error_rate, reverse=True)
-        return sorted_stats[:limit]
+        return self._most_error_prone(self.get_all_stats().values(), limit)
+    
+    @staticmethod
+    def _slowest(stats: Iterable[PerformanceStats], limit: int) -> List[PerformanceStats]:
+        """Select the stats with the highest average response time."""
+        return heapq.nlargest(limit, stats, key=lambda s: s.average_response_time_ms)
+    
+    @staticmethod
+    def _most_error_prone(stats: Iterable[PerformanceStats], limit: int) -> List[PerformanceStats]:
+        """Select the stats with the highest error rate."""
+        return heapq.nlargest(limit, stats, key=lambda s: s.error_rate)
     
     def record_resource_usage(self) -> ResourceUsage:
         """Record current system resource usage.
@@ -252,10 +354,6 @@ class PerformanceMonitor:
             
             self.resource_history.append(usage)
             
-            # Keep only last 1000 records
-            if len(self.resource_history) > 1000:
-                self.resource_history = self.resource_history[-1000:]
-            
             return usage
         except Exception as e:
             self.logger.error(f"Failed to record resource usage: {e}")
@@ -271,7 +369,9 @@ class PerformanceMonitor:
             Dictionary with resource statistics
         """
         cutoff_time = datetime.utcnow() - timedelta(minutes=time_window_minutes)
-        recent_usage = [u for u in self.resource_history if u.timestamp > cutoff_time]
+        # Samples are appended in time order, so walk back from the newest
+        # and stop at the first one outside the window
+        recent_usage = list(takewhile(lambda u: u.timestamp > cutoff_time, reversed(self.resource_history)))
         
         if not recent_usage:
             return {
@@ -301,11 +401,13 @@ class PerformanceMonitor:
         Returns:
             Dictionary with performance report
         """
+        # Endpoint stats are computed and serialized once and shared by every section
         all_stats = self.get_all_stats()
+        endpoint_dicts = {endpoint: stats.to_dict() for endpoint, stats in all_stats.items()}
         resource_stats = self.get_resource_stats()
         
-        total_requests = sum(s.total_requests for s in all_stats.values())
-        total_errors = sum(int(s.total_requests * s.error_rate) for s in all_stats.values())
+        total_requests = len(self.metrics)
+        total_errors = sum(group.error_count for group in self._metrics_by_endpoint.values())
         
         return {
             "summary": {
@@ -314,22 +416,27 @@ class PerformanceMonitor:
                 "overall_error_rate": total_errors / total_requests if total_requests > 0 else 0.0,
                 "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds()
             },
-            "endpoints": {endpoint: stats.to_dict() for endpoint, stats in all_stats.items()},
-            "slowest_endpoints": [s.to_dict() for s in self.get_slowest_endpoints(5)],
-            "error_prone_endpoints": [s.to_dict() for s in self.get_error_prone_endpoints(5)],
+            "endpoints": endpoint_dicts,
+            "slowest_endpoints": [endpoint_dicts[s.endpoint] for s in self._slowest(all_stats.values(), 5)],
+            "error_prone_endpoints": [
+                endpoint_dicts[s.endpoint] for s in self._most_error_prone(all_stats.values(), 5)
+            ],
             "resources": resource_stats
         }
     
     def reset(self) -> None:
         """Reset all performance metrics."""
-        self.metrics = []
-        self.resource_history = []
+        self.metrics.clear()
+        self._metrics_by_endpoint.clear()
+        self.resource_history.clear()
         self.start_time = datetime.utcnow()
         self.logger.info("Performance metrics reset")
 
 
 # Global performance monitor instance
 _performance_monitor: Optional[PerformanceMonitor] = None
+# Only taken on first creation; later calls read the global without locking
+_init_lock = threading.Lock()
 
 
 def get_performance_monitor() -> PerformanceMonitor:
@@ -339,9 +446,13 @@ def get_performance_monitor() -> PerformanceMonitor:
         PerformanceMonitor instance
     """
     global _performance_monitor
-    if _performance_monitor is None:
-        _performance_monitor = PerformanceMonitor()
-    return _performance_monitor
+    monitor = _performance_monitor
+    if monitor is not None:
+        return monitor
+    with _init_lock:
+        if _performance_monitor is None:
+            _performance_monitor = PerformanceMonitor()
+        return _performance_monitor
 
 
 def setup_performance_monitoring() -> PerformanceMonitor:
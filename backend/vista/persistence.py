@@ -4,12 +4,99 @@ import os
 import shutil
 import json
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# fcntl is unavailable on Windows, where copies always go through shutil
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Linux ioctl sharing a file's extents with another (copy-on-write clone)
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """Copy a file as a copy-on-write clone when the filesystem supports it.
+    
+    On btrfs, XFS and other reflink-capable filesystems the clone only
+    copies metadata; later writes to either file do not affect the other.
+    Anywhere else this falls back to shutil.copy2.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        
+    Returns:
+        Destination path
+    """
+    if HAS_FCNTL and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _is_empty_dir(path: Path) -> bool:
+    """Whether a directory has no entries.
+    
+    Path.iterdir lists every name up front, while scandir stops after the
+    first directory entry is read.
+    """
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def _copy_tree(src: Path, dst: Path) -> int:
+    """Copy a directory tree, copying its files concurrently.
+    
+    Directories are created up front, then files are cloned or copied on a
+    thread pool, so per-file open/read/write latency overlaps. Directory
+    permissions and times are copied last, as shutil.copytree does.
+    Symlinks to files and directories are followed and their contents
+    copied, also as shutil.copytree does by default.
+    
+    Args:
+        src: Source directory
+        dst: Destination directory; must not exist
+        
+    Returns:
+        Number of files copied
+        
+    Raises:
+        OSError: If any directory or file cannot be copied
+    """
+    directories: List[Tuple[str, str]] = []
+    files: List[Tuple[str, str]] = []
+    for root, dir_names, file_names in os.walk(src, followlinks=True):
+        target = os.path.normpath(os.path.join(dst, os.path.relpath(root, src)))
+        os.makedirs(target)
+        directories.append((root, target))
+        files.extend(
+            (os.path.join(root, name), os.path.join(target, name)) for name in file_names
+        )
+    
+    with ThreadPoolExecutor(thread_name_prefix="copy") as executor:
+        # Consume the results so the first failed copy is raised
+        for _ in executor.map(lambda pair: _clone_or_copy(*pair), files):
+            pass
+    
+    for source_dir, target_dir in directories:
+        shutil.copystat(source_dir, target_dir)
+    
+    return len(files)
+
 
 class PersistenceManager:
     """Manages vector database persistence, backups, and recovery."""
@@ -98,10 +185,7 @@ class PersistenceManager:
                 logger.debug(f"Removed existing backup at {backup_path}")
             
             # Copy entire persistence directory
-            shutil.copytree(self.persist_directory, backup_path)
-            
-            # Count files in backup
-            file_count = sum(1 for _ in backup_path.rglob("*") if _.is_file())
+            file_count = _copy_tree(self.persist_directory, backup_path)
             
             # Create metadata
             metadata = {
@@ -151,17 +235,14 @@ class PersistenceManager:
             # Backup current database if it exists
             if self.persist_directory.exists():
                 temp_backup = self.persist_directory.parent / f"{self.persist_directory.name}_temp_backup"
-                shutil.copytree(self.persist_directory, temp_backup)
+                _copy_tree(self.persist_directory, temp_backup)
                 logger.debug(f"Created temporary backup of current database at {temp_backup}")
                 
                 # Remove current database
                 shutil.rmtree(self.persist_directory)
             
             # Restore from backup
-            shutil.copytree(backup_path, self.persist_directory)
-            
-            # Count files in restored database
-            file_count = sum(1 for _ in self.persist_directory.rglob("*") if _.is_file())
+            file_count = _copy_tree(backup_path, self.persist_directory)
             
             # Create metadata
             metadata = {
@@ -194,14 +275,8 @@ class PersistenceManager:
         if not backup_path.is_dir():
             raise ValueError(f"Backup is not a directory: {backup_path}")
         
-        # Check for required ChromaDB files
-        required_files = ["chroma.sqlite3"]
-        found_files = [f.name for f in backup_path.iterdir() if f.is_file()]
-        
-        # At least one required file should exist
-        has_required = any(req in found_files for req in required_files)
-        
-        if not has_required and not any(backup_path.iterdir()):
+        # A backup holding chroma.sqlite3 or any other entry is accepted
+        if _is_empty_dir(backup_path):
             raise ValueError(f"Backup appears to be empty: {backup_path}")
         
         logger.debug(f"Backup integrity verified: {backup_path}")
@@ -217,14 +292,8 @@ class PersistenceManager:
                 logger.warning(f"Database directory does not exist: {self.persist_directory}")
                 return False
             
-            # Check for required ChromaDB files
-            required_files = ["chroma.sqlite3"]
-            found_files = [f.name for f in self.persist_directory.iterdir() if f.is_file()]
-            
-            # At least one required file should exist
-            has_required = any(req in found_files for req in required_files)
-            
-            if not has_required and not any(self.persist_directory.iterdir()):
+            # A database holding chroma.sqlite3 or any other entry is accepted
+            if _is_empty_dir(self.persist_directory):
                 logger.warning(f"Database directory appears to be empty: {self.persist_directory}")
                 return False
             
@@ -262,7 +331,7 @@ class PersistenceManager:
                 backup_dir = self.persist_directory.parent / f"{self.persist_directory.name}_pre_rebuild_backup"
                 if backup_dir.exists():
                     shutil.rmtree(backup_dir)
-                shutil.copytree(self.persist_directory, backup_dir)
+                _copy_tree(self.persist_directory, backup_dir)
                 logger.info(f"Created pre-rebuild backup at {backup_dir}")
                 
                 # Remove current database
@@ -44,12 +44,25 @@ class QueryEngine:
     # Public API
     # ------------------------------------------------------------------
 
+    def warmup(self) -> None:
+        """Exercise the retrieval path so the first real query is not cold.
+
+        Starts the embedding batch worker and opens the vector store
+        connection. Failures are logged and ignored.
+        """
+        try:
+            self.embedding_gen.generate_embedding("warmup")
+            self.vector_store.get_collection_count()
+            logger.info("Query engine warmed up")
+        except Exception as e:
+            logger.warning(f"Query engine warmup failed: {e}")
+
     def query(self, question: str, n_results: int = 5) -> QueryResponse:
-        logger.info(f"Processing query: {question[:100]}...")
+        logger.info("Processing query: %s...", question[:100])
 
         try:
             intent = self._detect_intent(question)
-            logger.debug(f"Detected intent: {intent.value}")
+            logger.debug("Detected intent: %s", intent.value)
 
             # -------------------------------
             # Non-RAG paths
@@ -2,7 +2,39 @@
 
 import logging
 import re
-from typing import List, Optional
+from typing import List, Optional, Pattern, Tuple
+
+# Redactions applied to error and log messages, in order, compiled once
+_REDACTIONS: Tuple[Tuple[Pattern[str], str], ...] = (
+    # API keys (OpenAI format: sk-...)
+    (re.compile(r'sk-[A-Za-z0-9_-]{20,}'), '[REDACTED_OPENAI_KEY]'),
+    # Gemini API keys (AIza...)
+    (re.compile(r'AIza[A-Za-z0-9_-]{30,}'), '[REDACTED_GEMINI_KEY]'),
+    # Generic tokens/secrets (common patterns)
+    (re.compile(r'(token|secret|password|api_key|apikey)[\s]*[:=][\s]*[^\s,}]+', re.IGNORECASE),
+     r'\1=[REDACTED]'),
+    # Bearer tokens
+    (re.compile(r'Bearer\s+[A-Za-z0-9._-]+'), 'Bearer [REDACTED]'),
+    # Authorization headers
+    (re.compile(r'Authorization[\s]*[:=][\s]*[^\s,}]+', re.IGNORECASE), 'Authorization: [REDACTED]'),
+    # URLs with credentials (user:pass@host)
+    (re.compile(r'([a-z]+://)[^:]+:[^@]+@', re.IGNORECASE), r'\1[REDACTED]@'),
+)
+
+
+# Matches wherever any redaction could apply; it must contain a literal
+# required by each pattern above. Messages without a match skip the passes.
+_REDACTION_CANDIDATE = re.compile(r'sk-|AIza|token|secret|password|api_?key|Bearer|Authorization|://',
+                                  re.IGNORECASE)
+
+
+def _redact(text: str) -> str:
+    """Apply every redaction to a message."""
+    if not _REDACTION_CANDIDATE.search(text):
+        return text
+    for pattern, replacement in _REDACTIONS:
+        text = pattern.sub(replacement, text)
+    return text
 
 
 class SecurityManager:
@@ -15,6 +47,8 @@ class SecurityManager:
             allowed_origins: List of allowed origins for CORS
         """
         self.allowed_origins = allowed_origins
+        # Hashed copy for the per-request membership check
+        self._allowed_origin_set = frozenset(allowed_origins)
         self.logger = logging.getLogger(__name__)
     
     def validate_origin(self, origin: Optional[str]) -> bool:
@@ -30,7 +64,7 @@ class SecurityManager:
             return False
         
         # Check if origin is in whitelist
-        is_allowed = origin in self.allowed_origins
+        is_allowed = origin in self._allowed_origin_set
         
         if not is_allowed:
             self.log_security_event(
@@ -51,29 +85,7 @@ class SecurityManager:
         Returns:
             Sanitized error message safe for client exposure
         """
-        error_str = str(error)
-        
-        # Remove API keys (OpenAI format: sk-...)
-        error_str = re.sub(r'sk-[A-Za-z0-9_-]{20,}', '[REDACTED_OPENAI_KEY]', error_str)
-        
-        # Remove Gemini API keys (AIza...)
-        error_str = re.sub(r'AIza[A-Za-z0-9_-]{30,}', '[REDACTED_GEMINI_KEY]', error_str)
-        
-        # Remove generic tokens/secrets (common patterns)
-        error_str = re.sub(r'(token|secret|password|api_key|apikey)[\s]*[:=][\s]*[^\s,}]+', 
-                          r'\1=[REDACTED]', error_str, flags=re.IGNORECASE)
-        
-        # Remove bearer tokens
-        error_str = re.sub(r'Bearer\s+[A-Za-z0-9._-]+', 'Bearer [REDACTED]', error_str)
-        
-        # Remove authorization headers
-        error_str = re.sub(r'Authorization[\s]*[:=][\s]*[^\s,}]+', 
-                          'Authorization: [REDACTED]', error_str, flags=re.IGNORECASE)
-        
-        # Remove URLs with credentials (user:pass@host)
-        error_str = re.sub(r'([a-z]+://)[^:]+:[^@]+@', r'\1[REDACTED]@', error_str, flags=re.IGNORECASE)
-        
-        return error_str
+        return _redact(str(error))
     
     def sanitize_log_message(self, message: str) -> str:
         """Remove sensitive data from log messages.
@@ -84,7 +96,7 @@ class SecurityManager:
         Returns:
             Sanitized log message
         """
-        return self.sanitize_error_message(Exception(message))
+        return _redact(message)
     
     def log_security_event(self, event_type: str, details: dict) -> None:
         """Log security-relevant events.
@@ -0,0 +1,324 @@
+"""Semantic query cache for the Vista."""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from vista.models import RetrievedChunk, intern_metadata
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Rows of the centroid matrix upcast to float32 at a time during lookup
+SIMILARITY_CHUNK_ROWS = 256
+
+# Files making up a persisted cache directory
+SNAPSHOT_FILENAME = "cache.npz"
+LOCK_FILENAME = ".lock"
+
+
+class SemanticCache:
+    """Caches vector store results keyed by query embedding similarity.
+
+    Similar query embeddings are clustered into centroids, so the cache keeps
+    one entry per cluster instead of one per distinct query. Memory and lookup
+    cost are bounded by ``max_centroids``; once full, the least recently
+    used centroid is evicted, so new queries are always admitted.
+
+    Centroids are stored as float16 to halve memory and bandwidth; similarities
+    are accumulated in float32.
+
+    All embeddings in the cache are unit-norm: callers must pass normalized
+    embeddings (as produced by EmbeddingGenerator), and merged centroids are
+    renormalized, so ``centroids @ query`` is the cosine similarity.
+
+    When ``persist_path`` is set, the cache is loaded from a snapshot on
+    first use and written back as a whole snapshot on flush, so it survives
+    restarts. Each instance only ever works on its own in-memory copy:
+    processes sharing a path never see each other's slots, and the last
+    flush wins. Snapshots are written to a temporary file and renamed into
+    place under a file lock, so a reader never sees a partial snapshot.
+    """
+
+    def __init__(self, max_centroids: int = 1024, hit_threshold: float = 0.95,
+                 merge_threshold: float = 0.86, persist_path: Optional[str] = None,
+                 flush_every: int = 16):
+        """Initialize an empty cache.
+
+        Args:
+            max_centroids: Maximum number of centroids kept in memory
+            hit_threshold: Minimum cosine similarity for a lookup to hit
+            merge_threshold: Minimum cosine similarity for an inserted
+                embedding to be merged into an existing centroid
+            persist_path: Optional directory used to persist the cache
+            flush_every: Number of inserts between writes to disk
+
+        Raises:
+            ValueError: If the size or thresholds are invalid
+        """
+        if max_centroids <= 0:
+            raise ValueError("max_centroids must be positive")
+        if not 0.0 < merge_threshold <= hit_threshold <= 1.0:
+            raise ValueError("Thresholds must satisfy 0 < merge_threshold <= hit_threshold <= 1")
+
+        self.max_centroids = max_centroids
+        self.hit_threshold = hit_threshold
+        self.merge_threshold = merge_threshold
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.flush_every = max(1, flush_every)
+
+        # Centroid matrix is allocated on first insert, once the dimension is known
+        self._centroids: Optional[np.ndarray] = None
+        self._counts = np.zeros(max_centroids, dtype=np.int64)
+        # Tick of each centroid's last hit or insert, driving LRU eviction
+        self._last_used = np.zeros(max_centroids, dtype=np.int64)
+        self._tick = 0
+        self._n_results = [0] * max_centroids
+        self._responses: List[Optional[List[RetrievedChunk]]] = [None] * max_centroids
+        self._size = 0
+        self._lock = threading.Lock()
+
+        # Inserts not yet written to the snapshot
+        self._unflushed = 0
+        self._loaded = self.persist_path is None
+        if self.persist_path is not None:
+            atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        """Return the number of centroids currently cached."""
+        return self._size
+
+    def lookup(self, embedding: Sequence[float], n_results: int) -> Optional[List[RetrievedChunk]]:
+        """Return cached results for an embedding, if a close centroid exists.
+
+        Args:
+            embedding: Unit-norm query embedding vector
+            n_results: Number of results requested
+
+        Returns:
+            Cached results truncated to ``n_results``, or None on a miss
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            self._ensure_loaded(query.shape[0])
+            best, similarity = self._nearest(query)
+            if best < 0 or similarity < self.hit_threshold:
+                return None
+            if self._n_results[best] < n_results:
+                return None
+
+            self._last_used[best] = self._next_tick()
+            return list(self._responses[best][:n_results])
+
+    def insert(self, embedding: Sequence[float], n_results: int,
+               results: List[RetrievedChunk]) -> None:
+        """Insert query results, merging into the nearest centroid when close.
+
+        Args:
+            embedding: Unit-norm query embedding vector
+            n_results: Number of results that were requested
+            results: Results returned by the vector store
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            self._ensure_loaded(query.shape[0])
+            if self._centroids is None:
+                self._allocate(query.shape[0])
+
+            best, similarity = self._nearest(query)
+
+            if best >= 0 and similarity >= self.merge_threshold:
+                # Running mean of all embeddings merged into this centroid
+                count = self._counts[best]
+                centroid = (self._centroids[best].astype(np.float32) * count + query) / (count + 1)
+                self._centroids[best] = self._normalize(centroid)
+                self._counts[best] = count + 1
+                self._last_used[best] = self._next_tick()
+                slot = best
+            else:
+                if self._size < self.max_centroids:
+                    slot = self._size
+                    self._size += 1
+                else:
+                    slot = int(np.argmin(self._last_used[:self._size]))
+                    logger.debug("Evicting semantic cache centroid %d", slot)
+                self._centroids[slot] = query
+                self._counts[slot] = 1
+                self._last_used[slot] = self._next_tick()
+
+            self._n_results[slot] = n_results
+            self._responses[slot] = list(results)
+
+            if self.persist_path is not None:
+                self._unflushed += 1
+                if self._unflushed >= self.flush_every:
+                    self._flush_locked()
+
+    def clear(self) -> None:
+        """Drop all cached centroids and results."""
+        with self._lock:
+            self._reset()
+            self._unflushed = 0
+            if self.persist_path is not None and self.persist_path.exists():
+                with self._file_lock():
+                    (self.persist_path / SNAPSHOT_FILENAME).unlink(missing_ok=True)
+
+    def flush(self) -> None:
+        """Write the cache snapshot to disk, if persistence is enabled."""
+        with self._lock:
+            self._flush_locked()
+
+    def _nearest(self, query: np.ndarray) -> tuple:
+        """Find the centroid most similar to a normalized query.
+
+        Returns:
+            Tuple of (centroid index, cosine similarity), or (-1, -1.0) if empty
+        """
+        if self._size == 0 or self._centroids is None:
+            return -1, -1.0
+
+        # Upcast in fixed-size blocks so the float32 temporary stays small
+        sims = np.empty(self._size, dtype=np.float32)
+        for start in range(0, self._size, SIMILARITY_CHUNK_ROWS):
+            end = min(start + SIMILARITY_CHUNK_ROWS, self._size)
+            sims[start:end] = self._centroids[start:end].astype(np.float32) @ query
+        best = int(np.argmax(sims))
+        return best, float(sims[best])
+
+    def _next_tick(self) -> int:
+        """Advance the use clock; caller must hold ``self._lock``."""
+        self._tick += 1
+        return self._tick
+
+    def _reset(self) -> None:
+        """Reset in-memory bookkeeping to an empty cache."""
+        self._counts[:] = 0
+        self._last_used[:] = 0
+        self._tick = 0
+        self._n_results = [0] * self.max_centroids
+        self._responses = [None] * self.max_centroids
+        self._size = 0
+
+    def _allocate(self, dim: int) -> None:
+        """Allocate the centroid matrix for embeddings of the given dimension."""
+        self._centroids = np.zeros((self.max_centroids, dim), dtype=np.float16)
+
+    def _ensure_loaded(self, dim: int) -> None:
+        """Load the persisted snapshot into memory on first use.
+
+        Args:
+            dim: Dimension of the query embeddings; a snapshot built for
+                another embedding model is ignored
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        snapshot_path = self.persist_path / SNAPSHOT_FILENAME
+        if not snapshot_path.exists():
+            return
+
+        try:
+            # The snapshot is replaced atomically, so no file lock is needed to read it
+            with np.load(snapshot_path, allow_pickle=False) as snapshot:
+                centroids = snapshot["centroids"]
+                counts = snapshot["counts"]
+                last_used = snapshot["last_used"]
+                n_results = snapshot["n_results"]
+                responses = json.loads(str(snapshot["results"]))
+
+            if centroids.shape[0] != self.max_centroids:
+                logger.warning(
+                    f"Ignoring semantic cache at {self.persist_path}: "
+                    f"built for {centroids.shape[0]} centroids, expected {self.max_centroids}"
+                )
+                return
+            if centroids.shape[1] != dim:
+                logger.warning(
+                    f"Ignoring semantic cache at {self.persist_path}: "
+                    f"built for {centroids.shape[1]}-dimensional embeddings, expected {dim}"
+                )
+                return
+
+            size = len(responses)
+            self._centroids = centroids.astype(np.float16, copy=False)
+            self._counts[:size] = counts[:size]
+            self._last_used[:size] = last_used[:size]
+            self._tick = int(last_used[:size].max(initial=0))
+            for slot, results in enumerate(responses):
+                self._n_results[slot] = int(n_results[slot])
+                self._responses[slot] = [
+                    RetrievedChunk(
+                        text=chunk["text"],
+                        metadata=intern_metadata(chunk["metadata"]),
+                        similarity_score=chunk["similarity_score"]
+                    )
+                    for chunk in results
+                ]
+            self._size = size
+
+            logger.info(f"Loaded {size} semantic cache entries from {self.persist_path}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load semantic cache from {self.persist_path}: {e}")
+            self._centroids = None
+            self._reset()
+
+    def _flush_locked(self) -> None:
+        """Write the whole cache as a snapshot; caller must hold ``self._lock``."""
+        if self.persist_path is None or self._centroids is None:
+            return
+
+        responses = [
+            [asdict(chunk) for chunk in self._responses[slot]]
+            for slot in range(self._size)
+        ]
+        self.persist_path.mkdir(parents=True, exist_ok=True)
+        snapshot_path = self.persist_path / SNAPSHOT_FILENAME
+        tmp_path = self.persist_path / f"{SNAPSHOT_FILENAME}.{os.getpid()}.tmp"
+        with self._file_lock():
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    centroids=self._centroids,
+                    counts=self._counts,
+                    last_used=self._last_used,
+                    n_results=np.asarray(self._n_results, dtype=np.int64),
+                    results=np.asarray(json.dumps(responses, default=str))
+                )
+            os.replace(tmp_path, snapshot_path)
+        self._unflushed = 0
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the cache directory across processes."""
+        with open(self.persist_path / LOCK_FILENAME, "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        """Convert an embedding to a unit-norm float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+        return vector
@@ -95,7 +95,7 @@ class TextChunker:
             start = start + advance
             chunk_index += 1
         
-        logger.info(f"Chunked document {document.filename} into {len(chunks)} chunks")
+        logger.info("Chunked document %s into %d chunks", document.filename, len(chunks))
         return chunks
     
     def _split_on_sentences(self, text: str) -> str:
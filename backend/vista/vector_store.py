@@ -1,14 +1,113 @@
 """Vector store management for the Vista."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+import atexit
+import functools
 import logging
 import os
+import sys
+import threading
+import time
+from pathlib import Path
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException, PineconeApiException
 
-from .models import Chunk, RetrievedChunk
+from .local_index import LocalVectorIndex
+from .models import Chunk, RetrievedChunk, intern_metadata
+from .semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Dimension of the default all-MiniLM-L6-v2 embedding model
+DEFAULT_DIMENSION = 384
+
+# Vectors sent per upsert request; chunk text in metadata keeps requests
+# well under Pinecone's 2MB request limit at this size
+DEFAULT_UPSERT_BATCH_SIZE = 200
+
+# Connection pool size for each Pinecone index handle
+INDEX_POOL_THREADS = 30
+
+# Seconds a cached namespace vector count is trusted; other processes may
+# change a shared namespace without invalidating this process's cache file
+DEFAULT_COUNT_CACHE_TTL_S = 60.0
+
+# Index handles shared by every VectorStoreManager in the process
+_index_cache: Dict[Tuple[Pinecone, str], Any] = {}
+_index_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def get_pinecone_client(api_key: str, environment: str) -> Pinecone:
+    """Return a Pinecone client shared by all managers using the same credentials.
+    
+    Reusing the client keeps its HTTPS connection pool alive across managers
+    instead of re-establishing sessions for every instance.
+    
+    Args:
+        api_key: Pinecone API key
+        environment: Pinecone environment
+        
+    Returns:
+        Pinecone client instance
+    """
+    logger.info(f"Connecting to Pinecone with environment: {environment}")
+    return Pinecone(api_key=api_key)
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Scale each row of a 2-D embedding array to unit L2 norm.
+    
+    Args:
+        embeddings: Array with one embedding vector per row
+        
+    Returns:
+        New float32 array of unit-norm rows; all-zero rows stay zero
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.clip(norms, 1e-12, None)
+
+
+def get_pinecone_index(client: Pinecone, index_name: str) -> Any:
+    """Return a shared index handle for the given client and index name.
+    
+    Args:
+        client: Pinecone client owning the index
+        index_name: Name of the index
+        
+    Returns:
+        Pinecone index handle
+    """
+    key = (client, index_name)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = client.Index(index_name, pool_threads=INDEX_POOL_THREADS)
+            _index_cache[key] = index
+        return index
+
+
+def _evict_pinecone_index(client: Pinecone, index_name: str) -> None:
+    """Drop a cached index handle, e.g. after the index was deleted."""
+    with _index_cache_lock:
+        _index_cache.pop((client, index_name), None)
+
+
+@atexit.register
+def _close_pinecone_indexes() -> None:
+    """Close connection pools of all cached index handles."""
+    with _index_cache_lock:
+        for index in _index_cache.values():
+            close = getattr(index, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Failed to close Pinecone index: {e}")
+        _index_cache.clear()
+
 
 class VectorStoreManager:
     """Manages Pinecone vector store for storing and retrieving embeddings.
@@ -17,7 +116,12 @@ class VectorStoreManager:
     """
     
     def __init__(self, api_key: Optional[str] = None, environment: Optional[str] = None, 
-                 index_name: str = "vista-vectors", namespace: str = "default"):
+                 index_name: str = "vista-vectors", namespace: str = "default",
+                 semantic_cache: Optional[SemanticCache] = None,
+                 local_index: Optional[LocalVectorIndex] = None,
+                 dimension: int = DEFAULT_DIMENSION,
+                 count_cache_path: Optional[str] = None,
+                 count_cache_ttl_s: float = DEFAULT_COUNT_CACHE_TTL_S):
         """Initialize Pinecone client with cloud configuration.
         
         Args:
@@ -25,6 +129,15 @@ class VectorStoreManager:
             environment: Pinecone environment (optional, falls back to env var)
             index_name: Name of the index (default: vista-vectors)
             namespace: Namespace for multi-tenancy (default: default)
+            semantic_cache: Optional cache for results of similar queries
+            local_index: Optional in-process index mirroring added vectors,
+                searched before Pinecone
+            dimension: Embedding dimension used when creating the index; must
+                match the embedding model
+            count_cache_path: Optional file caching the namespace vector count,
+                so startup checks skip the index stats call
+            count_cache_ttl_s: Seconds a cached count is trusted before the
+                index stats are queried again
             
         Raises:
             RuntimeError: If Pinecone authentication fails
@@ -34,6 +147,13 @@ class VectorStoreManager:
         self.environment = environment or os.getenv('PINECONE_ENVIRONMENT')
         self.index_name = index_name or os.getenv('PINECONE_INDEX_NAME', 'vista-vectors')
         self.namespace = namespace or os.getenv('PINECONE_NAMESPACE', 'default')
+        self.semantic_cache = semantic_cache
+        self.local_index = local_index
+        self.dimension = dimension
+        self.count_cache_path = Path(count_cache_path) if count_cache_path else None
+        self.count_cache_ttl_s = count_cache_ttl_s
+        # Error of the most recent failed Pinecone call; None once one succeeds
+        self.last_error: Optional[str] = None
         
         self.client = self._initialize_client()
         self.index = None
@@ -46,7 +166,7 @@ class VectorStoreManager:
         logger.info("Initialized Pinecone client")
     
     def _initialize_client(self) -> Pinecone:
-        """Initialize Pinecone client with API credentials.
+        """Get the shared Pinecone client for this manager's credentials.
         
         Returns:
             Pinecone client instance
@@ -66,8 +186,7 @@ class VectorStoreManager:
             )
         
         try:
-            logger.info(f"Connecting to Pinecone with environment: {self.environment}")
-            client = Pinecone(api_key=self.api_key)
+            client = get_pinecone_client(self.api_key, self.environment)
             logger.info("Successfully authenticated with Pinecone")
             return client
         except Exception as e:
@@ -90,15 +209,12 @@ class VectorStoreManager:
              raise ValueError("Index name must be provided either in constructor or create_collection")
 
         try:
-            # Check if index already exists
-            indexes = self.client.list_indexes()
-            index_names = [idx.name for idx in indexes]
-            
-            if self.index_name in index_names:
+            # Describe the one index instead of listing every index in the project
+            if self.client.has_index(self.index_name):
                 logger.info(f"Retrieved existing index: {self.index_name}")
-                self.index = self.client.Index(self.index_name)
+                self.index = get_pinecone_index(self.client, self.index_name)
             else:
-                # Create new index with cosine similarity and dimension 1536 (default for text-embedding-ada-002)
+                # Create new index with dot product similarity and the embedding model's dimension
                 # Note: For free tier users, they might need to use 'gcp-starter' region or similar, 
                 # but 'serverless' with 'aws' is standard for paid.
                 # Use the environment variable for region/cloud if strict control is needed, 
@@ -106,27 +222,22 @@ class VectorStoreManager:
                 # However, ServerlessSpec is good practice.
                 
                 logger.info(f"Creating new index: {self.index_name}")
-                self.client.create_index(
-                    name=self.index_name,
-                    dimension=1536, # TODO: Make this configurable based on embedding model if needed
-                    metric="cosine",
-                    spec=ServerlessSpec(
-                        cloud="aws",
-                        region="us-east-1" # Default to us-east-1 for serverless if not specified
-                    )
-                )
-                logger.info(f"Created new index: {self.index_name}")
-                self.index = self.client.Index(self.index_name)
+                self._create_index()
         except Exception as e:
             logger.error(f"Failed to manage index '{self.index_name}': {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to manage index '{self.index_name}': {str(e)}")
     
-    def add_chunks(self, chunks: List[Chunk], embeddings: List[List[float]]) -> None:
+    def add_chunks(self, chunks: List[Chunk], embeddings: Sequence[Sequence[float]],
+                   batch_size: int = DEFAULT_UPSERT_BATCH_SIZE) -> None:
         """Add chunks with embeddings to Pinecone index.
         
+        Vectors are upserted in fixed-size batches so only one batch of
+        request payloads is held in memory at a time.
+        
         Args:
             chunks: List of chunks to add
-            embeddings: Corresponding embeddings (1536-dimensional for OpenAI)
+            embeddings: Corresponding embeddings, as a 2-D array or list of vectors
+            batch_size: Number of vectors per upsert request
             
         Raises:
             RuntimeError: If index not initialized
@@ -142,39 +253,79 @@ class VectorStoreManager:
             logger.warning("No chunks to add")
             return
         
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        
+        # Convert lists of vectors once into a contiguous float32 array, so each
+        # batch slice below is a view rather than a list of boxed floats, and
+        # normalize it once for the dot product index metric
+        if not isinstance(embeddings, np.ndarray):
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+        embeddings = normalize_rows(embeddings)
+        
         try:
-            # Prepare vectors for Pinecone
-            vectors_to_upsert = []
-            
-            for i, chunk in enumerate(chunks):
-                # Create unique ID combining document_id and chunk_index
-                vector_id = f"{chunk.document_id}_{chunk.chunk_index}"
+            total = len(chunks)
+            for start in range(0, total, batch_size):
+                end = min(start + batch_size, total)
                 
-                # Prepare metadata
-                metadata = chunk.metadata.copy()
-                metadata["document_id"] = chunk.document_id
-                metadata["chunk_index"] = str(chunk.chunk_index)
-                metadata["text"] = chunk.text
+                # Prepare vectors for Pinecone, one batch at a time. The ID combines
+                # document_id and chunk_index; metadata is built in a single dict
+                # literal and document_id, repeated across a document's chunks, is
+                # interned. Plain dicts skip per-vector SDK object validation, and
+                # array rows are passed through for the client to convert on upload.
+                vectors_to_upsert = [
+                    {
+                        "id": f"{chunk.document_id}_{chunk.chunk_index}",
+                        "values": embeddings[i],
+                        "metadata": {
+                            **chunk.metadata,
+                            "document_id": sys.intern(chunk.document_id),
+                            "chunk_index": str(chunk.chunk_index),
+                            "text": chunk.text
+                        }
+                    }
+                    for i, chunk in enumerate(chunks[start:end], start)
+                ]
                 
-                # Create vector tuple (id, values, metadata)
-                vectors_to_upsert.append((
-                    vector_id,
-                    embeddings[i],
-                    metadata
-                ))
+                self.index.upsert(
+                    vectors=vectors_to_upsert,
+                    namespace=self.namespace
+                )
+                
+                if self.local_index is not None:
+                    self.local_index.add(
+                        [vector["id"] for vector in vectors_to_upsert],
+                        embeddings[start:end],
+                        [vector["metadata"] for vector in vectors_to_upsert]
+                    )
+                
+                logger.info("Upserted %d/%d vectors", end, total)
             
-            # Batch upsert to Pinecone
-            self.index.upsert(
-                vectors=vectors_to_upsert,
-                namespace=self.namespace
-            )
+            # The cached count is stale; the next count call refreshes it
+            self._invalidate_cached_count()
+            self.last_error = None
             
-            logger.info(f"Added {len(chunks)} vectors to index")
+            logger.info("Added %d vectors to index", total)
         except Exception as e:
+            self.last_error = str(e)
             logger.error(f"Failed to add chunks: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to add chunks: {str(e)}")
     
-    def query(self, query_embedding: List[float], n_results: int = 5) -> List[RetrievedChunk]:
+    def flush(self) -> None:
+        """Persist local state after a series of add_chunks calls.
+        
+        add_chunks leaves the semantic cache and the local index file alone,
+        so an ingest of many windows pays for them once; call this when the
+        ingest is done.
+        """
+        # Cached results may no longer reflect the index contents
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+        
+        if self.local_index is not None:
+            self.local_index.save()
+    
+    def query(self, query_embedding: Sequence[float], n_results: int = 5) -> List[RetrievedChunk]:
         """Query Pinecone index for similar chunks.
         
         Args:
@@ -190,42 +341,150 @@ class VectorStoreManager:
         if self.index is None:
             raise RuntimeError("Collection not initialized. Call create_collection() first.")
         
+        cached_chunks = self._lookup_local(query_embedding, n_results)
+        if cached_chunks is not None:
+            return cached_chunks
+        
         try:
-            # Query the index
             results = self.index.query(
-                vector=query_embedding,
+                vector=self._to_vector(query_embedding),
                 top_k=n_results,
                 namespace=self.namespace,
                 include_metadata=True
             )
+            retrieved_chunks = self._to_retrieved_chunks(results)
+            self.last_error = None
             
-            # Convert results to RetrievedChunk objects
-            retrieved_chunks = []
+            logger.info("Retrieved %d vectors from query", len(retrieved_chunks))
             
-            for match in results.matches:
-                metadata = match.metadata.copy() if match.metadata else {}
-                
-                # Extract text from metadata (stored during add_chunks)
-                text = metadata.pop("text", "")
-                
-                # Pinecone score is already in 0-1 range for cosine similarity
-                similarity_score = match.score
-                
-                retrieved_chunk = RetrievedChunk(
-                    text=text,
-                    metadata=metadata,
-                    similarity_score=similarity_score
-                )
-                retrieved_chunks.append(retrieved_chunk)
+            if self.semantic_cache is not None:
+                self.semantic_cache.insert(query_embedding, n_results, retrieved_chunks)
             
-            logger.info(f"Retrieved {len(retrieved_chunks)} vectors from query")
             return retrieved_chunks
         except Exception as e:
+            self.last_error = str(e)
             logger.error(f"Query failed: {str(e)}", exc_info=True)
             raise RuntimeError(f"Query failed: {str(e)}")
     
-    def reset_collection(self) -> None:
-        """Delete and recreate Pinecone index.
+    def batch_query(self, query_embeddings: Sequence[Sequence[float]],
+                    n_results: int = 5) -> List[List[RetrievedChunk]]:
+        """Query Pinecone index for several embeddings at once.
+        
+        Each embedding is first checked against the local caches; the
+        remaining queries are issued concurrently on the index's connection
+        pool instead of one round trip after another.
+        
+        Args:
+            query_embeddings: Query embedding vectors, as a 2-D array or list of vectors
+            n_results: Number of results to return per query
+            
+        Returns:
+            One list of RetrievedChunk objects per query embedding, in order
+            
+        Raises:
+            RuntimeError: If index not initialized or a query fails
+        """
+        if self.index is None:
+            raise RuntimeError("Collection not initialized. Call create_collection() first.")
+        
+        all_chunks: List[Optional[List[RetrievedChunk]]] = [
+            self._lookup_local(embedding, n_results) for embedding in query_embeddings
+        ]
+        
+        try:
+            pending = [
+                (i, self.index.query(
+                    vector=self._to_vector(query_embeddings[i]),
+                    top_k=n_results,
+                    namespace=self.namespace,
+                    include_metadata=True,
+                    async_req=True
+                ))
+                for i, chunks in enumerate(all_chunks)
+                if chunks is None
+            ]
+            
+            for i, request in pending:
+                all_chunks[i] = self._to_retrieved_chunks(request.get())
+                if self.semantic_cache is not None:
+                    self.semantic_cache.insert(query_embeddings[i], n_results, all_chunks[i])
+            if pending:
+                self.last_error = None
+            
+            logger.info("Retrieved results for %d queries, %d from Pinecone", len(all_chunks), len(pending))
+            return all_chunks
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Batch query failed: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Batch query failed: {str(e)}")
+    
+    def _lookup_local(self, query_embedding: Sequence[float], n_results: int) -> Optional[List[RetrievedChunk]]:
+        """Answer a query from the semantic cache or local index, if possible.
+        
+        Args:
+            query_embedding: Query embedding vector
+            n_results: Number of results to return
+            
+        Returns:
+            Cached or locally retrieved chunks, or None if Pinecone must be queried
+        """
+        if self.semantic_cache is not None:
+            cached_chunks = self.semantic_cache.lookup(query_embedding, n_results)
+            if cached_chunks is not None:
+                logger.info("Semantic cache hit, returning %d cached vectors", len(cached_chunks))
+                return cached_chunks
+        
+        if self.local_index is not None:
+            local_chunks = self.local_index.search(query_embedding, n_results)
+            if local_chunks is not None:
+                logger.info("Local index hit, returning %d vectors", len(local_chunks))
+                if self.semantic_cache is not None:
+                    self.semantic_cache.insert(query_embedding, n_results, local_chunks)
+                return local_chunks
+        
+        return None
+    
+    @staticmethod
+    def _to_vector(query_embedding: Sequence[float]) -> List[float]:
+        """Convert a query embedding to the unit-norm list the query API expects."""
+        # A single query vector is cheap to normalize and convert
+        vector = np.asarray(query_embedding, dtype=np.float32)
+        return normalize_rows(vector.reshape(1, -1))[0].tolist()
+    
+    @staticmethod
+    def _to_retrieved_chunks(results: Any) -> List[RetrievedChunk]:
+        """Convert a Pinecone query response to RetrievedChunk objects.
+        
+        Args:
+            results: Pinecone query response
+            
+        Returns:
+            List of RetrievedChunk objects with similarity scores
+        """
+        # The text stored in metadata during add_chunks is popped from a copy
+        # of the metadata, and the decoded keys and values are interned since
+        # results may be kept in the semantic cache. Vectors are unit-norm, so
+        # the dot product score is already the cosine similarity
+        retrieved_chunks = []
+        for match in results.matches:
+            metadata = dict(match.metadata or {})
+            text = metadata.pop("text", "")
+            retrieved_chunks.append(RetrievedChunk(
+                text=text,
+                metadata=intern_metadata(metadata),
+                similarity_score=match.score
+            ))
+        return retrieved_chunks
+    
+    def reset_collection(self, hard: bool = False) -> None:
+        """Remove all vectors from the index.
+        
+        By default only the vectors in this manager's namespace are deleted,
+        which keeps the index online. A hard reset deletes and recreates the
+        whole index; it is also used when no index is connected yet.
+        
+        Args:
+            hard: Whether to delete and recreate the index
         
         Raises:
             RuntimeError: If index operations fail
@@ -234,47 +493,161 @@ class VectorStoreManager:
             logger.warning("No index to reset")
             return
         
+        if not hard and self.index is not None:
+            self._clear_namespace()
+            return
+        
         try:
-            # Delete the existing index
+            # Delete the existing index; a missing index needs no deleting
             logger.info(f"Deleting index: {self.index_name}")
-            self.client.delete_index(self.index_name)
-            logger.info(f"Deleted index: {self.index_name}")
+            try:
+                self.client.delete_index(self.index_name)
+                logger.info(f"Deleted index: {self.index_name}")
+            except NotFoundException:
+                logger.info(f"Index {self.index_name} does not exist, nothing to delete")
+            _evict_pinecone_index(self.client, self.index_name)
+            
+            self._clear_caches()
             
             # Recreate the index
             logger.info(f"Recreating index: {self.index_name}")
+            self._create_index()
+        except Exception as e:
+            logger.error(f"Failed to reset collection: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to reset collection: {str(e)}")
+    
+    def _create_index(self) -> None:
+        """Create the index and connect to it.
+        
+        An index created concurrently by another process is reused.
+        
+        Raises:
+            PineconeApiException: If index creation fails
+        """
+        try:
             self.client.create_index(
                 name=self.index_name,
-                dimension=384,
-                metric="cosine",
+                dimension=self.dimension,
+                # Vectors are normalized before upsert and query, so dot product
+                # ranks like cosine without the per-comparison norm division
+                metric="dotproduct",
                 spec=ServerlessSpec(
                     cloud="aws",
-                    region="us-east-1"
+                    region="us-east-1" # Default to us-east-1 for serverless if not specified
                 )
             )
-            logger.info(f"Recreated index: {self.index_name}")
-            self.index = self.client.Index(self.index_name)
+            logger.info(f"Created index: {self.index_name}")
+        except PineconeApiException as e:
+            # Another process created the index between the check and the create
+            if e.status != 409:
+                raise
+            logger.info(f"Index {self.index_name} was created concurrently, using it")
+        self.index = get_pinecone_index(self.client, self.index_name)
+    
+    def _clear_namespace(self) -> None:
+        """Delete all vectors in the current namespace.
+        
+        Raises:
+            RuntimeError: If the delete call fails
+        """
+        try:
+            logger.info(f"Clearing namespace '{self.namespace}' in index: {self.index_name}")
+            self.index.delete(delete_all=True, namespace=self.namespace)
+        except NotFoundException:
+            # Namespace has no vectors yet, so there is nothing to clear
+            logger.info(f"Namespace '{self.namespace}' is already empty")
         except Exception as e:
             logger.error(f"Failed to reset collection: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to reset collection: {str(e)}")
+        
+        self._clear_caches()
     
-    def get_collection_count(self) -> int:
+    def _clear_caches(self) -> None:
+        """Drop locally cached results and vectors after the index was emptied."""
+        self._invalidate_cached_count()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+        if self.local_index is not None:
+            self.local_index.clear()
+            self.local_index.save()
+    
+    def get_collection_count(self, use_cache: bool = True) -> int:
         """Get number of vectors in current index.
         
+        Args:
+            use_cache: Whether a fresh cached count may be returned instead of
+                querying the index stats; health probes pass False
+        
         Returns:
             Number of vectors in the index
         """
         if self.index is None:
             return 0
         
+        if use_cache:
+            cached_count = self._read_cached_count()
+            if cached_count is not None:
+                return cached_count
+        
         try:
             # Get index statistics
             stats = self.index.describe_index_stats()
             
             # Get count from namespace
             if self.namespace in stats.namespaces:
-                return stats.namespaces[self.namespace].vector_count
+                count = stats.namespaces[self.namespace].vector_count
             else:
-                return 0
+                count = 0
+            self.last_error = None
         except Exception as e:
+            self.last_error = str(e)
             logger.error(f"Failed to get collection count: {str(e)}", exc_info=True)
             return 0
+        
+        # Index stats are eventually consistent, so an empty count right after
+        # an upsert is not cached and is rechecked on the next call
+        if count > 0:
+            self._write_cached_count(count)
+        return count
+    
+    def _count_cache_key(self) -> str:
+        """Identify the index and namespace a cached count belongs to."""
+        return f"{self.index_name}/{self.namespace}"
+    
+    def _read_cached_count(self) -> Optional[int]:
+        """Read the cached vector count for this index and namespace, if fresh."""
+        if self.count_cache_path is None:
+            return None
+        
+        try:
+            key, count, written_at = self.count_cache_path.read_text(encoding="utf-8").split("\n")
+            if key != self._count_cache_key():
+                return None
+            if time.time() - float(written_at) >= self.count_cache_ttl_s:
+                return None
+            return int(count)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cached_count(self, count: int) -> None:
+        """Cache the vector count for this index and namespace."""
+        if self.count_cache_path is None:
+            return
+        
+        try:
+            self.count_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.count_cache_path.write_text(
+                f"{self._count_cache_key()}\n{count}\n{time.time()}", encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"Failed to cache collection count: {e}")
+    
+    def _invalidate_cached_count(self) -> None:
+        """Remove the cached vector count after the index contents changed."""
+        if self.count_cache_path is None:
+            return
+        
+        try:
+            self.count_cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove cached collection count: {e}")
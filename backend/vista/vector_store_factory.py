@@ -0,0 +1,63 @@
+"""Factory for creating the configured vector store."""
+
+import logging
+from typing import Union
+
+from vista.config import Config
+from vista.faiss_store import FaissVectorStoreManager
+from vista.local_index import LocalVectorIndex
+from vista.semantic_cache import SemanticCache
+from vista.vector_store import VectorStoreManager
+
+logger = logging.getLogger(__name__)
+
+
+def build_vector_store(config: Config, dimension: int) -> Union[VectorStoreManager, FaissVectorStoreManager]:
+    """Create the vector store selected by the configuration.
+
+    Pinecone stores get the semantic cache, local index and count cache the
+    configuration enables. Every entry point shares them, so a reset or
+    ingest from one process invalidates the state the others read. The
+    collection is not opened; call create_collection() on the result.
+
+    Args:
+        config: Application configuration
+        dimension: Dimension of the embedding model's vectors
+
+    Returns:
+        Unopened FaissVectorStoreManager or VectorStoreManager
+    """
+    if config.vector_store_backend == "faiss":
+        logger.info("Using FAISS vector store")
+        return FaissVectorStoreManager(
+            index_path=config.faiss_index_path,
+            index_name=config.pinecone_index_name,
+            dimension=dimension,
+            precision=config.embedding_precision
+        )
+
+    semantic_cache = (
+        SemanticCache(
+            max_centroids=config.semantic_cache_size,
+            persist_path=config.semantic_cache_path
+        )
+        if config.semantic_cache_size > 0 else None
+    )
+    local_index = (
+        LocalVectorIndex(
+            dimension=dimension,
+            persist_path=config.local_index_path,
+            precision=config.embedding_precision
+        )
+        if config.local_index_enabled else None
+    )
+    return VectorStoreManager(
+        api_key=config.pinecone_api_key,
+        environment=config.pinecone_environment,
+        index_name=config.pinecone_index_name,
+        namespace=config.pinecone_namespace,
+        semantic_cache=semantic_cache,
+        local_index=local_index,
+        dimension=dimension,
+        count_cache_path=config.vector_count_cache_path
+    )